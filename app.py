@@ -1,7 +1,38 @@
+import importlib
 import streamlit as st
 import pandas as pd
 
-from ui import data_analysis, 가격예측, 홈
+from ui.async_loader import warm, default_sources
+
+# 메뉴 이름 -> (페이지 모듈, 실행 함수, 페이지가 처음 열릴 때 미리 불러올 소스)
+# 페이지 모듈과 무거운 의존성(yfinance, plotly, joblib, statsmodels 등)은 해당 메뉴를 처음 선택할 때만 import
+PAGES = {
+    "🏠 홈": ("ui.홈", "run_home", ["GLD"]),
+    "📊 데이터분석": ("ui.data_analysis", "run_eda", ["GC=F"]),
+    "📈 가격예측": ("ui.가격예측", "run_ml", ["arima", "fx", "GC=F/series"]),
+    "🔗 자산 비교": ("ui.자산비교", "run_compare", ["assets"]),
+}
+# 메뉴에 표시하지 않는 페이지 (?page=<키> 로 접근)
+HIDDEN_PAGES = {
+    "diagnostics": ("ui.진단", "run_diagnostics", []),
+}
+
+
+@st.cache_resource(show_spinner="📡 데이터를 불러오는 중...")  # 페이지마다 프로세스당 한 번만 실행
+def prefetch(page):
+    # 페이지가 처음 열릴 때 그 페이지의 업스트림 요청(가격, 모델, 환율)을 동시에 실행해 각 캐시를 채움
+    # (cache_resource는 반환값을 계속 보관하므로 불러온 객체 대신 걸린 시간/오류만 반환)
+    sources = default_sources()
+    names = (PAGES.get(page) or HIDDEN_PAGES[page])[2]
+    return warm({name: sources[name] for name in names}) if names else {}
+
+
+def run_page(page):
+    module_name, func_name, _ = PAGES.get(page) or HIDDEN_PAGES[page]
+    prefetch(page)
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)()
+
 
 # CSS를 사용하여 개별 요소 스타일링
 st.markdown(
@@ -53,20 +84,10 @@ def main():
     <h1 style='text-align: center; margin-left: 40px;'>💰 금 가격 예측 App</h1>
 """, unsafe_allow_html=True)
 
-    menu = {
-        "🏠 홈": "홈",
-        "📊 데이터분석": "데이터분석",
-        "📈 가격예측": "가격예측"
-    }
-    
-    choice = st.sidebar.selectbox("📌 메뉴 선택", list(menu.keys()))
-
-    if choice == "🏠 홈":
-        홈.run_home()
-    elif choice == "📊 데이터분석":
-        data_analysis.run_eda()
-    elif choice == "📈 가격예측":
-        가격예측.run_ml()
+    choice = st.sidebar.selectbox("📌 메뉴 선택", list(PAGES.keys()))
+
+    hidden_page = st.query_params.get("page")
+    run_page(hidden_page if hidden_page in HIDDEN_PAGES else choice)
 
 
 if __name__ == "__main__":
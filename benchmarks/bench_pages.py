@@ -0,0 +1,101 @@
+"""페이지 함수 헤드리스 벤치마크 (pytest-benchmark)
+
+5k / 50k / 500k행 합성 이력으로 각 페이지 함수를 콜드 캐시 상태에서 실행하고,
+평균 실행 시간이 BUDGET_SECONDS를 넘으면 실패한다.
+
+    pip install -r benchmarks/requirements.txt
+    python -m pytest benchmarks/bench_pages.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ui.metrics import metrics  # noqa: E402
+
+# (페이지, 행 수) -> 평균 실행 시간 상한 (초)
+BUDGET_SECONDS = {
+    ("home", 5_000): 1.0, ("home", 50_000): 2.0, ("home", 500_000): 5.0,
+    ("eda", 5_000): 2.0, ("eda", 50_000): 5.0, ("eda", 500_000): 30.0,
+    ("ml", 5_000): 2.0, ("ml", 50_000): 2.0, ("ml", 500_000): 2.0,
+    ("forecast", 5_000): 1.0, ("forecast", 50_000): 1.0, ("forecast", 500_000): 1.0,
+    ("snapshot", 5_000): 0.2, ("snapshot", 50_000): 0.2, ("snapshot", 500_000): 0.2,
+    ("compare", 5_000): 2.0, ("compare", 50_000): 3.0, ("compare", 500_000): 15.0,
+}
+
+
+def check_budget(benchmark, key):
+    stats = getattr(benchmark, "stats", None)
+    if stats is None:  # --benchmark-disable
+        return
+    assert stats.stats.mean < BUDGET_SECONDS[key], f"{key}: 평균 {stats.stats.mean:.3f}s > 상한 {BUDGET_SECONDS[key]}s"
+
+
+def test_home(benchmark, app_env, cold_caches):
+    from ui.홈 import run_home
+
+    benchmark.pedantic(run_home, setup=cold_caches, rounds=3, iterations=1)
+    check_budget(benchmark, ("home", app_env))
+
+
+def test_eda(benchmark, app_env, cold_caches):
+    from ui.data_analysis import run_eda
+
+    benchmark.pedantic(run_eda, setup=cold_caches, rounds=3, iterations=1)
+    check_budget(benchmark, ("eda", app_env))
+    timers = metrics.snapshot()["timers"]
+    assert {"load_data", "create_gold_chart"} <= set(timers)
+
+
+def test_ml(benchmark, app_env, cold_caches):
+    from ui.가격예측 import run_ml
+
+    benchmark.pedantic(run_ml, setup=cold_caches, rounds=3, iterations=1)
+    check_budget(benchmark, ("ml", app_env))
+
+
+def test_compare(benchmark, app_env, cold_caches):
+    """자산 비교 페이지: 설정된 모든 자산 일괄 로드 + 정렬 행렬 + 상관/비율"""
+    from ui.자산비교 import run_compare
+
+    benchmark.pedantic(run_compare, setup=cold_caches, rounds=3, iterations=1)
+    check_budget(benchmark, ("compare", app_env))
+    timers = metrics.snapshot()["timers"]
+    assert {"load_asset_matrix", "snapshot.refresh_many"} <= set(timers)
+
+
+def test_forecast(benchmark, app_env, cold_caches):
+    """run_ml의 예측 버튼 경로: 모델 예측(캐시 미스) + 환율 + 그램당 가격 변환"""
+    from ui.가격예측 import load_arima_model, get_exchange_rate
+    from ui.model_registry import registry
+    from ui.forecast_engine import ForecastEngine, ArimaForecaster, usd_oz_to_per_gram
+
+    def predict():
+        model = load_arima_model()
+        info = registry.info("arima")
+        engine = ForecastEngine({"ARIMA": ArimaForecaster(model, info["version"], info["origin"])})
+        prices = engine.forecast_array(np.arange(1, 366))[0, :, 0]
+        return usd_oz_to_per_gram(prices, [get_exchange_rate()])
+
+    result = benchmark.pedantic(predict, setup=cold_caches, rounds=3, iterations=1)
+    assert result.shape == (365, 1)
+    check_budget(benchmark, ("forecast", app_env))
+    counters = metrics.snapshot()["counters"]
+    assert counters.get("forecast_cache.miss", 0) >= 1
+
+
+def test_forecast_snapshot(benchmark, app_env, cold_caches):
+    """예측 버튼의 스냅샷 경로: 배치가 발행한 예측표를 읽어 1~365일 전체를 조회 (모델을 실행하지 않음)"""
+    from ui.forecast_snapshot import publish, registered_models, current_snapshot, lookup, HORIZONS
+
+    publish(registered_models(), {"USD": 1.0, "KRW": 1350.0})
+
+    def serve():
+        manifest, table = current_snapshot()
+        return pd.concat([lookup(table, name, HORIZONS) for name in table["모델"].unique()])
+
+    result = benchmark.pedantic(serve, setup=cold_caches, rounds=3, iterations=1)
+    assert len(result) == 3 * len(HORIZONS)  # ARIMA, 선형 추세, 앙상블
+    check_budget(benchmark, ("snapshot", app_env))
+    assert metrics.snapshot()["counters"].get("forecast_snapshot.miss", 0) >= 1
@@ -0,0 +1,80 @@
+"""페이지 벤치마크용 공용 fixture
+
+네트워크 없이 실행되도록 yfinance 대신 합성 가격 소스를, 환율 API 대신 스텁 HTTP 클라이언트를 주입한다.
+"""
+import os
+import sys
+import logging
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.append(os.path.join(ROOT, "tests"))  # 합성 가격/가짜 피드는 단위 테스트와 같은 도우미 사용
+
+from ui import price_store, price_service, rollups, range_index, indicators, forecast_snapshot, cross_asset  # noqa: E402
+from ui.assets import symbols  # noqa: E402
+from ui.forecast_cache import forecast_cache  # noqa: E402
+from ui.model_registry import registry  # noqa: E402
+from ui.fx import fx_provider  # noqa: E402
+from ui.metrics import metrics  # noqa: E402
+from helpers import hourly_prices, FakeSource, StubHttp  # noqa: E402
+
+ROWS = [5_000, 50_000, 500_000]
+
+
+def pytest_configure(config):
+    # bare 모드로 페이지 함수를 호출할 때 나오는 Streamlit 경고 숨김
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def reset_caches():
+    """프로세스 전역 캐시를 비워 다음 실행이 콜드 캐시 상태에서 시작하도록 함"""
+    price_service._attached.clear()
+    price_service._series.clear()
+    rollups._rollups.clear()
+    range_index._indexes.clear()
+    indicators._engines.clear()
+    forecast_cache.clear()
+    forecast_snapshot._current.clear()
+    cross_asset._matrices.clear()
+
+
+@pytest.fixture
+def cold_caches():
+    """benchmark.pedantic의 setup으로 넘길 캐시 초기화 함수 (테스트 모듈이 conftest를 직접 import하지 않도록)"""
+    return reset_caches
+
+
+@pytest.fixture(params=ROWS, ids=lambda rows: f"{rows // 1000}k")
+def app_env(request, tmp_path, monkeypatch):
+    """임시 디렉터리에 합성 가격 저장소와 ARIMA 경량 모델을 준비하고 rows를 반환"""
+    rows = request.param
+    monkeypatch.chdir(tmp_path)
+    history = hourly_prices(rows)
+
+    monkeypatch.setattr(price_store, "_stores", {})
+    for i, ticker in enumerate(symbols()):  # 자산마다 다른 랜덤워크 (GC=F와 GLD는 같은 이력)
+        prices = history if ticker in ("GC=F", "GLD") else hourly_prices(rows, seed=i)
+        store = price_store.get_price_store(ticker, source=FakeSource(prices))
+        store.write(prices)
+
+    monkeypatch.setattr(fx_provider, "http", StubHttp())
+    monkeypatch.setattr(fx_provider, "cache_path", None)
+    monkeypatch.setattr(fx_provider, "_rates", None)
+
+    from ui.train_arima import fit_order
+    from ui.model_registry import dump_atomic
+
+    closes = history["Close"].iloc[-2000:]
+    _, slim = fit_order(closes.to_numpy(), (1, 1, 1))
+    slim["origin"] = str(closes.index[-1].normalize())
+    dump_atomic(slim, os.path.join("model", "gold_price_arima.slim.pkl"))
+    registry.reload("arima")
+
+    reset_caches()
+    metrics.reset()
+    yield rows
+    registry.reload("arima")
+    reset_caches()
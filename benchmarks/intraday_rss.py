@@ -0,0 +1,86 @@
+"""분 단위 수집/조회의 최대 RSS 측정
+
+합성 1분봉 CSV를 이력 길이별로 만들고, 새 파이썬 프로세스에서 청크 수집과 전체 기간 조회를 실행해
+최대 RSS를 비교한다. 가장 짧은 이력 대비 증가량이 --max-growth-mb를 넘으면 종료 코드 1을 반환한다.
+
+    python benchmarks/intraday_rss.py
+    python benchmarks/intraday_rss.py --rows 500000 2000000 5000000 --max-growth-mb 50
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 프로세스에서 실행할 측정 코드
+PROBE = """
+import json, time, resource
+from ui.intraday import IntradayStore, CsvChunkSource
+store = IntradayStore("GC=F")
+started = time.perf_counter()
+rows = store.ingest(CsvChunkSource("minutes.csv").iter_chunks("GC=F"))
+ingest_s = time.perf_counter() - started
+daily = store.daily()
+started = time.perf_counter()
+for resolution in ("1min", "1h", "1D"):
+    store.query(daily.index[0], daily.index[-1] + (daily.index[1] - daily.index[0]), resolution)
+print(json.dumps({
+    "rows": rows,
+    "days": len(daily),
+    "ingest_s": ingest_s,
+    "query_s": time.perf_counter() - started,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def write_minutes(path, rows, block=500_000, seed=0):
+    """rows행짜리 1분봉 랜덤워크 CSV를 block행씩 나눠 기록 (측정하는 쪽과 같은 ';' 구분자)"""
+    rng = np.random.default_rng(seed)
+    start, last = pd.Timestamp("2000-01-03"), 1800.0
+    for offset in range(0, rows, block):
+        n = min(block, rows - offset)
+        close = last * np.exp(np.cumsum(rng.normal(0, 1e-4, n)))
+        spread = np.abs(rng.normal(0, 5e-5, n)) * close
+        pd.DataFrame({
+            "Date": pd.date_range(start + pd.Timedelta(minutes=offset), periods=n, freq="min"),
+            "Open": np.r_[last, close[:-1]], "High": close + spread, "Low": close - spread, "Close": close,
+        }).to_csv(path, sep=";", index=False, mode="a" if offset else "w", header=not offset)
+        last = close[-1]
+
+
+def measure(rows):
+    with tempfile.TemporaryDirectory() as workdir:
+        write_minutes(os.path.join(workdir, "minutes.csv"), rows)
+        env = {**os.environ, "PYTHONPATH": ROOT}
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", PROBE],
+                                cwd=workdir, env=env, capture_output=True, text=True, check=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분 단위 수집/조회 최대 RSS 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[500_000, 2_000_000])
+    parser.add_argument("--max-growth-mb", type=float, default=None, help="가장 짧은 이력 대비 최대 RSS 증가량 상한")
+    args = parser.parse_args()
+
+    baseline = None
+    failed = False
+    print(f"{'행 수':>12}{'일 수':>8}{'수집(s)':>10}{'조회(s)':>10}{'최대RSS(MB)':>14}")
+    for rows in sorted(args.rows):
+        result = measure(rows)
+        baseline = result["peak_rss_mb"] if baseline is None else baseline
+        over = args.max_growth_mb is not None and result["peak_rss_mb"] - baseline > args.max_growth_mb
+        failed = failed or over
+        print(f"{result['rows']:>12,}{result['days']:>8,}{result['ingest_s']:>10.1f}{result['query_s']:>10.2f}"
+              f"{result['peak_rss_mb']:>14.1f}{'  ❌' if over else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
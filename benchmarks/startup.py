@@ -0,0 +1,78 @@
+"""페이지별 import 시간과 RSS 측정
+
+각 페이지 모듈을 새 파이썬 프로세스에서 import해서 streamlit만 불러온 상태와 비교한다.
+무거운 모듈 열에는 streamlit 이후에 새로 불러온 것만 표시한다.
+기준값(--max-seconds, --max-rss-mb)을 넘는 페이지가 있으면 종료 코드 1을 반환한다.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --max-seconds 1.5 --max-rss-mb 150
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["yfinance", "plotly", "statsmodels", "joblib", "sklearn", "pyarrow", "requests"]
+
+# 새 프로세스에서 실행할 측정 코드 (streamlit은 모든 세션이 불러오므로 기준선으로 먼저 import)
+PROBE = """
+import json, sys, time, os
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+import streamlit
+base_rss = rss()
+base_modules = set(sys.modules)
+started = time.perf_counter()
+if {module!r}:
+    __import__({module!r})
+print(json.dumps({{
+    "seconds": time.perf_counter() - started,
+    "rss_mb": rss() / 1e6,
+    "rss_delta_mb": (rss() - base_rss) / 1e6,
+    "heavy": [m for m in {heavy!r} if m in sys.modules and m not in base_modules],
+}}))
+"""
+
+
+def measure(module, repeat=3):
+    """module을 repeat번 새 프로세스에서 import하고 가장 빠른 결과를 반환"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return min(runs, key=lambda r: r["seconds"])
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    from app import PAGES
+
+    parser = argparse.ArgumentParser(description="페이지별 import 시간/RSS 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=None, help="페이지 import 시간 상한")
+    parser.add_argument("--max-rss-mb", type=float, default=None, help="페이지 import 후 RSS 증가량 상한")
+    args = parser.parse_args()
+
+    targets = {"(app.py만)": "app"}
+    targets.update({page: module for page, (module, _, _) in PAGES.items()})
+
+    failed = False
+    print(f"{'페이지':<14}{'import(s)':>10}{'RSS(MB)':>10}{'+RSS(MB)':>10}  무거운 모듈")
+    for page, module in targets.items():
+        result = measure(module, args.repeat)
+        over = ((args.max_seconds is not None and result["seconds"] > args.max_seconds)
+                or (args.max_rss_mb is not None and result["rss_delta_mb"] > args.max_rss_mb))
+        failed = failed or over
+        print(f"{page:<14}{result['seconds']:>10.3f}{result['rss_mb']:>10.1f}{result['rss_delta_mb']:>10.1f}  "
+              f"{', '.join(result['heavy']) or '-'}{'  ❌' if over else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,39 @@
+"""단위 테스트 공용 fixture - 네트워크 없이 실행되도록 가짜 가격 피드와 스텁 환율 서버를 주입"""
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from helpers import FakeSource, StubHttp  # noqa: E402
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """상대 경로(data/, model/)를 쓰는 모듈이 임시 디렉터리에서 동작하도록 함"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def price_env(workdir, monkeypatch):
+    """임시 디렉터리에 가짜 피드를 쓰는 가격 저장소/스냅샷 환경 - 티커별 FakeSource를 등록하는 함수 반환"""
+    from ui import price_store, price_service, forecast_snapshot, cross_asset
+    from ui.fx import fx_provider
+
+    monkeypatch.setattr(price_store, "_stores", {})
+    monkeypatch.setattr(price_service, "_attached", {})
+    monkeypatch.setattr(price_service, "_series", {})
+    monkeypatch.setattr(forecast_snapshot, "_current", {})
+    monkeypatch.setattr(cross_asset, "_matrices", {})
+    monkeypatch.setattr(fx_provider, "http", StubHttp())
+    monkeypatch.setattr(fx_provider, "cache_path", None)
+    monkeypatch.setattr(fx_provider, "_rates", None)
+
+    def register(ticker, df):
+        source = FakeSource(df)
+        price_store._stores[ticker] = price_store.PriceStore(ticker, source=source)
+        return source
+
+    return register
@@ -0,0 +1,75 @@
+"""단위 테스트/벤치마크 공용 도우미 - 합성 가격, 가짜 가격 피드, 스텁 환율 서버"""
+import numpy as np
+import pandas as pd
+
+
+def random_walk(index, seed=0, base=1800.0, volatility=0.01):
+    """index 시각마다 한 행씩인 OHLC 랜덤워크"""
+    rng = np.random.default_rng(seed)
+    close = base * np.exp(np.cumsum(rng.normal(0, volatility, len(index))))
+    spread = np.abs(rng.normal(0, volatility / 2, len(index))) * close
+    return pd.DataFrame({
+        "Open": np.concatenate([[close[0]], close[:-1]]),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+    }, index=index)
+
+
+def daily_prices(days, start="2020-01-01", seed=0, base=1800.0):
+    """영업일 기준 days행짜리 OHLC 랜덤워크"""
+    return random_walk(pd.bdate_range(start, periods=days, name="Date"), seed, base)
+
+
+def hourly_prices(rows, seed=0, base=400.0):
+    """어제까지 끝나는 rows행짜리 시간 단위 OHLC 랜덤워크 (일봉 파이프라인은 해상도와 무관하게 동작)"""
+    end = pd.Timestamp.today().normalize() - pd.Timedelta(hours=1)
+    return random_walk(pd.date_range(end=end, periods=rows, freq="h", name="Date"), seed, base, volatility=0.002)
+
+
+class FakeSource:
+    """yfinance 대신 사용하는 가격 피드 - fail=True면 요청이 실패한 것처럼 예외를 던짐"""
+
+    def __init__(self, df, fail=False):
+        self.df = df
+        self.fail = fail
+        self.calls = []
+        self.bulk_calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        if self.fail:
+            raise ConnectionError("feed down")
+        return self.df.loc[(self.df.index >= pd.Timestamp(start)) & (self.df.index < pd.Timestamp(end))]
+
+    def fetch_many(self, tickers, start, end):
+        self.bulk_calls.append((list(tickers), start, end))
+        return {ticker: self.fetch(ticker, start, end) for ticker in tickers}
+
+
+class StubResponse:
+    def __init__(self, rates):
+        self.rates = rates
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"conversion_rates": self.rates}
+
+
+class StubHttp:
+    """환율 API 대신 사용하는 HTTP 클라이언트 - fail=True면 연결 오류"""
+
+    def __init__(self, rates=None, fail=False):
+        self.rates = rates or {"USD": 1.0, "KRW": 1350.0, "JPY": 150.0, "EUR": 0.92, "CNY": 7.2}
+        self.fail = fail
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        import requests
+
+        self.calls += 1
+        if self.fail:
+            raise requests.exceptions.ConnectionError("stub server down")
+        return StubResponse(dict(self.rates))
@@ -0,0 +1,29 @@
+import gc
+import time
+import weakref
+
+from ui.async_loader import warm
+
+
+class Loaded:
+    """미리 불러온 DataFrame/모델 대신 쓰는 객체"""
+
+
+def test_warm_returns_timings_without_holding_results():
+    loaded = Loaded()
+    ref = weakref.ref(loaded)
+
+    def load():
+        time.sleep(0.05)
+        return loaded
+
+    def fail():
+        raise ValueError("feed down")
+
+    status = warm({"prices": (load, 5), "broken": (fail, 5)})
+    assert status["prices"]["error"] is None and status["prices"]["seconds"] >= 0.05
+    assert status["broken"]["error"] == "feed down"
+
+    del loaded
+    gc.collect()
+    assert ref() is None  # 보관된 상태 dict가 불러온 객체를 붙잡지 않음
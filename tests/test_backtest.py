@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+pytest.importorskip("sklearn")
+
+from helpers import daily_prices  # noqa: E402
+from ui import backtest  # noqa: E402
+from ui.backtest import walk_forward, evaluate_origin, model_specs  # noqa: E402
+
+SERIES = daily_prices(400, seed=6)["Close"]
+
+
+def test_walk_forward_naive_errors_match_manual_computation():
+    """Naive(마지막 값) 모델의 MAE를 직접 계산한 값과 비교하는 결정적 워크포워드"""
+    specs = {"Naive(마지막 값)": ("naive", None), "선형 추세(50일)": ("linear", 50)}
+    summary = walk_forward(SERIES, specs, horizons=(1, 5), min_train=300, step=20, workers=1)
+
+    values = SERIES.to_numpy()
+    origins = range(300, len(values) - 5 + 1, 20)
+    naive = summary[summary["모델"] == "Naive(마지막 값)"].set_index("기간(일)")
+    for horizon in (1, 5):
+        expected = np.mean([abs(values[o - 1] - values[o + horizon - 1]) for o in origins])
+        assert naive.loc[horizon, "MAE"] == pytest.approx(expected)
+        assert naive.loc[horizon, "기준일 수"] == len(origins)
+    assert (summary["실패 수"] == 0).all() and (summary["미수렴 수"] == 0).all()
+
+
+def test_model_error_is_recorded_without_aborting_other_models(monkeypatch):
+    """한 모델에서 어떤 예외가 나도 그 (모델, 기준 시점)만 실패로 기록하고 나머지 모델은 평가"""
+    fit_predict = backtest._fit_predict
+
+    def flaky(kind, setting, train, steps):
+        if kind == "linear":
+            raise RuntimeError("boom")
+        return fit_predict(kind, setting, train, steps)
+
+    monkeypatch.setattr(backtest, "_fit_predict", flaky)
+    rows = evaluate_origin(SERIES, 300, model_specs(orders=(), linear_window=50), np.array([1, 5]))
+    by_model = {}
+    for row in rows:
+        by_model.setdefault(row["모델"], []).append(row)
+    failed = by_model["선형 추세(50일)"]
+    assert len(failed) == 2 and all(row["상태"] == "error: RuntimeError: boom" and np.isnan(row["오차"]) for row in failed)
+    assert all(row["상태"] == "ok" and row["수렴"] for row in by_model["Naive(마지막 값)"])
+
+
+def test_arima_fit_reports_convergence():
+    forecast, fit_seconds, forecast_seconds, converged = backtest._fit_predict("arima", (1, 1, 0), SERIES.iloc[:300], 5)
+    assert len(forecast) == 5 and fit_seconds > 0 and isinstance(converged, bool)
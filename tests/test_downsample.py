@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers import daily_prices
+from ui.downsample import lttb, minmax, downsample_frame
+
+RNG = np.random.default_rng(12)
+WALK = np.cumsum(RNG.normal(0, 1, 10_001))
+
+
+@pytest.mark.parametrize("n_out", [3, 4, 7, 100, 1500, 10_000])
+def test_lttb_keeps_endpoints_and_exact_size(n_out):
+    idx = lttb(np.arange(len(WALK)), WALK, n_out)
+    assert len(idx) == n_out
+    assert idx[0] == 0 and idx[-1] == len(WALK) - 1
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_keeps_spikes():
+    y = np.zeros(5000)
+    y[1234], y[3777] = 100.0, -80.0
+    idx = lttb(np.arange(len(y)), y, 50)
+    assert 1234 in idx and 3777 in idx
+
+
+@pytest.mark.parametrize("n_out", [4, 5, 9, 100, 1500, 9_999])
+def test_minmax_keeps_endpoints_and_extremes(n_out):
+    idx = minmax(WALK, n_out)
+    assert len(idx) <= n_out
+    assert idx[0] == 0 and idx[-1] == len(WALK) - 1
+    assert int(np.argmin(WALK)) in idx and int(np.argmax(WALK)) in idx
+    assert (np.diff(idx) > 0).all()
+
+
+def test_minmax_keeps_extreme_in_uneven_last_bucket():
+    """점 개수가 구간 수로 나누어떨어지지 않아도 마지막 구간의 극값을 놓치지 않음"""
+    y = np.zeros(1003)
+    y[1001] = 50.0  # 마지막 점 바로 앞
+    assert 1001 in minmax(y, 10)
+
+
+def test_inputs_under_threshold_pass_through():
+    y = np.arange(10.0)
+    np.testing.assert_array_equal(lttb(np.arange(10), y, 10), np.arange(10))
+    np.testing.assert_array_equal(lttb(np.arange(10), y, 50), np.arange(10))
+    np.testing.assert_array_equal(minmax(y, 10), np.arange(10))
+
+    df = daily_prices(100)
+    assert downsample_frame(df, max_points=100) is df
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample_frame_bounds_rows(method):
+    df = daily_prices(5000, seed=13)
+    out = downsample_frame(df, max_points=500, method=method)
+    assert len(out) <= 500
+    assert out.index[0] == df.index[0] and out.index[-1] == df.index[-1]
+    assert out.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(out, df.loc[out.index])
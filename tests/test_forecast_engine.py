@@ -0,0 +1,87 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from helpers import daily_prices
+from ui.forecast_cache import ForecastCache
+from ui.forecast_engine import ForecastEngine, LinearTrendForecaster, trading_steps, step_dates, ensemble_forecast
+
+
+def test_same_origin_different_tickers_do_not_share_cache():
+    """기준일이 같은 두 자산의 예측이 캐시에서 섞이지 않아야 함"""
+    cache = ForecastCache()
+    silver = daily_prices(300, seed=1, base=30.0)["Close"]
+    platinum = daily_prices(300, seed=2, base=1000.0)["Close"]
+    assert silver.index[-1] == platinum.index[-1]
+
+    horizons = np.arange(1, 31)
+    silver_forecast = ForecastEngine({"선형 추세": LinearTrendForecaster(silver, ticker="SI=F")}, cache).forecast_array(horizons)
+    platinum_forecast = ForecastEngine({"선형 추세": LinearTrendForecaster(platinum, ticker="PL=F")}, cache).forecast_array(horizons)
+
+    assert not np.allclose(silver_forecast, platinum_forecast)
+    assert abs(platinum_forecast[0, 0, 0] - platinum.iloc[-1]) < abs(silver_forecast[0, 0, 0] - platinum.iloc[-1])
+
+
+def test_same_ticker_different_data_does_not_share_cache():
+    """같은 티커라도 입력 시계열이 바뀌면(데이터 정정 등) 새로 예측"""
+    cache = ForecastCache()
+    closes = daily_prices(300, seed=3)["Close"]
+    first = ForecastEngine({"m": LinearTrendForecaster(closes, ticker="GC=F")}, cache).forecast_array([1])
+    second = ForecastEngine({"m": LinearTrendForecaster(closes * 2, ticker="GC=F")}, cache).forecast_array([1])
+    assert np.isclose(second[0, 0, 0], 2 * first[0, 0, 0])
+
+
+def test_trading_steps_count_sessions_not_calendar_days():
+    origin = pd.Timestamp("2026-10-16")  # 금요일
+    dates = pd.date_range("2026-10-19", "2026-11-15")
+    steps = trading_steps(origin, dates)
+    assert steps[0] == 1  # 다음 월요일 = 첫 거래일
+    assert trading_steps(origin, [pd.Timestamp("2026-11-13")])[0] == 20  # 달력 28일 = 거래일 20일
+    assert (trading_steps(origin, [pd.Timestamp("2026-10-24"), pd.Timestamp("2026-10-25")]) == 5).all()  # 주말 = 금요일
+
+    business = dates[dates.dayofweek < 5]
+    tm.assert_index_equal(step_dates(origin, trading_steps(origin, business)), business, check_names=False, exact=False)
+
+
+class FixedForecaster:
+    """예측값과 표준편차가 고정된 정규 예측기"""
+
+    def __init__(self, mean, std, name):
+        self.mean, self.std = mean, std
+        self.version, self.origin = name, "2026-10-16"
+
+    def predict(self, steps, alpha=0.05):
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        mean = np.full(steps, self.mean)
+        return np.column_stack([mean, mean - z * self.std, mean + z * self.std])
+
+
+def test_horizons_below_one_are_rejected():
+    engine = ForecastEngine({"a": FixedForecaster(100.0, 1.0, "a")}, ForecastCache())
+    for horizons in ([0], [0, 1], [-3], []):
+        with pytest.raises(ValueError):
+            engine.forecast_array(horizons)
+
+
+def test_ensemble_interval_is_mixture_of_model_distributions():
+    """앙상블 구간은 두 모델 분포를 반씩 섞은 분포의 분산으로 계산 (하한/상한의 단순 평균이 아님)"""
+    models = {"a": FixedForecaster(100.0, 2.0, "a"), "b": FixedForecaster(110.0, 4.0, "b")}
+    frame = ForecastEngine(models, ForecastCache()).forecast_frame([1, 5], alpha=0.10)
+    row = frame[frame["모델"] == "앙상블"].iloc[0]
+
+    z = NormalDist().inv_cdf(0.95)
+    std = np.sqrt((2.0 ** 2 + 4.0 ** 2) / 2 + 5.0 ** 2)  # 분산의 평균 + 예측값의 분산
+    assert row["예측 (USD/온스)"] == pytest.approx(105.0)
+    assert row["하한 (USD/온스)"] == pytest.approx(105.0 - z * std)
+    assert row["상한 (USD/온스)"] == pytest.approx(105.0 + z * std)
+    # 모델 의견 차이만큼 구간이 넓어져, 평균한 하한/상한보다 넓음
+    assert row["상한 (USD/온스)"] - row["하한 (USD/온스)"] > 2 * z * 3.0
+
+
+def test_ensemble_of_agreeing_models_matches_their_interval():
+    models = {"a": FixedForecaster(100.0, 3.0, "a"), "b": FixedForecaster(100.0, 3.0, "b")}
+    values = ForecastEngine(models, ForecastCache()).forecast_array([1, 2])
+    np.testing.assert_allclose(ensemble_forecast(values)[0], values[0])
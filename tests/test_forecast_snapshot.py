@@ -0,0 +1,59 @@
+import warnings
+import pytest
+import pandas as pd
+
+from helpers import daily_prices
+from ui import price_service
+from ui.forecast_snapshot import run_batch, current_snapshot, load_current
+
+
+def test_linear_only_snapshot_goes_stale_on_new_close(price_env):
+    """ARIMA가 없는 자산도 종가가 추가되면 스냅샷이 오래된 것으로 보고 다시 발행"""
+    history = daily_prices(400, start="2023-01-02", base=25.0)
+    source = price_env("SI=F", history.iloc[:-5])
+
+    versions = run_batch(["SI=F"])
+    assert "SI=F" in versions
+    manifest, frame = current_snapshot("SI=F")
+    assert set(frame["모델"]) == {"선형 추세"}
+    assert pd.Timestamp(manifest["last_close"]) == history.index[-6]
+    assert run_batch(["SI=F"]) == {}  # 입력이 그대로면 다시 계산하지 않음
+
+    source.df = history
+    price_service.refresh("SI=F")
+    assert current_snapshot("SI=F") is None
+    assert load_current("SI=F") is not None  # 이전 버전은 남아 있지만 제공하지 않음
+
+    versions = run_batch(["SI=F"])
+    assert "SI=F" in versions
+    manifest, _ = current_snapshot("SI=F")
+    assert pd.Timestamp(manifest["last_close"]) == history.index[-1]
+
+
+def test_arima_snapshot_republished_on_new_close(price_env, monkeypatch):
+    """ARIMA 자산은 재학습 전까지 모델 버전이 그대로여도 종가가 추가되면 새 버전으로 다시 발행"""
+    pytest.importorskip("statsmodels")
+    from statsmodels.tsa.arima.model import ARIMA
+    from ui.model_registry import registry, save_slim, arima_path
+
+    monkeypatch.setattr(registry, "_models", {})
+    monkeypatch.setattr(registry, "_info", {})
+    history = daily_prices(400, start="2023-01-02")
+    source = price_env("GC=F", history.iloc[:-5])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        save_slim(ARIMA(history["Close"].iloc[:-5], order=(1, 1, 0)).fit(), arima_path("GC=F"))
+
+    first = run_batch(["GC=F"])["GC=F"]
+    assert set(current_snapshot("GC=F")[1]["모델"]) >= {"ARIMA", "선형 추세"}
+
+    source.df = history
+    price_service.refresh("GC=F")
+    assert current_snapshot("GC=F") is None
+
+    second = run_batch(["GC=F"])["GC=F"]
+    assert second != first
+    manifest, _ = current_snapshot("GC=F")
+    assert manifest["version"] == second
+    assert pd.Timestamp(manifest["last_close"]) == history.index[-1]
+    assert run_batch(["GC=F"]) == {}
@@ -0,0 +1,107 @@
+import time
+import threading
+
+from helpers import StubHttp
+from ui.fx import FxProvider, DEFAULT_RATES
+from ui.forecast_snapshot import CURRENCIES
+
+
+class SlowHttp(StubHttp):
+    """응답 전에 잠시 멈추는 스텁 서버 (동시 요청이 겹치도록)"""
+
+    def get(self, url, timeout=None):
+        time.sleep(0.2)
+        return super().get(url, timeout)
+
+
+def test_fresh_cache_hit_does_not_call_server():
+    http = StubHttp()
+    provider = FxProvider(http=http, cache_path=None)
+    rates, is_default = provider.rates()
+    assert not is_default and rates["KRW"] == 1350.0
+    assert provider.rate("JPY") == (150.0, False)
+    assert http.calls == 1
+
+
+def test_stale_rates_are_served_while_refreshing_in_background():
+    http = SlowHttp()
+    provider = FxProvider(http=http, ttl=60, cache_path=None)
+    provider.rates()
+    provider._fetched_at -= 120  # 만료
+    http.rates["KRW"] = 1400.0
+
+    rates, is_default = provider.rates()
+    assert not is_default and rates["KRW"] == 1350.0  # 응답을 기다리지 않고 이전 값
+    assert provider.refresh_in_background() is None  # 이미 갱신 중이면 스레드를 더 만들지 않음
+
+    deadline = time.time() + 5
+    while provider._refreshing and time.time() < deadline:
+        time.sleep(0.01)
+    assert http.calls == 2
+    assert provider.rate("KRW") == (1400.0, False)
+    assert provider.age < 60
+
+
+def test_failed_server_falls_back_to_defaults_for_every_currency():
+    provider = FxProvider(http=StubHttp(fail=True), cache_path=None)
+    rates, is_default = provider.rates()
+    assert is_default and rates == DEFAULT_RATES
+    for currency in CURRENCIES:
+        rate, is_default = provider.rate(currency)
+        assert is_default and rate == DEFAULT_RATES[currency]
+
+
+def test_missing_currency_uses_default():
+    provider = FxProvider(http=StubHttp(rates={"USD": 1.0, "KRW": 1350.0}), cache_path=None)
+    assert provider.rate("CNY") == (DEFAULT_RATES["CNY"], True)
+
+
+def test_cold_start_is_single_flight():
+    http = SlowHttp()
+    provider = FxProvider(http=http, cache_path=None)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(provider.rates())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert http.calls == 1
+    assert all(not is_default and rates["KRW"] == 1350.0 for rates, is_default in results)
+
+
+def test_cold_start_uses_last_rates_on_disk(tmp_path):
+    path = str(tmp_path / "fx.json")
+    FxProvider(http=StubHttp(), cache_path=path).rates()
+    http = StubHttp(fail=True)
+    provider = FxProvider(http=http, cache_path=path)
+    rates, is_default = provider.rates()
+    assert not is_default and rates["KRW"] == 1350.0 and http.calls == 0
+
+
+def test_cold_start_failure_is_shared_and_backed_off():
+    """환율 API가 죽어 있으면 동시 요청은 첫 시도의 실패(기본값)를 함께 쓰고, retry_after 동안 다시 호출하지 않음"""
+    http = SlowHttp(fail=True)
+    provider = FxProvider(http=http, cache_path=None, retry_after=60)
+    results, latencies = [], []
+
+    def load():
+        started = time.perf_counter()
+        results.append(provider.rates())
+        latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=load) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert http.calls == 1
+    assert all(is_default and rates == DEFAULT_RATES for rates, is_default in results)
+    assert max(latencies) < 1.0  # 실패를 기다린 시간은 한 번뿐
+
+    assert provider.rates() == (DEFAULT_RATES, True)
+    assert http.calls == 1
+
+    provider._failed_at -= 61  # 대기 시간이 지나면 다시 시도
+    http.fail = False
+    rates, is_default = provider.rates()
+    assert not is_default and rates["KRW"] == 1350.0 and http.calls == 2
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas.testing as tm
+import pytest
+
+from helpers import daily_prices
+from ui.indicators import IndicatorEngine, get_indicators, TRADING_DAYS
+from ui import indicators
+
+PRICES = daily_prices(400, seed=8)
+
+
+@pytest.mark.parametrize("split", [0, 1, 15, 21, 61, 300])
+def test_incremental_append_matches_full_computation(split):
+    """처음 split행으로 만든 엔진에 나머지를 한 행씩 append한 결과가 전체 이력으로 계산한 엔진과 같아야 함"""
+    engine = IndicatorEngine(PRICES.iloc[:split])
+    for date, close in PRICES['Close'].iloc[split:].items():
+        engine.append(date, close)
+    tm.assert_frame_equal(engine.frame, IndicatorEngine(PRICES).frame, check_exact=False, rtol=1e-9, atol=1e-9, check_freq=False)
+
+
+def assert_values(actual, expected):
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+def test_full_computation_matches_pandas():
+    frame = IndicatorEngine(PRICES).frame
+    close = PRICES['Close']
+    assert_values(frame['SMA_20'], close.rolling(20).mean())
+    assert_values(frame['SMA_60'], close.rolling(60).mean())
+    assert_values(frame['EMA_20'], close.ewm(span=20, adjust=False).mean())
+    mid, std = close.rolling(20).mean(), close.rolling(20).std(ddof=0)
+    assert_values(frame['BB_Upper'], mid + 2 * std)
+    assert_values(frame['BB_Lower'], mid - 2 * std)
+    volatility = np.log(close).diff().rolling(20).std() * np.sqrt(TRADING_DAYS)
+    assert_values(frame['Volatility_20'], volatility)
+    assert_values(frame['Drawdown'], close / close.cummax() - 1)
+
+
+def test_get_indicators_appends_only_new_rows(monkeypatch):
+    monkeypatch.setattr(indicators, "_engines", {})
+    first = get_indicators("GC=F", PRICES.iloc[:300])
+    second = get_indicators("GC=F", PRICES)
+    assert first is second and len(second) == len(PRICES)
+    tm.assert_frame_equal(second.frame, IndicatorEngine(PRICES).frame, check_exact=False, rtol=1e-9, atol=1e-9, check_freq=False)
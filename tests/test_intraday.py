@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from ui.intraday import IntradayStore, choose_step, STEPS
+
+
+def minute_prices(start="2024-01-02 20:00", minutes=3000, seed=0):
+    """자정을 여러 번 넘는 1분봉 랜덤워크"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=minutes, freq="1min", name="Date")
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.0005, minutes)))
+    spread = np.abs(rng.normal(0, 0.0003, minutes)) * close
+    return pd.DataFrame({
+        "Open": np.concatenate([[close[0]], close[:-1]]),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+    }, index=index)
+
+
+def chunks(df, size):
+    for i in range(0, len(df), size):
+        yield df.iloc[i:i + size]
+
+
+def expected_bars(df, freq):
+    return df.resample(freq).agg({"Open": "first", "High": "max", "Low": "min", "Close": "last"}).dropna()
+
+
+def assert_same_bars(actual, expected):
+    np.testing.assert_array_equal(actual.index.to_numpy("datetime64[ns]"), expected.index.to_numpy("datetime64[ns]"))
+    np.testing.assert_allclose(actual[["Open", "High", "Low", "Close"]].to_numpy(), expected[["Open", "High", "Low", "Close"]].to_numpy())
+
+
+def test_ingest_merges_days_split_across_chunks(tmp_path):
+    """청크 경계와 날짜 경계가 어긋나도 날짜 파일과 일봉 요약이 한 번에 넣은 것과 같아야 함"""
+    df = minute_prices()
+    store = IntradayStore("GC=F", store_dir=str(tmp_path))
+    assert store.ingest(chunks(df, 97)) == len(df)
+
+    daily = store.daily()
+    expected = expected_bars(df, "1D")
+    assert_same_bars(daily, expected)
+    np.testing.assert_array_equal(daily["Rows"].to_numpy(), df.groupby(df.index.normalize()).size().to_numpy())
+    for day, rows in df.groupby(df.index.normalize()):
+        stored = pd.read_parquet(store.partition_path(day))
+        np.testing.assert_allclose(stored.to_numpy(), rows.to_numpy())
+
+
+def test_reingesting_overlap_does_not_duplicate_rows(tmp_path):
+    df = minute_prices(minutes=2000)
+    store = IntradayStore("GC=F", store_dir=str(tmp_path))
+    store.ingest([df.iloc[:1200]])
+    store.ingest([df.iloc[1000:]])  # 200행 겹침
+    assert int(store.daily()["Rows"].sum()) == len(df)
+    assert_same_bars(store.daily(), expected_bars(df, "1D"))
+
+
+def test_query_slices_range_and_aggregates(tmp_path):
+    df = minute_prices()
+    store = IntradayStore("GC=F", store_dir=str(tmp_path))
+    store.ingest(chunks(df, 500))
+
+    start, end = pd.Timestamp("2024-01-02 23:30"), pd.Timestamp("2024-01-03 01:15")
+    bars, freq = store.query(start, end, "1min")
+    assert freq == "1min"
+    assert_same_bars(bars, df.loc[start:end])
+
+    bars, freq = store.query(start, end, "15min")
+    assert freq == "15min"
+    assert_same_bars(bars, expected_bars(df.loc[start:end], "15min"))
+
+    # 점 개수 제한을 넘으면 더 넓은 간격으로 집계
+    bars, freq = store.query(df.index[0], df.index[-1], "1min", max_points=100)
+    assert freq == "30min" and len(bars) <= 100
+    assert_same_bars(bars, expected_bars(df, "30min"))
+
+    empty, _ = store.query("2030-01-01", "2030-01-02", "1min")
+    assert empty.empty
+
+
+def test_choose_step():
+    day = pd.Timedelta("1D")
+    assert choose_step(day, "1min", max_points=1500) == "1min"
+    assert choose_step(day, "1min", max_points=1000) == "5min"
+    assert choose_step(day, "1h", max_points=1500) == "1h"  # 요청한 해상도보다 촘촘하게 집계하지 않음
+    assert choose_step(30 * day, "1min", max_points=1500) == "30min"
+    assert choose_step(10 * 365 * day, "1min", max_points=1500) == "7D"
+    span = 1000 * pd.Timedelta(STEPS[-1])
+    step = choose_step(span, "1min", max_points=100)
+    assert pd.Timedelta(step) >= pd.Timedelta(STEPS[-1]) and span / pd.Timedelta(step) <= 100
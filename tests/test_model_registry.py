@@ -0,0 +1,57 @@
+import os
+import warnings
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from helpers import daily_prices  # noqa: E402
+from ui.model_registry import slim_arima, restore_slim, save_slim, load_model, SLIM_TAIL  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def results():
+    from statsmodels.tsa.arima.model import ARIMA
+
+    closes = daily_prices(600, seed=4)["Close"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return ARIMA(closes, order=(2, 1, 1)).fit()
+
+
+def assert_same_forecast(a, b, steps=365, tol=1e-8):
+    fa, fb = a.get_forecast(steps), b.get_forecast(steps)
+    np.testing.assert_allclose(np.asarray(fb.predicted_mean), np.asarray(fa.predicted_mean), rtol=0, atol=tol)
+    np.testing.assert_allclose(np.asarray(fb.conf_int()), np.asarray(fa.conf_int()), rtol=0, atol=tol)
+
+
+def test_slim_restore_matches_full_model(results):
+    """경량 형식(마지막 관측값 + 상태)에서 복원한 모델의 예측/신뢰구간이 원래 모델과 같아야 함"""
+    slim = slim_arima(results)
+    assert len(slim["endog_tail"]) == SLIM_TAIL
+    assert_same_forecast(results, restore_slim(slim))
+
+
+def test_slim_file_round_trip(results, tmp_path):
+    path = os.path.join(tmp_path, "model.slim.pkl")
+    save_slim(results, path)
+    restored, origin = load_model(path)
+    assert origin == str(results.model.data.row_labels[-1])
+    assert_same_forecast(results, restored)
+
+
+def test_registry_loads_without_rss_support(results, tmp_path, monkeypatch):
+    """/proc와 resource 모듈이 없는 플랫폼(Windows)에서도 모델을 불러오고 RSS는 None으로 기록"""
+    import sys
+    from ui import model_registry
+
+    monkeypatch.delattr(model_registry.os, "sysconf")
+    monkeypatch.setitem(sys.modules, "resource", None)
+    assert model_registry._rss_bytes() is None
+
+    path = os.path.join(tmp_path, "model.slim.pkl")
+    save_slim(results, path)
+    registry = model_registry.ModelRegistry()
+    registry.register("arima", path)
+    assert_same_forecast(results, registry.get("arima"))
+    assert registry.stats()["arima"]["rss_bytes"] is None
@@ -0,0 +1,117 @@
+import warnings
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from helpers import daily_prices  # noqa: E402
+from ui.model_registry import slim_arima, restore_slim  # noqa: E402
+from ui.model_update import append_observations, load_slim  # noqa: E402
+
+
+def test_append_observations_matches_filtering_full_series():
+    """새 관측값을 상태 갱신으로 반영한 결과가 같은 파라미터로 전체 이력을 다시 필터링한 결과와 같아야 함"""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    closes = daily_prices(620, seed=5)["Close"].to_numpy()
+    train, new = closes[:600], closes[600:]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        fitted = ARIMA(train, order=(1, 1, 1)).fit()
+
+    updated = append_observations(slim_arima(fitted), new, "2022-05-20")
+    assert updated["nobs"] == len(closes)
+    assert updated["origin"] == "2022-05-20"
+
+    expected = ARIMA(closes, order=(1, 1, 1)).filter(fitted.params).get_forecast(365)
+    actual = restore_slim(updated).get_forecast(365)
+    np.testing.assert_allclose(np.asarray(actual.predicted_mean), np.asarray(expected.predicted_mean), rtol=0, atol=1e-6)
+    np.testing.assert_allclose(np.asarray(actual.conf_int()), np.asarray(expected.conf_int()), rtol=0, atol=1e-6)
+
+
+def test_append_observations_in_steps_matches_single_append():
+    """매일 하나씩 반영해도 한 번에 반영한 것과 같아야 함 (야간 작업이 며칠 밀려도 결과가 같음)"""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    closes = daily_prices(610, seed=6)["Close"].to_numpy()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        slim = slim_arima(ARIMA(closes[:600], order=(1, 1, 1)).fit())
+
+    stepwise = slim
+    for value in closes[600:]:
+        stepwise = append_observations(stepwise, [value], "-")
+    at_once = append_observations(slim, closes[600:], "-")
+    np.testing.assert_allclose(restore_slim(stepwise).forecast(30), restore_slim(at_once).forecast(30), rtol=0, atol=1e-6)
+
+
+def test_load_slim_converts_full_pickle_with_one_read(tmp_path, monkeypatch):
+    """원본 ARIMAResults pkl은 한 번만 읽어 경량 형식으로 변환"""
+    import joblib
+    from statsmodels.tsa.arima.model import ARIMA
+
+    closes = daily_prices(300, seed=5)["Close"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        results = ARIMA(closes, order=(1, 1, 0)).fit()
+    path = str(tmp_path / "full.pkl")
+    joblib.dump(results, path)
+
+    reads, load = [], joblib.load
+
+    def counting_load(*args, **kwargs):
+        reads.append(args[0])
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(joblib, "load", counting_load)
+    slim = load_slim(path)
+    assert len(reads) == 1
+    assert slim["origin"] == str(closes.index[-1])
+    assert slim["nobs"] == len(closes)
+
+
+def test_failed_refit_is_recorded_and_backed_off(price_env, monkeypatch):
+    """재학습이 실패하면 모델 파일에 기록하고 매일 다시 시도하지 않음 - 대기 기간은 실패마다 두 배, 성공하면 기록 삭제"""
+    from statsmodels.tsa.arima.model import ARIMA
+    from ui import model_update
+    from ui.model_registry import arima_path, save_slim
+    from ui.model_update import update_model, load_slim, REFIT_RETRY_DAYS
+
+    history = daily_prices(400, start="2023-01-02")
+    source = price_env("GC=F", history.iloc[:300])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        save_slim(ARIMA(history["Close"].iloc[:250], order=(1, 1, 0)).fit(), arima_path("GC=F"))
+
+    attempts = []
+    fit_order = model_update.fit_order
+
+    def failing_fit(endog, order):
+        attempts.append(len(endog))
+        return {"status": "error: LinAlgError: singular", "converged": False}, None
+
+    monkeypatch.setattr(model_update, "fit_order", failing_fit)
+
+    def update(rows):
+        source.df = history.iloc[:rows]
+        update_model("GC=F")
+        return load_slim(arima_path("GC=F"))
+
+    slim = update(300)  # 학습 후 50거래일 - 재학습 시도, 실패
+    assert attempts == [300]
+    assert slim["refit_failures"] == 1 and slim["last_refit_error"] == "error: LinAlgError: singular"
+    assert slim["origin"] == str(history.index[299])  # 상태 갱신은 계속
+
+    slim = update(301)  # 다음 날은 다시 시도하지 않음
+    assert attempts == [300] and slim["refit_failures"] == 1
+
+    days = REFIT_RETRY_DAYS // 7 * 5 + 1  # 대기 기간(달력일)이 지난 첫 거래일
+    slim = update(300 + days)
+    assert attempts == [300, 300 + days] and slim["refit_failures"] == 2
+
+    slim = update(300 + days + 6)  # 두 번째 실패 뒤에는 두 배(14일) 대기
+    assert len(attempts) == 2
+
+    monkeypatch.setattr(model_update, "fit_order", lambda endog, order: fit_order(endog, order))
+    slim = update(300 + days + 11)
+    assert "refit_failures" not in slim and slim["trained_origin"] == str(history.index[300 + days + 10])
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from helpers import daily_prices
+from ui.price_series import PriceSeries, choose_scale, MAX_SCALE, INT32_MAX
+
+
+def test_round_trip_within_precision_bound():
+    df = daily_prices(500, seed=7)
+    series = PriceSeries.from_frame(df)
+    assert series.scale == MAX_SCALE and series.unit == 'D' and len(series) == len(df)
+    np.testing.assert_array_equal(series.dates, df.index.to_numpy("datetime64[ns]"))
+    frame = series.to_frame()
+    assert (frame - df).abs().to_numpy().max() <= 0.5 / series.scale + 1e-12
+    assert series.last() == pytest.approx(df["Close"].iloc[-1], abs=0.5 / series.scale)
+
+
+def test_scale_shrinks_for_large_prices():
+    """int32 범위를 넘지 않도록 큰 가격은 배율을 줄이고, 오차 한도도 그만큼 커짐"""
+    df = daily_prices(100, seed=8, base=2_000_000.0)
+    series = PriceSeries.from_frame(df)
+    assert series.scale == choose_scale(df.to_numpy().ravel()) < MAX_SCALE
+    assert np.abs(series.raw("High")).max() < INT32_MAX
+    assert (series.to_frame() - df).abs().to_numpy().max() <= 0.5 / series.scale + 1e-9
+
+
+def test_minute_ticks():
+    index = pd.date_range("2024-03-01 09:30", periods=120, freq="1min", name="Date")
+    df = pd.DataFrame({c: np.linspace(2000, 2010, 120) for c in ("Open", "High", "Low", "Close")}, index=index)
+    series = PriceSeries.from_frame(df)
+    assert series.unit == 'm'
+    np.testing.assert_array_equal(series.dates, index.to_numpy("datetime64[ns]"))
+
+
+def test_arrow_round_trip_through_memory_map(tmp_path):
+    df = daily_prices(300, seed=9)
+    series = PriceSeries.from_frame(df)
+    path = str(tmp_path / "series.arrow")
+    table = series.to_arrow()
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    restored = PriceSeries.from_arrow(pa.ipc.open_file(pa.memory_map(path, "r")).read_all())
+    assert (restored.scale, restored.unit, restored.columns) == (series.scale, series.unit, series.columns)
+    np.testing.assert_array_equal(restored.ticks, series.ticks)
+    for column in series.columns:
+        np.testing.assert_array_equal(restored.raw(column), series.raw(column))
+        assert not restored.raw(column).flags.writeable
+
+
+def test_between_is_inclusive_view():
+    df = daily_prices(200, seed=10)
+    series = PriceSeries.from_frame(df)
+    start, end = df.index[20], df.index[80]
+    part = series.between(start, end)
+    np.testing.assert_array_equal(part.dates, df.loc[start:end].index.to_numpy("datetime64[ns]"))
+    assert np.shares_memory(part.raw("Close"), series.raw("Close"))
+    # 거래일이 아닌 경계는 그 안쪽 거래일까지 (2020-01-04는 토요일, 01-06은 월요일)
+    assert len(series.between("2020-01-04", "2020-01-05")) == 0
+    assert series.between("2020-01-04", "2020-01-06").dates[0] == np.datetime64("2020-01-06")
+    assert len(series.between(end=df.index[9])) == 10
+    assert len(series.between(start=df.index[-3])) == 3
+    assert len(series.between("2100-01-01")) == 0
+
+
+def test_rows_with_missing_prices_are_dropped():
+    """NaN은 정수로 담을 수 없어 해당 행이 빠짐 - 날짜로 맞추면 나머지 값은 그대로"""
+    df = daily_prices(50, seed=11)
+    df.iloc[[3, 10], df.columns.get_loc("High")] = np.nan
+    series = PriceSeries.from_frame(df)
+    assert len(series) == len(df) - 2
+    kept = df.dropna()
+    np.testing.assert_array_equal(series.dates, kept.index.to_numpy("datetime64[ns]"))
+    np.testing.assert_allclose(series.values("Close"), kept["Close"].to_numpy(), atol=0.5 / series.scale)
+
+
+def test_empty_frame():
+    empty = pd.DataFrame(columns=["Open", "High", "Low", "Close"], index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+    series = PriceSeries.from_frame(empty)
+    assert len(series) == 0 and series.to_frame().empty
+    assert len(PriceSeries.from_arrow(series.to_arrow())) == 0
@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+import threading
+import subprocess
+
+import pytest
+
+from helpers import FakeSource, daily_prices
+from ui import price_store, price_service
+
+
+class SlowSource(FakeSource):
+    """요청마다 잠시 멈춰 여러 스레드가 동시에 갱신에 들어오도록 하는 가짜 피드"""
+
+    def fetch(self, ticker, start, end):
+        time.sleep(0.2)
+        return super().fetch(ticker, start, end)
+
+
+def _load_concurrently(count=8):
+    results = []
+    barrier = threading.Barrier(count)
+
+    def load():
+        barrier.wait()
+        results.append(len(price_service.load_series("GC=F")))
+
+    threads = [threading.Thread(target=load) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_cold_start_refreshes_once(price_env):
+    """스냅샷이 없을 때 동시에 들어온 세션 중 하나만 가져오고 나머지는 기다렸다가 같은 스냅샷을 읽음"""
+    history = daily_prices(300)
+    source = SlowSource(history)
+    price_store._stores["GC=F"] = price_store.PriceStore("GC=F", source=source)
+
+    assert _load_concurrently() == [len(history)] * 8
+    assert len(source.calls) == 1
+
+
+def test_stale_snapshot_served_while_one_session_refreshes(price_env):
+    """스냅샷이 오래됐으면 한 세션만 갱신하고 나머지는 기다리지 않고 기존 스냅샷을 사용"""
+    history = daily_prices(300)
+    source = SlowSource(history.iloc[:-5])
+    price_store._stores["GC=F"] = price_store.PriceStore("GC=F", source=source)
+    price_service.refresh("GC=F")
+    source.calls.clear()
+    source.df = history
+
+    old = time.time() - 2 * price_service.MAX_AGE
+    for path in (price_service.snapshot_path("GC=F"), price_service.series_path("GC=F")):
+        os.utime(path, (old, old))
+
+    results = _load_concurrently()
+    assert len(source.calls) == 1
+    assert set(results) <= {len(history) - 5, len(history)}
+    assert len(price_service.load_series("GC=F")) == len(history)
+
+
+def test_background_refresh_waits_for_another_writer(price_env):
+    """갱신 프로세스/모델 업데이트의 refresh_many도 같은 잠금을 거쳐, 다른 쪽이 쓰는 동안 기다림"""
+    source = price_env("GC=F", daily_prices(300))
+    done = threading.Event()
+
+    with price_service._refresh_guard():
+        thread = threading.Thread(target=lambda: (price_service.refresh_many(["GC=F"]), done.set()))
+        thread.start()
+        assert not done.wait(0.3)
+        assert source.bulk_calls == []
+    thread.join(5)
+    assert done.is_set() and len(source.bulk_calls) == 1
+
+
+@pytest.mark.skipif(price_service.fcntl is None, reason="파일 잠금은 POSIX에서만 사용")
+def test_refresh_waits_for_writer_in_another_process(price_env):
+    source = price_env("GC=F", daily_prices(300))
+    os.makedirs(price_service.SNAPSHOT_DIR, exist_ok=True)
+    holder = subprocess.Popen([sys.executable, "-c", (
+        "import fcntl, sys, time\n"
+        "f = open(sys.argv[1], 'w')\n"
+        "fcntl.flock(f, fcntl.LOCK_EX)\n"
+        "print('locked', flush=True)\n"
+        "time.sleep(0.5)\n"
+    ), os.path.join(price_service.SNAPSHOT_DIR, ".refresh.lock")], stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        started = time.perf_counter()
+        price_service.refresh("GC=F")
+        assert time.perf_counter() - started > 0.2
+        assert len(source.calls) == 1
+    finally:
+        holder.wait(5)
@@ -0,0 +1,135 @@
+import os
+import threading
+import pandas as pd
+import pandas.testing as tm
+
+from helpers import daily_prices, FakeSource
+from ui.price_store import PriceStore, CsvSource, sync_many
+from ui import price_store
+
+HISTORY = daily_prices(300, start="2023-01-02")
+CUTOFF = HISTORY.index[199]  # 첫 동기화 때 피드에 있는 마지막 날
+
+
+def make_store(tmp_path, source):
+    return PriceStore("GC=F", source=source, store_dir=str(tmp_path / "store"))
+
+
+def test_first_sync_downloads_full_history(tmp_path):
+    source = FakeSource(HISTORY.loc[:CUTOFF])
+    df = make_store(tmp_path, source).sync(end="2030-01-01")
+    tm.assert_frame_equal(df, HISTORY.loc[:CUTOFF], check_freq=False)
+    assert source.calls == [("GC=F", "2004-01-01", "2030-01-01")]
+
+
+def test_incremental_sync_appends_only_new_rows(tmp_path):
+    source = FakeSource(HISTORY.loc[:CUTOFF])
+    store = make_store(tmp_path, source)
+    store.sync(end="2030-01-01")
+
+    # 피드가 이미 저장된 날짜를 다시 돌려줘도(시작일 경계, 정정 데이터) 중복 없이 새 날짜만 추가
+    source.df = HISTORY
+    source.fetch = lambda ticker, start, end: HISTORY.iloc[150:]
+    df = store.sync(end="2030-01-01")
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+    tm.assert_frame_equal(df, HISTORY, check_freq=False)
+    tm.assert_frame_equal(store.read(), HISTORY, check_freq=False)
+
+
+def test_restart_resumes_from_stored_max_date(tmp_path):
+    make_store(tmp_path, FakeSource(HISTORY.loc[:CUTOFF])).sync(end="2030-01-01")
+
+    source = FakeSource(HISTORY)  # 새 프로세스: 메모리 상태 없이 저장소 파일만 남아 있음
+    df = make_store(tmp_path, source).sync(end="2030-01-01")
+    assert source.calls == [("GC=F", (CUTOFF + pd.Timedelta(days=1)).strftime("%Y-%m-%d"), "2030-01-01")]
+    tm.assert_frame_equal(df, HISTORY, check_freq=False)
+
+
+def test_up_to_date_store_does_not_fetch(tmp_path):
+    source = FakeSource(HISTORY)
+    store = make_store(tmp_path, source)
+    store.sync(end="2030-01-01")
+    store.sync(end=HISTORY.index[-1] + pd.Timedelta(days=1))
+    assert len(source.calls) == 1
+
+
+def test_empty_or_failed_fetch_keeps_existing_data(tmp_path):
+    source = FakeSource(HISTORY.loc[:CUTOFF])
+    store = make_store(tmp_path, source)
+    stored = store.sync(end="2030-01-01")
+
+    df = store.sync(end="2030-01-01")  # 피드에 새 날짜가 없음
+    tm.assert_frame_equal(df, stored, check_freq=False)
+
+    source.fail = True
+    df = store.sync(end="2030-01-01")  # 요청 실패
+    tm.assert_frame_equal(df, stored, check_freq=False)
+    tm.assert_frame_equal(store.read(), stored, check_freq=False)
+
+
+def test_csv_source_as_feed(tmp_path):
+    path = tmp_path / "feed.csv"
+    HISTORY.to_csv(path, sep=";")
+    df = make_store(tmp_path, CsvSource(str(path))).sync(end="2030-01-01")
+    tm.assert_frame_equal(df, HISTORY, check_freq=False, atol=1e-9)
+
+
+def _bulk_stores(tmp_path, monkeypatch, source, tickers):
+    monkeypatch.setattr(price_store, "_stores", {
+        ticker: PriceStore(ticker, source=source, store_dir=str(tmp_path / "store")) for ticker in tickers
+    })
+    return price_store._stores
+
+
+def test_sync_many_uses_one_bulk_request(tmp_path, monkeypatch):
+    source = FakeSource(HISTORY)
+    stores = _bulk_stores(tmp_path, monkeypatch, source, ("GC=F", "SI=F"))
+    for store in stores.values():
+        store.write(HISTORY.loc[:CUTOFF])
+
+    frames = sync_many(["GC=F", "SI=F"], end="2030-01-01")
+    next_day = (CUTOFF + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    assert source.bulk_calls == [(["GC=F", "SI=F"], next_day, "2030-01-01")]
+    for df in frames.values():
+        assert df.index.is_unique
+        tm.assert_frame_equal(df, HISTORY, check_freq=False)
+
+
+def test_sync_many_fetches_empty_ticker_separately(tmp_path, monkeypatch):
+    """저장된 행이 없는 티커 때문에 다른 티커까지 2004년부터 다시 받지 않음"""
+    source = FakeSource(HISTORY)
+    stores = _bulk_stores(tmp_path, monkeypatch, source, ("GC=F", "SI=F", "PL=F"))
+    stores["SI=F"].write(HISTORY.loc[:CUTOFF])
+    stores["PL=F"].write(HISTORY.loc[:CUTOFF])
+
+    frames = sync_many(["GC=F", "SI=F", "PL=F"], end="2030-01-01")
+    next_day = (CUTOFF + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    assert source.bulk_calls == [
+        (["GC=F"], "2004-01-01", "2030-01-01"),
+        (["SI=F", "PL=F"], next_day, "2030-01-01"),
+    ]
+    for df in frames.values():
+        tm.assert_frame_equal(df, HISTORY, check_freq=False)
+
+
+def test_concurrent_writes_never_leave_a_torn_file(tmp_path):
+    """여러 쓰기가 겹쳐도 각자 다른 임시 파일에 쓰므로 저장 파일은 항상 어느 한 쓰기의 온전한 결과"""
+    store = make_store(tmp_path, FakeSource(HISTORY))
+    frames = [HISTORY.iloc[:100 + i] for i in range(8)]
+    errors = []
+
+    def write(df):
+        try:
+            for _ in range(5):
+                store.write(df)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(df,)) for df in frames]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(store.read()) in {len(df) for df in frames}
+    assert os.listdir(tmp_path / "store") == [os.path.basename(store.path)]
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+
+from helpers import daily_prices
+from ui.range_index import PriceRangeIndex, BLOCK
+
+PRICES = daily_prices(1000, start="2020-01-01", seed=7)
+
+
+def expected_stats(df):
+    return df.describe().loc[['count', 'mean', 'std', 'min', 'max']]
+
+
+def test_stats_match_pandas_for_many_ranges():
+    """누적합/희소 테이블로 계산한 구간 통계가 잘라낸 DataFrame의 describe()와 같아야 함"""
+    index = PriceRangeIndex(PRICES)
+    rng = np.random.default_rng(0)
+    dates = PRICES.index
+    # 블록 경계 안/걸침/여러 블록, 양 끝, 주말(데이터 없는 날)을 포함
+    cases = [(0, len(dates) - 1), (0, 0), (3, BLOCK - 2), (BLOCK - 1, BLOCK), (10, 5 * BLOCK + 7)]
+    cases += [tuple(sorted(rng.integers(0, len(dates), 2))) for _ in range(50)]
+    for i, j in cases:
+        start, end = dates[i], dates[j]
+        tm.assert_frame_equal(index.stats(start, end), expected_stats(PRICES.loc[start:end]), check_exact=False, rtol=1e-9)
+
+
+def test_range_bounds_include_both_ends_and_skip_missing_days():
+    index = PriceRangeIndex(PRICES)
+    saturday = pd.Timestamp("2020-01-04")
+    view = index.view(saturday, "2020-01-10")
+    tm.assert_frame_equal(view, PRICES.loc[saturday:"2020-01-10"])
+    assert view.index[0] == pd.Timestamp("2020-01-06") and view.index[-1] == pd.Timestamp("2020-01-10")
+
+
+def test_empty_range():
+    stats = PriceRangeIndex(PRICES).stats("2030-01-01", "2030-12-31")
+    assert (stats.loc['count'] == 0).all() and stats.loc['mean'].isna().all()
+
+
+def test_describe_matches_pandas():
+    tm.assert_frame_equal(PriceRangeIndex(PRICES).describe(), PRICES.describe())
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from helpers import daily_prices
+from ui.rollups import Rollups, PERIODS, get_rollups
+from ui import rollups
+
+PRICES = daily_prices(800, start="2020-01-01", seed=9)
+OHLC = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
+RESAMPLE = {'주별': 'W', '월별': 'ME', '분기별': 'QE', '년별': 'YE'}
+
+
+def assert_matches_resample(bars, daily, period):
+    expected = daily.resample(RESAMPLE[period]).agg(OHLC).dropna()
+    assert list(bars.index) == list(expected.index)
+    np.testing.assert_allclose(bars.to_numpy(), expected.to_numpy(), rtol=0, atol=0)
+
+
+@pytest.mark.parametrize("period", list(PERIODS))
+def test_rollups_match_resample(period):
+    assert_matches_resample(Rollups(PRICES).get(period), PRICES, period)
+
+
+@pytest.mark.parametrize("split", [1, 100, 433, 799])
+def test_incremental_append_matches_resample(split):
+    """일부 이력으로 만든 롤업에 나머지 일봉을 여러 번 나눠 추가해도 전체 resample 결과와 같아야 함"""
+    rollup = Rollups(PRICES.iloc[:split])
+    for start in range(split, len(PRICES), 37):
+        rollup.append(PRICES.iloc[start:start + 37])
+    for period in PERIODS:
+        assert_matches_resample(rollup.get(period), PRICES, period)
+
+
+def test_get_rollups_extends_cached_rollups(monkeypatch):
+    monkeypatch.setattr(rollups, "_rollups", {})
+    first = get_rollups("GC=F", PRICES.iloc[:500])
+    second = get_rollups("GC=F", PRICES)
+    assert first is second
+    for period in PERIODS:
+        assert_matches_resample(second.get(period), PRICES, period)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from helpers import daily_prices  # noqa: E402
+from ui.train_arima import fit_order, search_orders, leaderboard_path  # noqa: E402
+
+
+def test_fit_order_records_any_statsmodels_error(monkeypatch):
+    import statsmodels.tsa.arima.model as arima_module
+
+    class Broken:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(arima_module, "ARIMA", Broken)
+    row, slim = fit_order(np.arange(50, dtype="float64"), (1, 1, 1))
+    assert slim is None and row["status"] == "error: RuntimeError: boom" and not row["converged"]
+
+
+def test_search_picks_best_converged_order():
+    closes = daily_prices(300, seed=10)["Close"].to_numpy()
+    leaderboard, best = search_orders(closes, p_values=range(2), d_values=range(1, 2), q_values=range(2), workers=2)
+    assert len(leaderboard) == 4
+    top = leaderboard.iloc[0]
+    assert top["converged"] and tuple(best["order"]) == tuple(top["order"])
+    converged = leaderboard[leaderboard["converged"]]
+    assert top["aic"] == converged["aic"].min()
+
+
+def test_leaderboard_path_is_per_ticker():
+    assert leaderboard_path("GC=F") != leaderboard_path("SI=F")
+    assert leaderboard_path("SI=F").endswith("SI_F_arima_leaderboard.csv")
@@ -0,0 +1,50 @@
+import os
+import json
+
+ASSETS_PATH = "data/assets.json"  # 있으면 아래 기본 목록 대신 사용 (같은 형식의 JSON)
+
+# 추적할 자산 목록 - 자산을 추가할 때는 여기(또는 data/assets.json)에 한 줄만 추가하면 됨
+#   symbol: Yahoo Finance 티커, name: 화면 이름, unit: 'oz'(트로이온스당 USD, 그램당 환산/예측 대상), 'share', 'fx'
+DEFAULT_ASSETS = [
+    {"symbol": "GC=F", "name": "금", "unit": "oz"},
+    {"symbol": "SI=F", "name": "은", "unit": "oz"},
+    {"symbol": "PL=F", "name": "백금", "unit": "oz"},
+    {"symbol": "PA=F", "name": "팔라듐", "unit": "oz"},
+    {"symbol": "GLD", "name": "금 ETF (GLD)", "unit": "share"},
+    {"symbol": "KRW=X", "name": "USD/KRW", "unit": "fx"},
+    {"symbol": "EUR=X", "name": "USD/EUR", "unit": "fx"},
+    {"symbol": "JPY=X", "name": "USD/JPY", "unit": "fx"},
+]
+
+# 다른 통화 기준 가격: 이름 -> (USD 가격 티커, USD 대비 환율 티커) - 정렬된 행렬에서 열 곱으로 계산
+DEFAULT_DERIVED = {
+    "금 (KRW)": ("GC=F", "KRW=X"),
+    "금 (EUR)": ("GC=F", "EUR=X"),
+    "금 (JPY)": ("GC=F", "JPY=X"),
+}
+
+
+def load_assets(path=ASSETS_PATH):
+    """(자산 목록, 파생 가격 정의) 반환 - path의 JSON({"assets": [...], "derived": {...}})이 있으면 그것을 사용"""
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        derived = {name: tuple(pair) for name, pair in config.get("derived", {}).items()}
+        return config["assets"], derived
+    return DEFAULT_ASSETS, DEFAULT_DERIVED
+
+
+def symbols(unit=None):
+    """설정된 티커 목록 (unit을 주면 해당 단위만)"""
+    assets, _ = load_assets()
+    return [a["symbol"] for a in assets if unit is None or a["unit"] == unit]
+
+
+def asset_name(symbol):
+    assets, _ = load_assets()
+    return next((a["name"] for a in assets if a["symbol"] == symbol), symbol)
+
+
+def safe_name(symbol):
+    """티커를 파일 이름으로 쓸 수 있게 변환 (GC=F -> GC_F)"""
+    return symbol.replace("=", "_").replace("/", "_").replace("^", "_")
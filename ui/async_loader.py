@@ -0,0 +1,83 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="loader")  # 프로세스 전체가 공유하는 I/O 스레드 풀
+
+
+def _load_prices(ticker):
+    from ui.price_service import load_shared
+    return load_shared(ticker)
+
+
+def _load_series(ticker):
+    from ui.price_service import load_series
+    return load_series(ticker)
+
+
+def _load_assets():
+    from ui.assets import symbols
+    from ui.price_service import load_series_many
+    return load_series_many(symbols())
+
+
+def _load_model(name):
+    from ui.model_registry import registry
+    return registry.get(name)
+
+
+def _load_fx():
+    from ui.fx import fx_provider
+    return fx_provider.rates()
+
+
+def default_sources():
+    """페이지들이 필요로 하는 업스트림 요청: {이름: (함수, 제한 시간(초))}
+
+    각 함수는 실행될 때 필요한 모듈만 import하므로, 선택한 소스의 의존성만 불러온다.
+    """
+    return {
+        "GC=F": (lambda: _load_prices('GC=F'), 30),  # 데이터분석 페이지
+        "GLD": (lambda: _load_series('GLD'), 30),  # 홈 페이지 (압축 시계열)
+        "GC=F/series": (lambda: _load_series('GC=F'), 30),  # 가격예측 페이지 비교 모델
+        "assets": (_load_assets, 60),  # 자산 비교 페이지 (설정된 모든 자산을 일괄 요청 한 번으로)
+        "arima": (lambda: _load_model("arima"), 30),  # 가격예측 페이지 모델
+        "fx": (_load_fx, 6),  # 가격예측 페이지 환율
+    }
+
+
+async def _run(name, func, timeout):
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(loop.run_in_executor(_executor, func), timeout)
+    except asyncio.TimeoutError as e:
+        # 스레드는 계속 실행되어 각 캐시를 채우므로, 페이지는 나중에 같은 결과를 바로 받게 됨
+        result = e
+        print(f"⚠ {name}: {timeout}초 안에 응답이 없어 건너뜁니다.")
+    except Exception as e:
+        result = e
+        print(f"⚠ {name} 불러오기 실패: {e}")
+    return name, result, time.perf_counter() - started
+
+
+async def fan_out(sources):
+    """모든 소스를 동시에 실행하고 {이름: (결과 또는 예외, 걸린 시간)}을 반환"""
+    results = await asyncio.gather(*(_run(name, func, timeout) for name, (func, timeout) in sources.items()))
+    return {name: (result, seconds) for name, result, seconds in results}
+
+
+def load_all(sources=None):
+    """동기 코드(Streamlit 스크립트)에서 호출하는 진입점 - 전체 시간은 가장 느린 소스 하나의 시간과 같음"""
+    return asyncio.run(fan_out(sources or default_sources()))
+
+
+def warm(sources=None):
+    """각 소스의 캐시를 채우기만 하고 {이름: {"seconds": 걸린 시간, "error": 오류 메시지 또는 None}} 반환
+
+    결과 객체(DataFrame, 메모리 맵, 모델)는 돌려주지 않으므로, 오래 보관해도 갱신 전 스냅샷을 붙잡지 않는다.
+    """
+    return {
+        name: {"seconds": round(seconds, 3), "error": (str(result) or type(result).__name__) if isinstance(result, Exception) else None}
+        for name, (result, seconds) in load_all(sources).items()
+    }
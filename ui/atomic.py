@@ -0,0 +1,20 @@
+import os
+import threading
+
+
+def temp_path(path):
+    """path와 같은 디렉터리의 임시 경로 - 프로세스/스레드마다 달라 동시에 쓰는 쪽끼리 섞이지 않음"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def atomic_write(path, write):
+    """write(임시 경로)로 기록한 뒤 path로 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함 (실패하면 임시 파일 삭제)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = temp_path(path)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
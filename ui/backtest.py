@@ -0,0 +1,143 @@
+import os
+import time
+import argparse
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from ui.forecast_engine import LinearTrendForecaster
+
+DATA_PATH = "data/gold_price_data.csv"
+RESULT_PATH = os.path.join("model", "backtest_results.csv")
+HORIZONS = (1, 5, 20, 60)
+
+
+def model_specs(orders=((5, 2, 5),), linear_window=250):
+    """백테스트할 모델 목록: {이름: (종류, 설정)} - 워커 프로세스로 넘길 수 있도록 단순한 값만 사용"""
+    specs = {f"ARIMA{tuple(order)}": ("arima", tuple(order)) for order in orders}
+    specs[f"선형 추세({linear_window}일)"] = ("linear", linear_window)
+    specs["Naive(마지막 값)"] = ("naive", None)
+    return specs
+
+
+def _import_models():
+    """워커 프로세스 초기화: 모델 라이브러리를 미리 import해 첫 학습 시간에 import 시간(수 초)이 섞이지 않도록 함"""
+    from statsmodels.tsa.arima.model import ARIMA  # noqa: F401
+    from sklearn.linear_model import LinearRegression  # noqa: F401
+
+
+def _fit_predict(kind, setting, train, steps):
+    """모델 하나를 학습하고 steps일 예측 - (예측값, 학습 시간, 예측 시간, 수렴 여부), 시간에는 학습/예측만 포함"""
+    from statsmodels.tsa.arima.model import ARIMA  # 워커 초기화에서 이미 import됨
+
+    started = time.perf_counter()
+    if kind == "arima":
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fitted = ARIMA(train.to_numpy(), order=setting).fit()
+        fit_seconds = time.perf_counter() - started
+        converged = bool((fitted.mle_retvals or {}).get("converged", False))
+        started = time.perf_counter()
+        forecast = np.asarray(fitted.forecast(steps))
+    elif kind == "linear":
+        fitted = LinearTrendForecaster(train, window=setting)
+        fit_seconds = time.perf_counter() - started
+        converged = True
+        started = time.perf_counter()
+        forecast = fitted.predict(steps)[:, 0]
+    else:
+        fit_seconds = time.perf_counter() - started
+        converged = True
+        started = time.perf_counter()
+        forecast = np.full(steps, train.iloc[-1])
+    return forecast, fit_seconds, time.perf_counter() - started, converged
+
+
+def evaluate_origin(series, origin, specs, horizons):
+    """기준 시점 하나에서 모든 모델을 학습/예측하고 오차 행 목록을 반환 (워커 프로세스에서 실행)
+
+    학습/예측이 실패한 모델은 오차 없이 상태만 기록하고, 나머지 모델과 기준 시점은 계속 평가한다.
+    """
+    train = series.iloc[:origin]
+    horizons = np.asarray(horizons)
+    actual = series.to_numpy()[origin + horizons - 1]
+    rows = []
+    for name, (kind, setting) in specs.items():
+        try:
+            forecast, fit_seconds, forecast_seconds, converged = _fit_predict(kind, setting, train, int(horizons.max()))
+            predicted, status = forecast[horizons - 1], "ok"
+        except Exception as e:  # statsmodels/numpy의 어떤 오류든 이 (모델, 기준 시점)만 실패로 기록
+            print(f"⚠ {name} @ {series.index[origin - 1].date()} 실패: {e}")
+            predicted, status = np.full(len(horizons), np.nan), f"error: {type(e).__name__}: {e}"
+            fit_seconds = forecast_seconds = np.nan
+            converged = False
+        for horizon, pred, real in zip(horizons, predicted, actual):
+            rows.append({
+                "모델": name, "기준일": series.index[origin - 1], "기간(일)": int(horizon),
+                "오차": pred - real, "실제": real,
+                "학습 시간(s)": fit_seconds, "예측 시간(s)": forecast_seconds,
+                "수렴": converged, "상태": status,
+            })
+    return rows
+
+
+def walk_forward(series, specs, horizons=HORIZONS, min_train=1000, step=60, workers=None):
+    """롤링 기준 시점 워크포워드 평가를 기준 시점별로 병렬 실행하고 모델 x 기간 요약표를 반환
+
+    MAE/MAPE는 성공한 기준 시점만으로 계산하고, 실패한 기준 시점과 수렴하지 않은 학습은 개수로 따로 표시한다.
+    """
+    max_horizon = max(horizons)
+    origins = list(range(min_train, len(series) - max_horizon + 1, step))
+    if not origins:
+        raise ValueError("데이터가 min_train + 최대 예측 기간보다 짧습니다.")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_import_models) as executor:
+        futures = [executor.submit(evaluate_origin, series, origin, specs, horizons) for origin in origins]
+        rows = [row for future in futures for row in future.result()]
+
+    detail = pd.DataFrame(rows)
+    detail["절대 오차"] = detail["오차"].abs()
+    detail["APE"] = detail["절대 오차"] / detail["실제"].abs()
+    detail["실패"] = detail["상태"] != "ok"
+    detail["미수렴"] = ~detail["실패"] & ~detail["수렴"]
+    detail["성공 기준일"] = detail["기준일"].where(~detail["실패"])
+    summary = detail.groupby(["모델", "기간(일)"], sort=False).agg(**{
+        "MAE": ("절대 오차", "mean"),
+        "MAPE": ("APE", "mean"),
+        "기준일 수": ("성공 기준일", "nunique"),
+        "실패 수": ("실패", "sum"),
+        "미수렴 수": ("미수렴", "sum"),
+    })
+    timing = detail.drop_duplicates(["모델", "기준일"]).groupby("모델", sort=False)[["학습 시간(s)", "예측 시간(s)"]].mean()
+    return summary.join(timing, on="모델").reset_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="금 가격 예측 모델 워크포워드 백테스트")
+    parser.add_argument("--csv", default=DATA_PATH, help="일별 가격 CSV (Date;Open;High;Low;Close)")
+    parser.add_argument("--orders", nargs="+", default=["5,2,5"], help="ARIMA 차수 목록 (예: 5,2,5 2,1,2)")
+    parser.add_argument("--linear-window", type=int, default=250)
+    parser.add_argument("--horizons", nargs="+", type=int, default=list(HORIZONS))
+    parser.add_argument("--min-train", type=int, default=1000, help="첫 기준 시점까지의 학습 데이터 수")
+    parser.add_argument("--step", type=int, default=60, help="기준 시점 간격 (거래일)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--output", default=RESULT_PATH)
+    args = parser.parse_args()
+
+    series = pd.read_csv(args.csv, sep=";", parse_dates=["Date"], index_col="Date")["Close"]
+    orders = [tuple(int(v) for v in order.split(",")) for order in args.orders]
+    specs = model_specs(orders, args.linear_window)
+
+    started = time.perf_counter()
+    summary = walk_forward(series, specs, args.horizons, args.min_train, args.step, args.workers)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    summary.to_csv(args.output, index=False, encoding="utf-8-sig")
+
+    pd.set_option("display.width", 200)
+    print(summary.to_string(index=False, float_format=lambda v: f"{v:,.4f}"))
+    print(f"\n✅ {time.perf_counter() - started:.1f}s, 결과: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import threading
+import numpy as np
+import pandas as pd
+
+MAX_GAP_DAYS = 5  # 거래일이 달라 값이 없는 날은 이 일수까지만 직전 값으로 채움 (휴장일/시차 보정)
+
+
+def _daily(series, column='Close'):
+    """PriceSeries를 (일 번호 배열, 값 배열)로 변환 (분 단위 시계열이면 하루의 마지막 값 사용)"""
+    ticks = series.ticks.astype(np.int64)
+    values = series.values(column)
+    if series.unit == 'm':
+        ticks = ticks // 1440
+        last = np.r_[ticks[1:] != ticks[:-1], True] if len(ticks) else np.empty(0, dtype=bool)
+        ticks, values = ticks[last], values[last]
+    return ticks, values
+
+
+class AssetMatrix:
+    """여러 자산의 종가를 같은 날짜 축에 맞춘 (날짜 x 자산) float64 행렬
+
+    상관관계, 비율, 정규화 수익률을 모두 이 행렬 하나에 대한 배열 연산으로 계산하므로
+    자산이 늘어나도 자산마다 따로 DataFrame을 만들고 병합할 필요가 없다.
+    """
+
+    def __init__(self, days, names, values):
+        self.days = days  # int64 일 번호 (1970-01-01 기준)
+        self.names = list(names)
+        self.values = values  # (날짜 수, 자산 수), 값이 없으면 NaN
+
+    @classmethod
+    def from_series(cls, series_by_name, max_gap=MAX_GAP_DAYS):
+        """{이름: PriceSeries}를 합집합 날짜 축으로 정렬 (각 자산의 직전 값을 이진 탐색으로 찾음)"""
+        daily = {name: _daily(series) for name, series in series_by_name.items() if len(series)}
+        days = np.unique(np.concatenate([ticks for ticks, _ in daily.values()])) if daily else np.empty(0, dtype=np.int64)
+        values = np.full((len(days), len(daily)), np.nan)
+        for j, (ticks, column) in enumerate(daily.values()):
+            positions = np.searchsorted(ticks, days, side="right") - 1
+            valid = positions >= 0
+            valid[valid] &= days[valid] - ticks[positions[valid]] <= max_gap
+            values[valid, j] = column[positions[valid]]
+        return cls(days, daily.keys(), values)
+
+    @property
+    def dates(self):
+        return pd.DatetimeIndex(self.days.astype("datetime64[D]"), name="Date")
+
+    def column(self, name):
+        return self.values[:, self.names.index(name)]
+
+    def with_derived(self, derived):
+        """파생 가격 열 추가: {이름: (가격 열, 환율 열)} -> 가격 x 환율 (둘 다 있는 경우만)"""
+        pairs = {name: pair for name, pair in derived.items() if pair[0] in self.names and pair[1] in self.names}
+        if not pairs:
+            return self
+        extra = np.column_stack([self.column(price) * self.column(fx) for price, fx in pairs.values()])
+        return AssetMatrix(self.days, self.names + list(pairs), np.hstack([self.values, extra]))
+
+    def select(self, names, start=None, end=None):
+        """일부 자산/기간만 (기간은 이진 탐색 슬라이스)"""
+        lo = 0 if start is None else int(np.searchsorted(self.days, pd.Timestamp(start).value // 86_400_000_000_000))
+        hi = len(self.days) if end is None else int(np.searchsorted(self.days, pd.Timestamp(end).value // 86_400_000_000_000, side="right"))
+        columns = [self.names.index(name) for name in names]
+        return AssetMatrix(self.days[lo:hi], names, self.values[lo:hi][:, columns])
+
+    def log_returns(self):
+        """일간 로그 수익률 행렬 (첫 행과 값이 없는 칸은 NaN)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(self.values), axis=0)
+        return np.vstack([np.full((1, len(self.names)), np.nan), returns])
+
+    def correlation(self, min_periods=20):
+        """수익률 상관계수 행렬 - 자산 쌍마다 둘 다 값이 있는 날만 사용 (행렬 곱으로 모든 쌍을 한 번에 계산)"""
+        x = self.log_returns()
+        mask = np.isfinite(x).astype("float64")
+        x = np.where(mask > 0, x, 0.0)
+
+        n = mask.T @ mask  # 쌍별 유효 일수
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sum_i = x.T @ mask  # [i, j]: j도 값이 있는 날의 i 합계
+            sum_sq_i = (x * x).T @ mask
+            cov = x.T @ x / n - (sum_i / n) * (sum_i.T / n)
+            var_i = sum_sq_i / n - (sum_i / n) ** 2
+            corr = cov / np.sqrt(var_i * var_i.T)
+        corr[n < min_periods] = np.nan
+        return pd.DataFrame(corr, index=self.names, columns=self.names)
+
+    def rolling_correlation(self, a, b, window=60):
+        """두 자산 수익률의 이동 상관계수 (누적합 기반, 둘 다 값이 있는 날만)"""
+        x = self.log_returns()[:, [self.names.index(a), self.names.index(b)]]
+        valid = np.isfinite(x).all(axis=1)
+        x, dates = x[valid], self.dates[valid]
+        if len(x) < window:
+            return pd.Series(dtype="float64", index=pd.DatetimeIndex([], name="Date"), name=f"{a} / {b}")
+
+        def rolling(values):
+            cumsum = np.concatenate([[0.0], np.cumsum(values)])
+            return cumsum[window:] - cumsum[:-window]
+
+        sa, sb = rolling(x[:, 0]), rolling(x[:, 1])
+        cov = rolling(x[:, 0] * x[:, 1]) - sa * sb / window
+        var_a = rolling(x[:, 0] ** 2) - sa * sa / window
+        var_b = rolling(x[:, 1] ** 2) - sb * sb / window
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.sqrt(var_a * var_b)
+        return pd.Series(corr, index=dates[window - 1:], name=f"{a} / {b}")
+
+    def ratio(self, a, b):
+        """a 가격 / b 가격 (예: 금/은 비율)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = self.column(a) / self.column(b)
+        return pd.Series(values, index=self.dates, name=f"{a} / {b}").dropna()
+
+    def rebased(self, base=100.0):
+        """각 자산의 첫 값을 base로 맞춘 상대 성과 (직전 값으로 채운 뒤 계산)"""
+        filled = pd.DataFrame(self.values, index=self.dates, columns=self.names).ffill()
+        first = filled.bfill().iloc[0].to_numpy()
+        return filled / first * base
+
+    def to_frame(self):
+        return pd.DataFrame(self.values, index=self.dates, columns=self.names)
+
+
+_matrices = {}  # {(티커 튜플, 파생 이름 튜플): (PriceSeries 튜플, AssetMatrix)}
+_lock = threading.Lock()
+
+
+def get_asset_matrix(series_by_ticker, derived=None):
+    """스냅샷이 바뀌지 않았으면(같은 PriceSeries 객체면) 이전에 정렬한 행렬을 그대로 재사용"""
+    key = (tuple(series_by_ticker), tuple(derived or ()))
+    series = tuple(series_by_ticker.values())
+    with _lock:
+        cached = _matrices.get(key)
+        if cached and all(a is b for a, b in zip(cached[0], series)):
+            return cached[1]
+        matrix = AssetMatrix.from_series(series_by_ticker)
+        if derived:
+            matrix = matrix.with_derived(derived)
+        _matrices[key] = (series, matrix)
+        return matrix
@@ -1,47 +1,50 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import yfinance as yf
-from datetime import datetime
 
-def fetch_gold_data(start_date="2004-01-01"):
-    """Yahoo Finance에서 2004년부터 현재까지 금 가격 데이터를 가져와 DataFrame 반환"""
-    end_date = datetime.now().strftime('%Y-%m-%d')  # 오늘 날짜까지 포함
-    df = yf.download('GC=F', start=start_date, end=end_date, progress=False)
-
-    if df.empty:
-        print("⚠ 데이터를 가져오지 못했습니다. 빈 데이터프레임을 반환합니다.")
-        return pd.DataFrame(columns=['Date', 'Open', 'High', 'Low', 'Close'])
-
-    df = df[['Open', 'High', 'Low', 'Close']].reset_index()
-    df.columns = ['Date', 'Open', 'High', 'Low', 'Close']
-
-    df['Date'] = pd.to_datetime(df['Date'])  
-    df.set_index("Date", inplace=True)
-    
-    return df
-
-@st.cache_data(ttl=3600)  # 1시간마다 데이터 갱신
-def load_data():
-    df = fetch_gold_data()
+from ui.price_service import load_shared
+from ui.rollups import get_rollups
+from ui.downsample import downsample_frame
+from ui.range_index import get_range_index
+from ui.indicators import get_indicators
+from ui.intraday import get_intraday_store, RESOLUTIONS
+from ui.metrics import metrics, timed
+from ui.assets import load_assets
+
+@timed("load_data")
+def load_data(ticker='GC=F'):
+    """공유 스냅샷(ui/price_service.py)에서 데이터를 읽음 - 모든 세션/워커가 한 벌의 데이터를 함께 사용"""
+    df = load_shared(ticker)
     if df.empty:
         st.warning("⚠ 데이터를 가져올 수 없습니다. 다시 시도해 주세요.")
     if not isinstance(df.index, pd.DatetimeIndex):
         df.index = pd.to_datetime(df.index)
     return df
 
+def format_stats(stats, currency):
+    """통계표 표시 형식: 가격 행은 소수점 2자리(통화 기호), count 행은 정수"""
+    return (stats.style.format(currency + "{:,.2f}")
+            .format("{:,.0f}", subset=pd.IndexSlice[["count"], :]))
+
 def aggregate_data(df, freq):
     if not isinstance(df.index, pd.DatetimeIndex):
         df.index = pd.to_datetime(df.index)
     return df.resample(freq).mean()
 
 def run_eda():
-    df = load_data()
+    # 분석할 자산 (ui/assets.py) - 아래의 롤업/지표/구간 인덱스 캐시는 모두 티커별로 따로 유지됨
+    assets, _ = load_assets()
+    asset = st.selectbox("📌 자산 선택", assets, format_func=lambda a: f"{a['name']} ({a['symbol']})")
+    ticker, name = asset['symbol'], asset['name']
+    currency = "" if asset['unit'] == 'fx' else "$"  # 환율은 달러 표시 없이
+    y_label = "환율" if asset['unit'] == 'fx' else "가격 (USD)"
+
+    df = load_data(ticker)
     if df.empty:
-        st.error("❌ 금 가격 데이터를 불러오는 데 실패했습니다.")
+        st.error(f"❌ {name} 가격 데이터를 불러오는 데 실패했습니다.")
         return
     
-    st.markdown("<p style='font-size:32px; font-weight:bold; color:#4B0082; text-align:center;'>📊 금 가격 데이터 분석</p>", unsafe_allow_html=True)
+    st.markdown(f"<p style='font-size:32px; font-weight:bold; color:#4B0082; text-align:center;'>📊 {name} 가격 데이터 분석</p>", unsafe_allow_html=True)
     
     # 데이터 개요 (카드 스타일)
     st.markdown("<p class='medium-font'>📌 데이터 개요</p>", unsafe_allow_html=True)
@@ -51,48 +54,88 @@ def run_eda():
     with col2:
         st.markdown(f"<div class='metric-card'><strong>📊 총 데이터 수</strong><br>{len(df):,}일</div>", unsafe_allow_html=True)
     with col3:
-        st.markdown(f"<div class='metric-card'><strong>💰 최근 종가</strong><br>${df['Close'].iloc[-1]:,.2f}</div>", unsafe_allow_html=True)
+        st.markdown(f"<div class='metric-card'><strong>💰 최근 종가</strong><br>{currency}{df['Close'].iloc[-1]:,.2f}</div>", unsafe_allow_html=True)
     
     # 기간별 그래프
-    st.markdown("<p class='medium-font'>⏳ 기간별 금 가격 추이</p>", unsafe_allow_html=True)
-    period = st.selectbox('📅 기간 선택', ['일별', '월별', '분기별', '년별'])
+    st.markdown(f"<p class='medium-font'>⏳ 기간별 {name} 가격 추이</p>", unsafe_allow_html=True)
+    period = st.selectbox('📅 기간 선택', ['일별', '주별', '월별', '분기별', '년별'])
 
+    @timed("create_gold_chart")
     def create_gold_chart(data, period):
-        if period == "일별":
-            resampled_data = data
-        elif period == "월별":
-            resampled_data = data.resample('M').last()
-        elif period == "분기별":
-            resampled_data = data.resample('Q').last()
-        else:  # 년별
-            resampled_data = data.resample('Y').last()
+        # 기간별 OHLC 봉은 데이터 갱신 시 미리 집계해 두었으므로 여기서는 조회만 함
+        resampled_data = get_rollups(ticker, data).get(period)
+        resampled_data = downsample_frame(resampled_data, 'Close')  # 브라우저로 보내는 점 개수 제한
         
-        fig = px.line(resampled_data, y='Close', title=f'📈 {period} 금 가격 추이', color_discrete_sequence=["#8B4513"])
-        fig.update_layout(xaxis_title="날짜", yaxis_title="가격 (USD)", template="plotly_dark")
+        fig = px.line(resampled_data, y='Close', title=f'📈 {period} {name} 가격 추이', color_discrete_sequence=["#8B4513"])
+        fig.update_layout(xaxis_title="날짜", yaxis_title=y_label, template="plotly_dark")
         return fig
 
     chart = create_gold_chart(df, period)
     st.plotly_chart(chart, use_container_width=True)
 
+    # 기술적 지표 (전체 이력은 한 번만 계산하고, 새 일봉은 증분으로 추가됨)
+    st.markdown("### 📉 기술적 지표")
+    indicators = get_indicators(ticker, df).frame
+    latest = indicators.iloc[-1]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"<div class='metric-card'><strong>📈 RSI (14일)</strong><br>{latest['RSI_14']:.1f}</div>", unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"<div class='metric-card'><strong>🌊 변동성 (20일, 연환산)</strong><br>{latest['Volatility_20']:.1%}</div>", unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"<div class='metric-card'><strong>📉 고점 대비 낙폭</strong><br>{latest['Drawdown']:.1%}</div>", unsafe_allow_html=True)
+
+    indicator_data = downsample_frame(indicators, 'Close')
+    fig_indicators = px.line(indicator_data, y=['Close', 'SMA_20', 'SMA_60', 'BB_Upper', 'BB_Lower'], title='📈 이동 평균 및 볼린저 밴드')
+    fig_indicators.update_layout(xaxis_title="날짜", yaxis_title=y_label, template="plotly_dark", legend_title_text="")
+    st.plotly_chart(fig_indicators, use_container_width=True)
+
+    # 분 단위 데이터 (날짜별 파일에서 필요한 날만 읽어 집계하므로 이력 길이와 관계없이 메모리 사용량이 일정함)
+    st.markdown(f"### ⏱ 분 단위 {name} 가격")
+    intraday = get_intraday_store(ticker)
+    if intraday.has_data():
+        intraday_daily = intraday.daily()
+        first_day, last_day = intraday_daily.index.min().date(), intraday_daily.index.max().date()
+        col1, col2 = st.columns(2)
+        with col1:
+            intraday_range = st.date_input("조회 기간", value=(max(first_day, last_day - pd.Timedelta(days=2)), last_day),
+                                           min_value=first_day, max_value=last_day, key="intraday_range")
+        with col2:
+            resolution = st.selectbox("해상도", list(RESOLUTIONS), key="intraday_resolution")
+
+        if len(intraday_range) == 2:
+            range_start = pd.Timestamp(intraday_range[0])
+            range_end = pd.Timestamp(intraday_range[1]) + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+            with metrics.timer("intraday.query"):
+                bars, used_freq = intraday.query(range_start, range_end, RESOLUTIONS[resolution])
+            if pd.Timedelta(used_freq) > pd.Timedelta(RESOLUTIONS[resolution]):
+                st.caption(f"선택한 기간이 길어 {used_freq} 간격으로 집계했습니다. 기간을 좁히면 더 세밀하게 볼 수 있습니다.")
+            fig_intraday = px.line(bars, y='Close', title=f'📈 {resolution} {name} 가격 ({len(bars):,}개 봉)', color_discrete_sequence=["#DAA520"])
+            fig_intraday.update_layout(xaxis_title="시각 (UTC)", yaxis_title=y_label, template="plotly_dark")
+            st.plotly_chart(fig_intraday, use_container_width=True)
+    else:
+        st.caption("수집된 분 단위 데이터가 없습니다. `python -m ui.intraday` 로 먼저 수집하세요.")
+
     # 🔥 통계 데이터 추가
-    st.markdown("### 📊 금 가격 통계 요약")
+    st.markdown(f"### 📊 {name} 가격 통계 요약")
     
-    # 통계 요약 데이터 생성
-    stats = df.describe()
+    # 통계 요약 데이터 (구간 조회 인덱스를 만들 때 한 번만 계산됨)
+    range_index = get_range_index(ticker, df)
+    stats = range_index.describe()
 
     # 통계 데이터 설명 추가
-    st.markdown("""
-    - **평균 (mean)**: 해당 기간 동안 금 가격의 평균값  
-    - **표준편차 (std)**: 금 가격 변동성 (값이 클수록 변동성이 큼)  
-    - **최솟값 (min) / 최댓값 (max)**: 해당 기간 동안의 최저 및 최고 금 가격  
+    st.markdown(f"""
+    - **평균 (mean)**: 해당 기간 동안 {name} 가격의 평균값  
+    - **표준편차 (std)**: {name} 가격 변동성 (값이 클수록 변동성이 큼)  
+    - **최솟값 (min) / 최댓값 (max)**: 해당 기간 동안의 최저 및 최고 {name} 가격  
     - **25% / 50% (중앙값) / 75% 백분위수**: 데이터의 분포를 나타냄  
     """)
 
-    # 숫자 포맷 적용 (소수점 2자리 & USD 표시)
-    st.dataframe(stats.style.format("${:.2f}"), use_container_width=True)
+    # 숫자 포맷 적용 (소수점 2자리 & USD 표시, 데이터 수는 정수)
+    st.dataframe(format_stats(stats, currency), use_container_width=True)
 
     # 사용자 선택 날짜 범위
-    st.markdown("### 📅 특정 기간 금 가격 데이터 조회")
+    st.markdown(f"### 📅 특정 기간 {name} 가격 데이터 조회")
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input("시작 날짜", min_value=df.index.min().date(), max_value=df.index.max().date(), value=df.index.min().date())
@@ -103,28 +146,33 @@ def run_eda():
         st.error("❌ 시작 날짜는 종료 날짜보다 이전이어야 합니다.")
         return
 
-    df_filtered = df.loc[start_date:end_date]
+    # 이진 탐색으로 구간을 찾아 복사 없이 뷰로 가져옴
+    df_filtered = range_index.view(start_date, end_date)
 
     if df_filtered.empty:
         st.warning("⚠ 선택한 기간에 대한 데이터가 없습니다.")
         return
 
-    # 날짜 형식을 'YYYY-MM-DD'로 변환하여 시분초 제거
-    df_filtered.index = df_filtered.index.strftime('%Y-%m-%d')
+    # 선택한 구간만 다운샘플링하므로 기간을 좁힐수록 원래 해상도에 가까운 그래프가 그려짐
+    chart_data = downsample_frame(df_filtered, 'Close')
+
+    # 날짜/가격 표시 형식은 브라우저에서 적용 (행마다 strftime이나 Styler를 실행하지 않음)
+    price_format = {column: st.column_config.NumberColumn(column, format=currency + "%.2f") for column in df_filtered.columns}
+    st.dataframe(
+        df_filtered,
+        column_config={"Date": st.column_config.DateColumn("Date", format="YYYY-MM-DD"), **price_format},
+        use_container_width=True
+    )
 
-    # 가독성을 높이기 위한 스타일 적용
-    st.dataframe(df_filtered.style.format({
-        "Close": "${:.2f}",
-        "Open": "${:.2f}",
-        "High": "${:.2f}",
-        "Low": "${:.2f}"
-    }), use_container_width=True)
+    # 선택한 기간 통계 (누적합 기반이라 기간 길이와 관계없이 바로 계산됨)
+    st.markdown("#### 📐 선택한 기간 통계")
+    st.dataframe(format_stats(range_index.stats(start_date, end_date), currency), use_container_width=True)
 
     # 선택한 기간 그래프
-    st.markdown("### 📊 선택한 기간 금 가격 추이")
-    st.text("금 가격 추이 그래프의 금액은 Close(종가)를 기준으로 그려집니다.")
-    fig_filtered = px.line(df_filtered, y='Close', title=f'📈 {start_date} ~ {end_date} 금 가격 추이', color_discrete_sequence=["#FF4500"])
-    fig_filtered.update_layout(xaxis_title="날짜", yaxis_title="가격 (USD)", template="plotly_dark")
+    st.markdown(f"### 📊 선택한 기간 {name} 가격 추이")
+    st.text(f"{name} 가격 추이 그래프의 금액은 Close(종가)를 기준으로 그려집니다.")
+    fig_filtered = px.line(chart_data, y='Close', title=f'📈 {start_date} ~ {end_date} {name} 가격 추이', color_discrete_sequence=["#FF4500"])
+    fig_filtered.update_layout(xaxis_title="날짜", yaxis_title=y_label, template="plotly_dark")
     st.plotly_chart(fig_filtered, use_container_width=True)
 
 
@@ -0,0 +1,68 @@
+import numpy as np
+
+MAX_POINTS = 1500  # 차트 한 개에 보낼 최대 점 개수 (일반적인 차트 가로 픽셀 수 수준)
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets 알고리즘으로 선택할 점의 위치(인덱스 배열)를 반환
+
+    첫 점과 마지막 점은 항상 유지하고, 나머지 구간마다 앞뒤 점과 만드는 삼각형 넓이가 가장 큰 점을 골라
+    고점/저점 같은 모양을 보존한다.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # 첫/마지막 점을 제외한 n_out-2개 구간
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y, n_out):
+    """구간마다 최솟값/최댓값 위치를 남기는 단순 다운샘플링 (인덱스 배열 반환)
+
+    첫 점과 마지막 점은 항상 유지하고, 나누어떨어지지 않고 남는 점도 마지막 구간에 포함해 극값을 놓치지 않는다.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype="float64")
+    size = -(-n // ((n_out - 2) // 2))  # 구간 크기 (첫/마지막 점을 위해 자리를 남기고 올림)
+    n_buckets = -(-n // size)  # 모든 구간에 실제 점이 하나 이상 있도록 다시 계산
+    # 마지막 구간의 빈 자리는 argmin/argmax에 걸리지 않는 값으로 채움
+    lows = np.full(n_buckets * size, np.inf)
+    highs = np.full(n_buckets * size, -np.inf)
+    lows[:n] = highs[:n] = y
+    offsets = np.arange(n_buckets) * size
+    idx = np.concatenate([[0], offsets + lows.reshape(n_buckets, size).argmin(axis=1),
+                          offsets + highs.reshape(n_buckets, size).argmax(axis=1), [n - 1]])
+    return np.unique(idx)
+
+
+def downsample_frame(df, column='Close', max_points=MAX_POINTS, method='lttb'):
+    """DatetimeIndex DataFrame을 max_points개 이하의 행으로 줄임 (점이 적으면 그대로 반환)"""
+    if len(df) <= max_points:
+        return df
+
+    if method == 'minmax':
+        idx = minmax(df[column].to_numpy(), max_points)
+    else:
+        x = df.index.asi8 if hasattr(df.index, 'asi8') else np.arange(len(df))
+        idx = lttb(x, df[column].to_numpy(), max_points)
+    return df.iloc[idx]
@@ -0,0 +1,81 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+import numpy as np
+
+from ui.metrics import metrics
+
+
+class ForecastCache:
+    """(모델 버전, 예측 시작 시점)별로 지금까지 계산한 가장 긴 예측 결과를 보관하는 LRU/TTL 캐시
+
+    더 짧은 기간을 요청하면 저장된 결과를 잘라서 돌려주고, 더 긴 기간을 요청할 때만 모델을 다시 실행한다.
+    """
+
+    def __init__(self, maxsize=64, ttl=6 * 3600, name="forecast_cache"):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name  # 적중/실패 카운터 이름
+        self._entries = OrderedDict()  # {(model_version, origin): (저장 시각, 예측값 배열)}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key, steps):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, values = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values[:steps] if len(values) >= steps else None
+
+    def _store(self, key, values):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and len(entry[1]) > len(values):
+                return  # 다른 세션이 이미 더 긴 예측을 저장함
+            self._entries[key] = (time.time(), values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, model_version, origin, steps, compute):
+        """steps일 예측값 배열을 반환 - compute(steps)는 캐시에 없을 때만 호출"""
+        key = (model_version, origin)
+        values = self._lookup(key, steps)
+        if values is not None:
+            metrics.count(f"{self.name}.hit")
+            return values
+
+        metrics.count(f"{self.name}.miss")
+        values = np.asarray(compute(steps), dtype="float64")
+        values.setflags(write=False)  # 여러 세션이 공유하므로 읽기 전용
+        self._store(key, values)
+        return values
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def file_version(path):
+    """모델 파일 경로와 수정 시각으로 모델 버전 문자열을 만듦 (파일을 다시 저장하면 캐시가 자동으로 무효화됨)"""
+    return f"{os.path.basename(path)}@{os.stat(path).st_mtime_ns}"
+
+
+def model_origin(model):
+    """학습 데이터의 마지막 시점 (예측이 시작되는 기준점)"""
+    data = getattr(getattr(model, "model", None), "data", None)
+    labels = getattr(data, "row_labels", None)
+    if labels is not None and len(labels):
+        return str(labels[-1])
+    index = getattr(getattr(model, "model", None), "_index", None)
+    if index is not None and len(index):
+        return str(index[-1])
+    return str(getattr(model, "nobs", ""))
+
+
+forecast_cache = ForecastCache()  # 프로세스 내 모든 세션이 공유
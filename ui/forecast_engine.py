@@ -0,0 +1,148 @@
+import hashlib
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+
+from ui.forecast_cache import forecast_cache
+from ui.metrics import metrics
+
+GRAMS_PER_OZ = 31.1035  # 1 트로이온스 = 31.1035g
+Z_SCORES = {0.10: 1.6449, 0.05: 1.9600, 0.01: 2.5758}
+
+
+def series_fingerprint(values):
+    """입력 시계열 값의 짧은 해시 - 예측 캐시 키에 넣어 같은 모델/기준일이라도 데이터가 다르면 따로 저장"""
+    return hashlib.sha1(np.ascontiguousarray(values, dtype="float64").tobytes()).hexdigest()[:10]
+
+
+class ArimaForecaster:
+    """statsmodels ARIMAResults를 엔진 인터페이스로 감싼 예측기
+
+    version에는 티커와 모델이 본 관측값의 해시가 들어가므로, 기준일이 같은 다른 자산과 캐시를 공유하지 않는다.
+    """
+
+    def __init__(self, results, version, origin, ticker="GC=F"):
+        self.results = results
+        self.version = f"{ticker}:{version}:{series_fingerprint(results.model.endog)}"
+        self.origin = origin
+
+    def predict(self, steps, alpha=0.05):
+        """(steps, 3) 배열 반환 - 열 순서: 예측값, 하한, 상한"""
+        with metrics.timer("model.forecast"):
+            forecast = self.results.get_forecast(steps)
+        mean = np.asarray(forecast.predicted_mean, dtype="float64")
+        conf_int = np.asarray(forecast.conf_int(alpha=alpha), dtype="float64")
+        return np.column_stack([mean, conf_int])
+
+
+class LinearTrendForecaster:
+    """최근 window일 종가에 선형회귀(LinearRegression)를 맞춰 추세를 연장하는 예측기
+
+    노트북의 LinearRegression은 같은 날의 Open/High/Low/Volume으로 종가를 설명하므로 미래 예측에 쓸 수 없어,
+    입력을 시점(관측 순서)으로 바꾼 가벼운 비교용 모델이다.
+    """
+
+    def __init__(self, closes, window=250, ticker="GC=F"):
+        from sklearn.linear_model import LinearRegression
+
+        closes = closes.iloc[-window:]
+        self.n = len(closes)
+        x = np.arange(self.n, dtype="float64").reshape(-1, 1)
+        self.model = LinearRegression().fit(x, closes.to_numpy())
+        self.resid_std = float(np.std(closes.to_numpy() - self.model.predict(x), ddof=2))
+        self.version = f"{ticker}:linear-trend-{window}:{series_fingerprint(closes.to_numpy())}"
+        self.origin = str(closes.index[-1])
+
+    def predict(self, steps, alpha=0.05):
+        x = np.arange(self.n, self.n + steps, dtype="float64").reshape(-1, 1)
+        mean = self.model.predict(x)
+        half_width = Z_SCORES.get(alpha, 1.96) * self.resid_std
+        return np.column_stack([mean, mean - half_width, mean + half_width])
+
+
+def trading_steps(origin, dates):
+    """기준일 이후 각 날짜까지의 거래일(월~금) 수 = 모델 예측 단계 (ARIMA 한 단계는 달력일이 아니라 거래일 하나)
+
+    주말은 직전 금요일과 같은 단계가 되고, 아직 거래일이 오지 않은 날(기준일 당일/직후 주말)은 1단계로 본다.
+    """
+    begin = np.datetime64(pd.Timestamp(origin).date(), "D") + 1
+    ends = np.asarray(pd.DatetimeIndex(dates).values.astype("datetime64[D]")) + 1
+    return np.maximum(np.busday_count(begin, ends), 1).astype(np.int64)
+
+
+def step_dates(origin, steps):
+    """trading_steps의 역변환: 예측 단계 -> 해당 거래일 날짜"""
+    origin = np.datetime64(pd.Timestamp(origin).date(), "D")
+    return pd.DatetimeIndex(np.busday_offset(origin, np.asarray(steps, dtype=np.int64), roll="backward"))
+
+
+def ensemble_forecast(values, alpha=0.05):
+    """모델별 (예측값, 하한, 상한) 배열 (모델 수, 기간 수, 3)을 동일 가중 앙상블 (1, 기간 수, 3)으로 합침
+
+    예측값은 모델 예측의 평균이다. 구간은 하한/상한을 평균하지 않고, 각 모델의 정규 예측분포를 같은 비율로
+    섞은 분포의 분산(모델 분산의 평균 + 모델 예측값끼리의 분산)으로 계산해 모델 간 의견 차이도 반영한다.
+    """
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    mean = values[:, :, 0]
+    variance = ((values[:, :, 2] - values[:, :, 1]) / (2 * z)) ** 2
+    center = mean.mean(axis=0)
+    half_width = z * np.sqrt(variance.mean(axis=0) + mean.var(axis=0))
+    return np.stack([center, center - half_width, center + half_width], axis=-1)[None]
+
+
+def usd_oz_to_per_gram(usd_per_oz, rates):
+    """USD/온스 가격 배열을 통화별 그램당 가격으로 한 번에 변환
+
+    usd_per_oz의 모양이 (...)이고 rates가 통화 n개면 결과는 (..., n)이다.
+    """
+    return (np.asarray(usd_per_oz, dtype="float64") / GRAMS_PER_OZ)[..., None] * np.asarray(rates, dtype="float64")
+
+
+class ForecastEngine:
+    """여러 예측기와 여러 예측 기간을 한 번에 처리하는 엔진
+
+    모델마다 요청된 가장 긴 기간만 한 번 예측(예측 캐시 사용)한 뒤, 나머지 기간은 배열 인덱싱으로 뽑는다.
+    """
+
+    def __init__(self, models, cache=forecast_cache):
+        self.models = models  # {이름: 예측기}
+        self.cache = cache
+
+    def _predict(self, model, steps, alpha):
+        version = f"{model.version}|alpha={alpha}"
+        return self.cache.get(version, model.origin, steps, lambda n: model.predict(n, alpha))
+
+    def forecast_array(self, horizons, alpha=0.05):
+        """(모델 수, 기간 수, 3) 배열 반환 - 마지막 축은 예측값/하한/상한 (기간은 1 이상)"""
+        horizons = np.asarray(horizons, dtype=np.int64)
+        if horizons.size == 0 or horizons.min() < 1:
+            raise ValueError(f"예측 기간은 1 이상이어야 합니다: {horizons.min() if horizons.size else '없음'}")
+        max_steps = int(horizons.max())
+        stacked = np.stack([self._predict(model, max_steps, alpha) for model in self.models.values()])
+        return stacked[:, horizons - 1, :]
+
+    def forecast_frame(self, horizons, alpha=0.05, rates=None, ensemble=True):
+        """모델 x 기간 long 형식 DataFrame 반환 (rates={통화: USD 환율}이면 그램당 가격 열 추가)
+
+        모델이 둘 이상이면 앙상블 행을 추가한다 (구간 계산은 ensemble_forecast 참고).
+        """
+        values = self.forecast_array(horizons, alpha)
+        names = list(self.models)
+        if ensemble and len(names) > 1:
+            values = np.concatenate([values, ensemble_forecast(values, alpha)])
+            names.append("앙상블")
+
+        horizons = np.asarray(horizons, dtype=np.int64)
+        frame = pd.DataFrame({
+            "모델": np.repeat(names, len(horizons)),
+            "기간(일)": np.tile(horizons, len(names)),
+            "예측 (USD/온스)": values[:, :, 0].ravel(),
+            "하한 (USD/온스)": values[:, :, 1].ravel(),
+            "상한 (USD/온스)": values[:, :, 2].ravel(),
+        })
+        if rates:
+            currencies = list(rates)
+            per_gram = usd_oz_to_per_gram(frame["예측 (USD/온스)"].to_numpy(), [rates[c] for c in currencies])
+            for i, currency in enumerate(currencies):
+                frame[f"예측 ({currency}/그램)"] = per_gram[:, i]
+        return frame
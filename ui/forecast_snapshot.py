@@ -0,0 +1,225 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+
+from ui.forecast_engine import ForecastEngine, ArimaForecaster, LinearTrendForecaster, usd_oz_to_per_gram
+from ui.model_registry import registry, arima_name
+from ui.assets import symbols, safe_name
+from ui.metrics import metrics
+from ui.atomic import atomic_write, temp_path
+
+FORECAST_DIR = "data/forecast"  # 티커별/버전별 예측 스냅샷 디렉터리 (티커마다 CURRENT 파일이 최신 버전을 가리킴)
+HORIZONS = np.arange(1, 366)  # 기준일로부터 1~365일
+CURRENCIES = ("KRW", "USD", "JPY", "EUR", "CNY")  # 그램당 가격을 미리 계산해 둘 통화
+KEEP_VERSIONS = 7  # 보관할 이전 버전 수 (문제가 생기면 CURRENT만 바꿔 되돌릴 수 있음)
+
+_current = {}  # {CURRENT 파일 경로: (mtime_ns, (manifest, DataFrame))}
+_lock = threading.Lock()
+
+
+def registered_models(ticker="GC=F"):
+    """티커에 등록된 예측 모델 {이름: 예측기} - 학습된 ARIMA가 있으면 ARIMA, 그리고 같은 기준일까지의 선형 추세"""
+    from ui.price_service import load_series
+
+    models, origin = {}, None
+    name = arima_name(ticker)
+    if registry.path(name):
+        info = registry.info(name)
+        models["ARIMA"] = ArimaForecaster(registry.get(name), info["version"], info["origin"], ticker)
+        origin = pd.Timestamp(info["origin"]) if not str(info["origin"]).isdigit() else None
+    closes = load_series(ticker).between(end=origin).tail(250).to_frame(['Close'])['Close']
+    if len(closes) > 2:
+        models["선형 추세"] = LinearTrendForecaster(closes, ticker=ticker)
+    return models
+
+
+def build_frame(models, rates, horizons=HORIZONS, alpha=0.05):
+    """모델 x 기간 예측표 (USD/온스 예측/하한/상한 + 통화별 그램당 예측/하한/상한)"""
+    engine = ForecastEngine(models)
+    frame = engine.forecast_frame(horizons, alpha)
+    currencies = [c for c in CURRENCIES if c in rates]
+    for bound in ("예측", "하한", "상한"):
+        per_gram = usd_oz_to_per_gram(frame[f"{bound} (USD/온스)"].to_numpy(), [rates[c] for c in currencies])
+        for i, currency in enumerate(currencies):
+            frame[f"{bound} ({currency}/그램)"] = per_gram[:, i]
+    return frame
+
+
+def _last_close(ticker):
+    """가격 저장소의 마지막 종가 날짜 (스냅샷이 최신 데이터로 만들어졌는지 비교할 때 사용)"""
+    from ui.price_service import load_series
+
+    series = load_series(ticker)
+    return str(pd.Timestamp(series.dates[-1])) if len(series) else None
+
+
+def _origin(models):
+    """예측 기준점 (첫 번째 모델 - ARIMA가 있으면 ARIMA)"""
+    return next(iter(models.values())).origin
+
+
+def snapshot_version(models, rates, last_close=None):
+    """기준일 + 모델 버전/환율/마지막 종가 해시 - 입력이 같으면 같은 버전이 되어 다시 쓰지 않음
+
+    ARIMA 기준일은 재학습 전까지 그대로이므로, 종가가 추가되면 새 버전이 되도록 마지막 종가도 넣는다.
+    """
+    origin = pd.Timestamp(_origin(models)) if not str(_origin(models)).isdigit() else pd.Timestamp.today()
+    key = json.dumps({
+        "models": {n: [m.version, str(m.origin)] for n, m in models.items()},
+        "rates": {c: rates[c] for c in CURRENCIES if c in rates},
+        "last_close": last_close,
+    }, sort_keys=True)
+    return f"{origin:%Y%m%d}-{hashlib.sha1(key.encode()).hexdigest()[:8]}"
+
+
+def snapshot_dir(ticker="GC=F", forecast_dir=FORECAST_DIR):
+    return os.path.join(forecast_dir, safe_name(ticker))
+
+
+def _current_path(forecast_dir):
+    return os.path.join(forecast_dir, "CURRENT")
+
+
+def publish(models, rates, fx_fetched_at=None, ticker="GC=F", forecast_dir=FORECAST_DIR, horizons=HORIZONS, alpha=0.05):
+    """예측표를 티커의 새 버전 디렉터리에 쓰고 CURRENT를 원자적으로 교체 - 버전 이름 반환"""
+    forecast_dir = snapshot_dir(ticker, forecast_dir)
+    last_close = _last_close(ticker)
+    version = snapshot_version(models, rates, last_close)
+    version_dir = os.path.join(forecast_dir, version)
+    if not os.path.exists(os.path.join(version_dir, "manifest.json")):
+        frame = build_frame(models, rates, horizons, alpha)
+        tmp_dir = temp_path(version_dir)
+        os.makedirs(tmp_dir, exist_ok=True)
+        frame.to_parquet(os.path.join(tmp_dir, "forecast.parquet"), index=False)
+        manifest = {
+            "version": version,
+            "ticker": ticker,
+            "created_at": time.time(),
+            "origin": str(_origin(models)),
+            "models": {name: model.version for name, model in models.items()},
+            "arima_file": registry.version(arima_name(ticker)),  # 이 파일이 교체되거나
+            "last_close": last_close,  # 이후 종가가 추가되면 스냅샷이 오래된 것
+            "horizons": [int(horizons.min()), int(horizons.max())],
+            "alpha": alpha,
+            "rates": {c: rates[c] for c in CURRENCIES if c in rates},
+            "fx_fetched_at": fx_fetched_at,
+        }
+        with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        shutil.rmtree(version_dir, ignore_errors=True)
+        os.replace(tmp_dir, version_dir)
+
+    def write_current(tmp_path):
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(version)
+
+    atomic_write(_current_path(forecast_dir), write_current)
+    _prune(forecast_dir, version)
+    return version
+
+
+def _prune(forecast_dir, current, keep=KEEP_VERSIONS):
+    """오래된 버전 디렉터리 정리 (현재 버전은 항상 보관)"""
+    versions = sorted(
+        (d for d in os.listdir(forecast_dir) if os.path.isfile(os.path.join(forecast_dir, d, "manifest.json"))),
+        key=lambda d: os.stat(os.path.join(forecast_dir, d, "manifest.json")).st_mtime_ns,
+    )
+    for version in versions[:-keep]:
+        if version != current:
+            shutil.rmtree(os.path.join(forecast_dir, version), ignore_errors=True)
+
+
+def load_current(ticker="GC=F", forecast_dir=FORECAST_DIR):
+    """티커의 최신 스냅샷 (manifest, DataFrame) - CURRENT가 바뀔 때만 다시 읽음, 없으면 None"""
+    forecast_dir = snapshot_dir(ticker, forecast_dir)
+    path = _current_path(forecast_dir)
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _current.get(path)
+        if cached and cached[0] == mtime:
+            metrics.count("forecast_snapshot.hit")
+            return cached[1]
+        metrics.count("forecast_snapshot.miss")
+
+        with open(path, encoding="utf-8") as f:
+            version_dir = os.path.join(forecast_dir, f.read().strip())
+        try:
+            with open(os.path.join(version_dir, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+            frame = pd.read_parquet(os.path.join(version_dir, "forecast.parquet"))
+        except (OSError, ValueError) as e:
+            print(f"⚠ 예측 스냅샷을 읽지 못했습니다: {e}")
+            return None
+        _current[path] = (mtime, (manifest, frame))
+        return manifest, frame
+
+
+def current_snapshot(ticker="GC=F", forecast_dir=FORECAST_DIR):
+    """현재 모델 파일과 마지막 종가로 만든 스냅샷만 반환 (모델이나 가격이 갱신됐는데 배치가 아직 돌지 않았으면 None)
+
+    ARIMA 없이 선형 추세만 있는 자산도 마지막 종가가 바뀌면 오래된 스냅샷으로 본다.
+    """
+    snapshot = load_current(ticker, forecast_dir)
+    if snapshot is None:
+        return None
+    manifest = snapshot[0]
+    if manifest.get("arima_file") != registry.version(arima_name(ticker)) or manifest.get("last_close") != _last_close(ticker):
+        return None
+    return snapshot
+
+
+def lookup(frame, model, horizons):
+    """스냅샷에서 model의 horizons 행만 순서대로 꺼냄 (기간은 1부터 연속이므로 위치로 바로 조회)"""
+    rows = frame[frame["모델"] == model]
+    positions = np.asarray(horizons, dtype=np.int64) - int(rows["기간(일)"].iloc[0])
+    return rows.iloc[positions].reset_index(drop=True)
+
+
+def run_batch(tickers=None, forecast_dir=FORECAST_DIR, force=False):
+    """데이터/모델 갱신 뒤 실행하는 배치 진입점: 티커마다 등록된 모델의 1~365일 예측을 계산해 발행
+
+    환율표는 한 번만 가져와 모든 티커에 같이 사용한다. 기본 대상은 트로이온스 단위 자산(귀금속)이다.
+    force가 아니면 모델 파일과 마지막 종가가 그대로인(current_snapshot이 있는) 티커는 건너뛴다.
+    """
+    from ui.fx import fx_provider
+
+    rates, is_default = fx_provider.rates()
+    if is_default:
+        print("⚠ 환율을 받아오지 못해 기본 환율로 그램당 가격을 계산합니다.")
+    fetched_at = None if is_default else time.time() - fx_provider.age
+
+    versions = {}
+    for ticker in symbols("oz") if tickers is None else tickers:
+        if not force and current_snapshot(ticker, forecast_dir) is not None:
+            continue
+        started = time.perf_counter()
+        models = registered_models(ticker)
+        if not models:
+            print(f"⚠ {ticker}: 예측할 모델이나 가격 데이터가 없어 건너뜁니다.")
+            continue
+        versions[ticker] = publish(models, rates, fetched_at, ticker, forecast_dir)
+        print(f"✅ {ticker} 예측 스냅샷 {versions[ticker]} 발행: 모델 {', '.join(models)}, "
+              f"{len(HORIZONS)}일, {time.perf_counter() - started:.2f}s")
+    return versions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="1~365일 예측 스냅샷을 계산해 발행 (데이터/모델 갱신 뒤 실행)")
+    parser.add_argument("--tickers", nargs="+", default=None, help="예측할 티커 (기본: 설정된 귀금속 전체)")
+    parser.add_argument("--dir", default=FORECAST_DIR, help="스냅샷 디렉터리")
+    parser.add_argument("--stale-only", action="store_true", help="모델이나 종가가 바뀐 티커만 다시 발행")
+    args = parser.parse_args()
+    run_batch(args.tickers, args.dir, force=not args.stale_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import threading
+import requests
+
+from ui.metrics import metrics
+from ui.atomic import atomic_write
+
+FX_URL = "https://v6.exchangerate-api.com/v6/553ac17cfdac2697c92cd6a8/latest/USD"
+CACHE_PATH = "data/fx_rates.json"  # 마지막으로 성공한 환율표 (콜드 스타트 시 사용)
+# 한 번도 환율을 받아온 적이 없을 때의 기본값 (지원하는 모든 통화 - ui/forecast_snapshot.py의 CURRENCIES)
+DEFAULT_RATES = {"USD": 1.0, "KRW": 1300.0, "JPY": 150.0, "EUR": 0.92, "CNY": 7.2}
+
+
+class FxProvider:
+    """USD 기준 환율표를 TTL 캐시로 보관하고 백그라운드에서 갱신하는 환율 제공자
+
+    캐시가 만료되면 마지막으로 성공한 환율을 바로 돌려주면서 별도 스레드에서 새 환율을 받아온다
+    (stale-while-revalidate). HTTP 클라이언트(get(url, timeout=...)을 가진 객체)는 주입할 수 있다.
+    호출이 실패하면 retry_after초 동안은 다시 호출하지 않고 기존 환율(없으면 기본값)을 사용한다.
+    """
+
+    def __init__(self, url=FX_URL, http=None, ttl=3600, timeout=5, cache_path=CACHE_PATH, retry_after=60):
+        self.url = url
+        self.http = http or requests.Session()  # 연결 재사용
+        self.ttl = ttl
+        self.timeout = timeout
+        self.cache_path = cache_path
+        self.retry_after = retry_after
+        self._rates = None
+        self._fetched_at = 0.0
+        self._failed_at = None  # 마지막 실패 시각 (성공하면 None)
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # 동시에 한 요청만 환율 API를 호출 (single-flight)
+        self._load_from_disk()
+
+    def _load_from_disk(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            self._rates = cached["conversion_rates"]
+            self._fetched_at = cached["fetched_at"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _save_to_disk(self):
+        if not self.cache_path:
+            return
+        cached = {"fetched_at": self._fetched_at, "conversion_rates": self._rates}
+
+        def write(tmp_path):
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cached, f)
+
+        atomic_write(self.cache_path, write)
+
+    def _fetch(self):
+        """환율 API 호출 (_fetch_lock을 잡은 상태에서만 호출) - 성공하면 True"""
+        try:
+            response = self.http.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            rates = response.json()["conversion_rates"]
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print(f"⚠ 환율 갱신 실패: {e}")
+            metrics.count("fx.fetch_error")
+            self._failed_at = time.time()
+            return False
+
+        with self._lock:
+            self._rates = rates
+            self._fetched_at = time.time()
+            self._failed_at = None
+            self._save_to_disk()
+        return True
+
+    def refresh(self):
+        """환율표를 새로 받아옴 - 성공하면 True"""
+        try:
+            with self._fetch_lock:
+                return self._fetch()
+        finally:
+            self._refreshing = False
+
+    def refresh_in_background(self):
+        """백그라운드 갱신 스레드를 시작해 반환 (이미 갱신 중이면 None)"""
+        with self._lock:
+            if self._refreshing:
+                return None  # 이미 갱신 중
+            self._refreshing = True
+        thread = threading.Thread(target=self.refresh, daemon=True)
+        thread.start()
+        return thread
+
+    def _backing_off(self):
+        """최근 호출이 실패해 아직 다시 호출하지 않을 시간인지"""
+        return self._failed_at is not None and time.time() - self._failed_at < self.retry_after
+
+    @property
+    def age(self):
+        return time.time() - self._fetched_at if self._rates else None
+
+    def rates(self):
+        """(환율표, 기본값 사용 여부) 반환 - 캐시가 만료됐으면 기존 값을 주고 백그라운드 갱신만 시작"""
+        if self._rates is None:
+            metrics.count("fx.cold")
+            if not self._backing_off():
+                # 알고 있는 환율이 없을 때만 요청 안에서 기다림 - 동시 요청은 첫 요청의 결과를 사용 (실패했으면 기본값)
+                with self._fetch_lock:
+                    if self._rates is None and not self._backing_off():
+                        self._fetch()
+            if self._rates is None:
+                metrics.count("fx.default")
+                return DEFAULT_RATES, True
+        elif self.age > self.ttl:
+            metrics.count("fx.stale")
+            if not self._backing_off():
+                self.refresh_in_background()
+        else:
+            metrics.count("fx.fresh")
+        return self._rates, False
+
+    def rate(self, currency="KRW"):
+        """USD 1달러당 currency 환율과 기본값 사용 여부"""
+        rates, is_default = self.rates()
+        if currency not in rates:
+            if currency not in DEFAULT_RATES:
+                raise KeyError(f"지원하지 않는 통화입니다: {currency}")
+            return DEFAULT_RATES[currency], True
+        return rates[currency], is_default
+
+
+fx_provider = FxProvider()  # 프로세스 내 모든 세션이 공유
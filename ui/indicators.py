@@ -0,0 +1,203 @@
+import threading
+from collections import deque
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252  # 연환산 변동성 계산용
+
+
+def _rolling_sum(values, window):
+    """누적합 차이로 계산한 이동 합계 (앞쪽 window-1개는 NaN)"""
+    cumsum = np.concatenate([[0.0], np.cumsum(values)])
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        result[window - 1:] = cumsum[window:] - cumsum[:-window]
+    return result
+
+
+def _ewm(values, alpha):
+    """adjust=False 지수 이동 평균 (첫 값으로 시작) - pandas의 C 구현 사용"""
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+class IndicatorEngine:
+    """일별 종가로 기술적 지표(SMA/EMA, 수익률, 변동성, RSI, 볼린저 밴드, 낙폭)를 계산하는 엔진
+
+    처음에는 전체 이력을 NumPy 배열 연산으로 한 번에 계산하고, 이후 새 일봉은 append()로
+    이동 합계/지수 평균/최고가 같은 상태만 갱신해서 한 행씩(O(1)) 추가한다.
+    """
+
+    def __init__(self, daily, sma_windows=(20, 60), ema_spans=(20,), vol_window=20, rsi_period=14, bb_window=20, bb_k=2.0):
+        self.sma_windows = tuple(sma_windows)
+        self.ema_spans = tuple(ema_spans)
+        self.vol_window = vol_window
+        self.rsi_period = rsi_period
+        self.bb_window = bb_window
+        self.bb_k = bb_k
+        self._compute(daily)
+
+    # ---- 전체 이력 계산 (벡터화) ----
+    def _compute(self, daily):
+        close = daily['Close'].to_numpy(dtype="float64")
+        n = len(close)
+        columns = {"Close": close}
+
+        for window in self.sma_windows:
+            columns[f"SMA_{window}"] = _rolling_sum(close, window) / window
+        for span in self.ema_spans:
+            columns[f"EMA_{span}"] = _ewm(close, 2.0 / (span + 1))
+
+        prev = np.concatenate([[np.nan], close[:-1]])
+        returns = close / prev - 1
+        log_returns = np.log(close / prev)
+        columns["Return"] = returns
+
+        lr = np.nan_to_num(log_returns)  # 첫 행은 0으로 두고 아래에서 가림
+        w = self.vol_window
+        lr_sum, lr_sumsq = _rolling_sum(lr, w), _rolling_sum(lr * lr, w)
+        vol = np.sqrt(np.maximum(lr_sumsq - lr_sum * lr_sum / w, 0) / (w - 1)) * np.sqrt(TRADING_DAYS)
+        vol[:w] = np.nan  # 수익률이 window개 모이기 전
+        columns[f"Volatility_{w}"] = vol
+
+        diff = np.nan_to_num(close - prev)
+        alpha = 1.0 / self.rsi_period
+        avg_gain = _ewm(np.maximum(diff, 0), alpha)
+        avg_loss = _ewm(np.maximum(-diff, 0), alpha)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        rsi[:self.rsi_period] = np.nan
+        columns[f"RSI_{self.rsi_period}"] = rsi
+
+        b = self.bb_window
+        c_sum, c_sumsq = _rolling_sum(close, b), _rolling_sum(close * close, b)
+        bb_mid = c_sum / b
+        bb_std = np.sqrt(np.maximum(c_sumsq / b - bb_mid * bb_mid, 0))  # 볼린저 밴드는 모표준편차 사용
+        columns["BB_Upper"] = bb_mid + self.bb_k * bb_std
+        columns["BB_Lower"] = bb_mid - self.bb_k * bb_std
+
+        peak = np.maximum.accumulate(close) if n else close
+        columns["Drawdown"] = close / peak - 1
+
+        # 이후 append()에서 사용할 상태
+        max_window = max(self.sma_windows + (b,)) + 1  # 창에서 빠지는 값을 알 수 있도록 하나 더 보관
+        self._closes = deque(close[-max_window:], maxlen=max_window)
+        self._log_returns = deque(lr[1:][-(w + 1):], maxlen=w + 1)
+        self._sums = {window: close[-window:].sum() for window in set(self.sma_windows + (b,))}
+        self._bb_sumsq = (close[-b:] ** 2).sum()
+        self._lr_sum = np.sum(list(self._log_returns)[-w:])
+        self._lr_sumsq = np.sum(np.square(list(self._log_returns)[-w:]))
+        self._ema = {span: columns[f"EMA_{span}"][-1] for span in self.ema_spans} if n else {}
+        self._avg_gain = avg_gain[-1] if n else 0.0
+        self._avg_loss = avg_loss[-1] if n else 0.0
+        self._peak = peak[-1] if n else -np.inf
+
+        # 용량을 두 배씩 늘리는 배열에 저장해서 append가 평균 O(1)이 되도록 함
+        self._n = n
+        capacity = max(16, n * 2)
+        self._dates = np.empty(capacity, dtype="datetime64[ns]")
+        self._dates[:n] = daily.index.values.astype("datetime64[ns]")
+        self._columns = {}
+        for name, values in columns.items():
+            buffer = np.empty(capacity)
+            buffer[:n] = values
+            self._columns[name] = buffer
+
+    # ---- 한 행 추가 (O(1)) ----
+    def _grow(self):
+        capacity = len(self._dates) * 2
+        self._dates = np.resize(self._dates, capacity)
+        self._columns = {name: np.resize(values, capacity) for name, values in self._columns.items()}
+
+    def append(self, date, close):
+        """새 일봉 하나를 추가하고 지표 행을 갱신"""
+        if self._n == len(self._dates):
+            self._grow()
+
+        close = float(close)
+        prev = self._closes[-1] if self._closes else np.nan
+        self._closes.append(close)
+        closes = self._closes
+        row = {"Close": close}
+
+        # 이동 합계: 새 값을 더하고 창에서 빠지는 값을 뺌
+        for window in self._sums:
+            self._sums[window] += close - (closes[-window - 1] if len(closes) > window else 0.0)
+        b = self.bb_window
+        self._bb_sumsq += close * close - (closes[-b - 1] ** 2 if len(closes) > b else 0.0)
+        count = self._n + 1
+
+        for window in self.sma_windows:
+            row[f"SMA_{window}"] = self._sums[window] / window if count >= window else np.nan
+        for span in self.ema_spans:
+            alpha = 2.0 / (span + 1)
+            self._ema[span] = close if span not in self._ema else alpha * close + (1 - alpha) * self._ema[span]
+            row[f"EMA_{span}"] = self._ema[span]
+
+        row["Return"] = close / prev - 1
+        w = self.vol_window
+        if not np.isnan(prev):
+            log_return = np.log(close / prev)
+            self._log_returns.append(log_return)
+            leaving = self._log_returns[0] if len(self._log_returns) > w else 0.0
+            self._lr_sum += log_return - leaving
+            self._lr_sumsq += log_return * log_return - leaving * leaving
+        if count > w:
+            var = (self._lr_sumsq - self._lr_sum * self._lr_sum / w) / (w - 1)
+            row[f"Volatility_{w}"] = np.sqrt(max(var, 0.0)) * np.sqrt(TRADING_DAYS)
+        else:
+            row[f"Volatility_{w}"] = np.nan
+
+        diff = 0.0 if np.isnan(prev) else close - prev
+        alpha = 1.0 / self.rsi_period
+        self._avg_gain = alpha * max(diff, 0) + (1 - alpha) * self._avg_gain
+        self._avg_loss = alpha * max(-diff, 0) + (1 - alpha) * self._avg_loss
+        rsi = 100.0 if self._avg_loss == 0 else 100 - 100 / (1 + self._avg_gain / self._avg_loss)
+        row[f"RSI_{self.rsi_period}"] = rsi if count > self.rsi_period else np.nan
+
+        if count >= b:
+            mid = self._sums[b] / b
+            std = np.sqrt(max(self._bb_sumsq / b - mid * mid, 0.0))
+            row["BB_Upper"], row["BB_Lower"] = mid + self.bb_k * std, mid - self.bb_k * std
+        else:
+            row["BB_Upper"] = row["BB_Lower"] = np.nan
+
+        self._peak = max(self._peak, close)
+        row["Drawdown"] = close / self._peak - 1
+
+        i = self._n
+        self._dates[i] = np.datetime64(pd.Timestamp(date), "ns")
+        for name, value in row.items():
+            self._columns[name][i] = value
+        self._n += 1
+
+    @property
+    def frame(self):
+        """현재까지의 지표를 DataFrame으로 반환 (내부 배열의 뷰)"""
+        index = pd.DatetimeIndex(self._dates[:self._n], name="Date")
+        return pd.DataFrame({name: values[:self._n] for name, values in self._columns.items()}, index=index, copy=False)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(self._dates[self._n - 1]) if self._n else None
+
+
+_engines = {}
+_lock = threading.Lock()
+
+
+def get_indicators(ticker, daily):
+    """티커별 지표 엔진을 재사용하고, 일별 데이터가 뒤로 늘어난 만큼만 append"""
+    with _lock:
+        engine = _engines.get(ticker)
+        if engine is not None and len(engine) and len(daily) >= len(engine) \
+                and daily.index[len(engine) - 1] == engine.last_date:
+            for date, close in daily['Close'].iloc[len(engine):].items():
+                engine.append(date, close)
+            return engine
+
+        engine = IndicatorEngine(daily)
+        _engines[ticker] = engine
+        return engine
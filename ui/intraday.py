@@ -0,0 +1,250 @@
+import os
+import argparse
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+
+from ui.price_store import _normalize, COLUMNS
+from ui.assets import safe_name
+from ui.downsample import MAX_POINTS
+from ui.atomic import atomic_write
+
+INTRADAY_DIR = "data/intraday"  # 날짜별로 나눠 저장하는 분 단위 가격 저장소 경로
+CHUNK_ROWS = 200_000  # 스트리밍 수집 시 한 번에 메모리에 올리는 최대 행 수
+SUMMARY_FILE = "_daily.parquet"  # 저장된 날짜 목록 겸 일봉 요약 (하루 한 행)
+
+# 화면 이름 -> pandas 빈도
+RESOLUTIONS = {
+    '1분': '1min',
+    '5분': '5min',
+    '15분': '15min',
+    '1시간': '1h',
+    '4시간': '4h',
+    '1일': '1D',
+}
+# 요청한 해상도로는 점이 너무 많을 때 차례로 시도하는 집계 간격
+# (1일 미만은 모두 하루를 나누어떨어지게 하고, 날짜 파일을 많이 읽지 않도록 4h 다음은 일봉 요약으로 넘어감)
+STEPS = ['1min', '5min', '15min', '30min', '1h', '2h', '4h', '1D', '2D', '7D', '14D', '28D', '91D', '364D']
+
+
+def _to_utc(df):
+    """시간대가 있는 인덱스(yfinance 분봉)는 UTC 기준 naive 시각으로 통일"""
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        df = df.copy()
+        df.index = df.index.tz_convert("UTC").tz_localize(None)
+    return df
+
+
+def _ohlc_bars(rows, freq):
+    """정렬된 행을 freq 간격 OHLC 봉으로 집계 (groupby 대신 구간 경계와 reduceat 사용)"""
+    floored = rows.index.floor(freq)
+    keys = floored.asi8
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    return pd.DataFrame({
+        'Open': rows['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(rows['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(rows['Low'].to_numpy(), starts),
+        'Close': rows['Close'].to_numpy()[ends],
+    }, index=floored[starts].rename("Date"))
+
+
+class CsvChunkSource:
+    """대용량 CSV를 chunksize행씩 나눠 읽는 분 단위 가격 소스"""
+
+    def __init__(self, path, sep=";", chunksize=CHUNK_ROWS):
+        self.path = path
+        self.sep = sep
+        self.chunksize = chunksize
+
+    def iter_chunks(self, ticker, start=None, end=None):
+        reader = pd.read_csv(self.path, sep=self.sep, parse_dates=['Date'], index_col='Date', chunksize=self.chunksize)
+        with reader:
+            for chunk in reader:
+                chunk = _to_utc(chunk)
+                if start is not None:
+                    chunk = chunk.loc[chunk.index >= pd.Timestamp(start)]
+                if end is not None:
+                    chunk = chunk.loc[chunk.index < pd.Timestamp(end)]
+                if not chunk.empty:
+                    yield _normalize(chunk)
+
+
+class YahooIntradaySource:
+    """Yahoo Finance 분봉을 window_days일 단위로 나눠 받아오는 소스
+
+    yfinance는 1분봉을 한 요청에 7일까지, 최근 30일 이내만 제공하므로 긴 기간은 창을 옮겨 가며 받는다.
+    """
+
+    def __init__(self, interval="1m", window_days=7):
+        self.interval = interval
+        self.window_days = window_days
+
+    def iter_chunks(self, ticker, start, end):
+        import yfinance as yf  # 네트워크가 필요할 때만 import
+
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        while start < end:
+            window_end = min(start + timedelta(days=self.window_days), end)
+            df = yf.download(ticker, start=start, end=window_end, interval=self.interval, progress=False)
+            if df is not None and not df.empty:
+                yield _normalize(_to_utc(df))
+            start = window_end
+
+
+class IntradayStore:
+    """분 단위 가격을 하루 한 파일(Parquet)로 나눠 저장하고, 필요한 날짜 파일만 읽어 조회하는 저장소
+
+    수집과 조회 모두 한 번에 한 청크/하루치만 메모리에 올리므로 이력 길이와 관계없이 메모리 사용량이 일정하다.
+    """
+
+    def __init__(self, ticker, store_dir=INTRADAY_DIR):
+        self.ticker = ticker
+        self.root = os.path.join(store_dir, safe_name(ticker))
+        self._summary = None
+        self._summary_mtime = None
+
+    def partition_path(self, day):
+        day = pd.Timestamp(day)
+        return os.path.join(self.root, f"{day:%Y}", f"{day:%Y-%m-%d}.parquet")
+
+    @property
+    def summary_path(self):
+        return os.path.join(self.root, SUMMARY_FILE)
+
+    def daily(self):
+        """일봉 요약 (Date 인덱스, OHLC + Rows) - 다른 일봉 파이프라인에 그대로 넘길 수 있음
+
+        수집 프로세스가 요약 파일을 교체하면 다음 호출에서 다시 읽는다.
+        """
+        mtime = os.stat(self.summary_path).st_mtime_ns if os.path.exists(self.summary_path) else None
+        if self._summary is None or mtime != self._summary_mtime:
+            if mtime is not None:
+                self._summary = pd.read_parquet(self.summary_path)
+            else:
+                self._summary = pd.DataFrame(
+                    {**{c: pd.Series(dtype="float64") for c in COLUMNS}, "Rows": pd.Series(dtype="int64")},
+                    index=pd.DatetimeIndex([], name="Date"))
+            self._summary_mtime = mtime
+        return self._summary
+
+    def has_data(self):
+        return not self.daily().empty
+
+    def _write(self, df, path):
+        atomic_write(path, df.to_parquet)
+
+    def _write_day(self, day, rows):
+        """하루치 행을 해당 날짜 파일에 병합 (청크 경계에 걸친 날은 기존 파일과 합침)"""
+        path = self.partition_path(day)
+        if os.path.exists(path):
+            rows = _normalize(pd.concat([pd.read_parquet(path, columns=COLUMNS), rows]))
+        self._write(rows, path)
+        return {'Open': rows['Open'].iloc[0], 'High': rows['High'].max(), 'Low': rows['Low'].min(),
+                'Close': rows['Close'].iloc[-1], 'Rows': len(rows)}
+
+    def ingest(self, chunks):
+        """청크(DataFrame) 이터레이터를 날짜별 파일로 나눠 기록하고 기록한 행 수를 반환"""
+        total = 0
+        for chunk in chunks:
+            chunk = _normalize(chunk)
+            if chunk.empty:
+                continue
+            days = chunk.index.normalize()
+            touched = {day: self._write_day(day, rows) for day, rows in chunk.groupby(days)}
+
+            summary = self.daily()
+            updated = pd.DataFrame.from_dict(touched, orient="index").astype(summary.dtypes.to_dict())
+            updated.index = pd.DatetimeIndex(updated.index, name="Date")
+            self._summary = pd.concat([summary.drop(updated.index, errors="ignore"), updated]).sort_index()
+            self._write(self._summary, self.summary_path)
+            self._summary_mtime = os.stat(self.summary_path).st_mtime_ns
+            total += len(chunk)
+        return total
+
+    def sync(self, source=None, end=None):
+        """마지막으로 저장한 시각 이후의 분봉만 받아서 추가"""
+        source = source or YahooIntradaySource()
+        end = pd.Timestamp(end or datetime.now())
+        summary = self.daily()
+        if summary.empty:
+            start = end - timedelta(days=7)
+        else:
+            last_day = summary.index[-1]
+            start = pd.read_parquet(self.partition_path(last_day), columns=['Close']).index.max() + timedelta(minutes=1)
+        return self.ingest(source.iter_chunks(self.ticker, start, end))
+
+    def iter_days(self, start, end, columns=COLUMNS):
+        """[start, end] 구간에 걸친 날짜 파일을 하루씩 읽어서 돌려줌"""
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        summary = self.daily()
+        for day in summary.index[(summary.index >= start.normalize()) & (summary.index <= end)]:
+            rows = pd.read_parquet(self.partition_path(day), columns=columns)
+            yield rows.loc[(rows.index >= start) & (rows.index <= end)]
+
+    def query(self, start, end, resolution='1min', max_points=MAX_POINTS):
+        """[start, end] 구간을 resolution 간격 OHLC 봉으로 집계하여 (봉, 실제 사용한 간격) 반환
+
+        봉 개수가 max_points를 넘으면 더 넓은 간격으로 자동 집계한다. 1일 이상 간격은 일봉 요약만 읽고,
+        1일 미만 간격은 날짜 파일을 하루씩 읽어 바로 집계하므로 메모리에는 결과 봉과 하루치 행만 남는다.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        freq = choose_step(end - start, resolution, max_points)
+
+        if pd.Timedelta(freq) >= pd.Timedelta('1D'):
+            daily = self.daily()
+            rows = daily.loc[(daily.index >= start.normalize()) & (daily.index <= end), COLUMNS]
+            bars = [_ohlc_bars(rows, freq)] if not rows.empty else []
+        else:
+            # 1일 미만 간격은 하루를 나누어떨어지므로 한 봉이 두 날짜 파일에 걸치지 않음
+            bars = [_ohlc_bars(rows, freq) for rows in self.iter_days(start, end) if not rows.empty]
+
+        if not bars:
+            return _normalize(None), freq
+        bars = pd.concat(bars)
+        bars.index.name = "Date"
+        return bars, freq
+
+
+def choose_step(span, resolution, max_points=MAX_POINTS):
+    """resolution 이상인 간격 중 span 구간의 봉 개수가 max_points 이하가 되는 가장 작은 간격"""
+    minimum = pd.Timedelta(resolution)
+    for step in STEPS:
+        if pd.Timedelta(step) >= minimum and span / pd.Timedelta(step) <= max_points:
+            return step
+    return f"{-(-span // pd.Timedelta('1D') // max_points)}D"
+
+
+_stores = {}
+
+
+def get_intraday_store(ticker):
+    """프로세스당 티커별 분 단위 저장소 인스턴스를 하나만 만들어 재사용"""
+    if ticker not in _stores:
+        _stores[ticker] = IntradayStore(ticker)
+    return _stores[ticker]
+
+def main():
+    parser = argparse.ArgumentParser(description="분 단위 금 가격을 청크 단위로 수집하여 날짜별 Parquet으로 저장")
+    parser.add_argument("--ticker", default="GC=F")
+    parser.add_argument("--csv", help="수집할 CSV 경로 (Date;Open;High;Low;Close) - 없으면 Yahoo Finance 분봉")
+    parser.add_argument("--sep", default=";")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="한 번에 읽는 행 수")
+    parser.add_argument("--interval", default="1m", help="Yahoo Finance 분봉 간격")
+    args = parser.parse_args()
+
+    store = IntradayStore(args.ticker)
+    if args.csv:
+        rows = store.ingest(CsvChunkSource(args.csv, args.sep, args.chunksize).iter_chunks(args.ticker))
+    else:
+        rows = store.sync(YahooIntradaySource(args.interval))
+    try:
+        import resource  # 수집 CLI에서만 사용 (Windows에는 없음)
+        peak = f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB"
+    except ImportError:
+        peak = "측정 불가"
+    print(f"✅ {args.ticker}: {rows:,}행 수집, 저장된 날짜 {len(store.daily()):,}일 ({store.root}), 최대 RSS {peak}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import time
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
+import numpy as np
+
+# 지연 시간 히스토그램 구간 경계 (초)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+class Histogram:
+    """호출 지연 시간 분포 - 누적 구간 카운트와 분위수 계산용 최근 표본을 함께 보관"""
+
+    def __init__(self, recent=1024):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.recent = deque(maxlen=recent)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[next(i for i, bound in enumerate(BUCKETS) if seconds <= bound)] += 1
+        self.recent.append(seconds)
+
+    def summary(self):
+        recent = np.fromiter(self.recent, dtype="float64")
+        p50, p95 = np.percentile(recent, [50, 95]) if len(recent) else (np.nan, np.nan)
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else np.nan,
+            "p50_ms": p50 * 1000,
+            "p95_ms": p95 * 1000,
+            "max_ms": self.max * 1000,
+            "buckets": {("+Inf" if bound == float("inf") else f"{bound:g}s"): n for bound, n in zip(BUCKETS, self.buckets)},
+        }
+
+
+class Metrics:
+    """프로세스 전체의 핫패스 계측값 (지연 시간 히스토그램 + 캐시 적중/실패 같은 카운터)"""
+
+    def __init__(self):
+        self._timers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            self._timers.setdefault(name, Histogram()).observe(seconds)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def timed(self, name):
+        """함수 호출 시간을 name 히스토그램에 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """구조화된 계측값 (JSON으로 내보낼 수 있는 dict)"""
+        with self._lock:
+            return {
+                "uptime_s": time.time() - self.started_at,
+                "timers": {name: hist.summary() for name, hist in self._timers.items()},
+                "counters": dict(self._counters),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+
+metrics = Metrics()
+timed = metrics.timed
@@ -0,0 +1,211 @@
+import os
+import sys
+import time
+import argparse
+import threading
+import joblib
+import numpy as np
+
+from ui.forecast_cache import file_version, model_origin
+from ui.atomic import atomic_write
+from ui.metrics import metrics
+from ui.assets import symbols, safe_name
+
+MODEL_DIR = "model"
+SLIM_FORMAT = "arima-slim/1"
+SLIM_TAIL = 50  # 경량 모델에 남겨 둘 마지막 관측값 개수
+
+
+def _rss_bytes():
+    """현재 프로세스의 상주 메모리(RSS) 크기 (확인할 수 없는 플랫폼이면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource  # Windows에는 없음
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _rss_growth(before):
+    """before 이후 늘어난 RSS (측정할 수 없으면 None)"""
+    after = _rss_bytes()
+    return None if before is None or after is None else max(after - before, 0)
+
+
+def _format_rss(growth):
+    return "측정 불가" if growth is None else f"+{growth / 1e6:,.1f}MB"
+
+
+def slim_arima(results, tail=SLIM_TAIL):
+    """ARIMAResults에서 예측에 필요한 파라미터와 상태만 남긴 dict를 만듦
+
+    전체 학습 데이터와 스무딩 결과 배열 대신, 마지막 tail개의 관측값과 그 직전 시점의 상태/공분산만 저장한다.
+    불러올 때는 이 구간만 고정 파라미터로 필터링하므로 예측값과 신뢰구간이 원래 모델과 같다.
+    """
+    model = results.model
+    endog = np.asarray(model.endog, dtype="float64").ravel()
+    tail = min(tail, len(endog))
+    t0 = len(endog) - tail
+    return {
+        "format": SLIM_FORMAT,
+        "order": model.order,
+        "seasonal_order": model.seasonal_order,
+        "trend": model.trend,
+        "params": np.asarray(results.params, dtype="float64"),
+        "endog_tail": endog[t0:].copy(),
+        "init_state": np.asarray(results.predicted_state[:, t0]).copy(),
+        "init_state_cov": np.asarray(results.predicted_state_cov[:, :, t0]).copy(),
+        "nobs": len(endog),
+        "origin": model_origin(results),
+    }
+
+
+def restore_slim(slim):
+    """slim_arima로 저장한 dict를 예측 가능한 ARIMAResults로 복원"""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    model = ARIMA(slim["endog_tail"], order=slim["order"], seasonal_order=slim["seasonal_order"], trend=slim["trend"])
+    model.ssm.initialize_known(slim["init_state"], slim["init_state_cov"])
+    return model.filter(slim["params"])
+
+
+def save_slim(results, path, tail=SLIM_TAIL):
+    slim = slim_arima(results, tail)
+    dump_atomic(slim, path)
+    return slim
+
+
+def dump_atomic(obj, path):
+    """임시 파일에 저장한 뒤 교체하여 다른 프로세스가 반쯤 쓰인 모델을 읽지 않도록 함"""
+    atomic_write(path, lambda tmp_path: joblib.dump(obj, tmp_path))
+
+
+def load_model(path):
+    """모델 파일을 불러옴 (경량 형식이면 ARIMAResults로 복원)"""
+    obj = joblib.load(path, mmap_mode=None)
+    if isinstance(obj, dict) and obj.get("format") == SLIM_FORMAT:
+        return restore_slim(obj), obj["origin"]
+    return obj, model_origin(obj)
+
+
+class ModelRegistry:
+    """프로세스당 모델을 한 번만 불러와 모든 세션이 공유하는 레지스트리
+
+    이름마다 후보 경로를 등록해 두면 존재하는 첫 번째 파일(보통 경량 모델)을 사용하고,
+    불러오는 데 걸린 시간과 늘어난 RSS를 stats()로 보여준다.
+    """
+
+    def __init__(self):
+        self._paths = {}
+        self._models = {}
+        self._info = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, *paths):
+        self._paths[name] = list(paths)
+
+    def path(self, name):
+        """존재하는 첫 번째 후보 경로 (등록되지 않았거나 파일이 없으면 None)"""
+        for path in self._paths.get(name, []):
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _is_current(self, name):
+        """불러온 뒤 모델 파일이 교체되지 않았는지 확인 (야간 업데이트/재학습 반영)"""
+        path = self.path(name)
+        return path == self._info[name]["path"] and file_version(path) == self._info[name]["version"]
+
+    def get(self, name):
+        """모델을 반환 (처음 호출되거나 파일이 교체됐을 때만 디스크에서 불러옴) - 파일이 없으면 FileNotFoundError"""
+        if name in self._models and self._is_current(name):
+            return self._models[name]
+
+        with self._lock:
+            if name in self._models and self._is_current(name):
+                return self._models[name]
+
+            path = self.path(name)
+            if path is None:
+                raise FileNotFoundError(self._paths[name][-1])
+
+            rss_before = _rss_bytes()
+            started = time.perf_counter()
+            model, origin = load_model(path)
+            self._info[name] = {
+                "path": path,
+                "version": file_version(path),
+                "origin": origin,
+                "load_seconds": time.perf_counter() - started,
+                "rss_bytes": _rss_growth(rss_before),
+                "file_bytes": os.path.getsize(path),
+            }
+            self._models[name] = model
+            metrics.count(f"model_registry.load.{name}")
+            return model
+
+    def version(self, name):
+        """모델을 불러오지 않고 현재 파일의 버전만 확인 (파일이 없으면 None)"""
+        path = self.path(name)
+        return file_version(path) if path else None
+
+    def info(self, name):
+        self.get(name)
+        return self._info[name]
+
+    def stats(self):
+        return {name: dict(info) for name, info in self._info.items()}
+
+    def reload(self, name):
+        """모델 파일을 새로 저장한 뒤 다음 get()에서 다시 불러오도록 함"""
+        with self._lock:
+            self._models.pop(name, None)
+            self._info.pop(name, None)
+
+
+def arima_name(ticker="GC=F"):
+    """티커별 ARIMA 모델의 레지스트리 이름 (금은 기존 이름 'arima' 유지)"""
+    return "arima" if ticker == "GC=F" else f"arima:{ticker}"
+
+
+def arima_path(ticker="GC=F"):
+    """티커별 경량 ARIMA 모델 경로"""
+    if ticker == "GC=F":
+        return os.path.join(MODEL_DIR, "gold_price_arima.slim.pkl")
+    return os.path.join(MODEL_DIR, f"{safe_name(ticker)}_arima.slim.pkl")
+
+
+registry = ModelRegistry()
+registry.register("arima", arima_path("GC=F"), os.path.join(MODEL_DIR, "gold_price_arima.pkl"))
+for _ticker in symbols("oz"):
+    if _ticker != "GC=F":
+        registry.register(arima_name(_ticker), arima_path(_ticker))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARIMA 모델 경량화 및 로드 성능 확인")
+    parser.add_argument("--source", default=os.path.join(MODEL_DIR, "gold_price_arima.pkl"), help="원본 ARIMAResults pkl")
+    parser.add_argument("--output", default=os.path.join(MODEL_DIR, "gold_price_arima.slim.pkl"), help="경량 모델 저장 경로")
+    args = parser.parse_args()
+
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    results, _ = load_model(args.source)
+    print(f"원본: {os.path.getsize(args.source) / 1e6:,.1f}MB, 로드 {time.perf_counter() - started:.3f}s, RSS {_format_rss(_rss_growth(rss_before))}")
+
+    save_slim(results, args.output)
+    del results
+
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    load_model(args.output)
+    print(f"경량: {os.path.getsize(args.output) / 1e6:,.3f}MB, 로드 {time.perf_counter() - started:.3f}s, RSS {_format_rss(_rss_growth(rss_before))}")
+
+
+if __name__ == "__main__":
+    main()
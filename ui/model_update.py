@@ -0,0 +1,122 @@
+import os
+import time
+import argparse
+import joblib
+import numpy as np
+import pandas as pd
+
+from ui.price_service import refresh, refresh_many
+from ui.assets import symbols
+from ui.model_registry import SLIM_FORMAT, dump_atomic, restore_slim, slim_arima, registry, arima_name, arima_path
+from ui.train_arima import fit_order
+
+REFIT_EVERY = 30  # 마지막 전체 학습 이후 이 일수가 지나면 같은 차수로 다시 학습
+REFIT_RETRY_DAYS = 7  # 재학습이 실패하면 이 일수 뒤에 다시 시도 (연속 실패마다 두 배, 최대 REFIT_EVERY)
+REFIT_FAILURE_KEYS = ("refit_failures", "last_refit_attempt", "last_refit_error")  # 경량 모델에 남기는 실패 기록
+
+
+def load_slim(path):
+    """경량 모델 dict를 불러옴 (원본 ARIMAResults pkl이면 경량 형식으로 변환)"""
+    obj = joblib.load(path)
+    if isinstance(obj, dict) and obj.get("format") == SLIM_FORMAT:
+        return obj
+    return slim_arima(obj)  # 이미 불러온 ARIMAResults를 그대로 변환 (기준점도 slim_arima가 기록)
+
+
+def append_observations(slim, values, origin):
+    """고정된 파라미터로 새 관측값을 모델 상태에 반영한 경량 모델을 반환 (전체 fit 없이 필터링만 수행)"""
+    values = np.asarray(values, dtype="float64")
+    results = restore_slim({**slim, "endog_tail": np.concatenate([slim["endog_tail"], values])})
+    updated = slim_arima(results)
+    updated["nobs"] = slim["nobs"] + len(values)
+    updated["origin"] = origin
+    updated["trained_origin"] = slim.get("trained_origin", slim["origin"])
+    updated.update({key: slim[key] for key in REFIT_FAILURE_KEYS if key in slim})
+    return updated
+
+
+def refit_due(slim, last_close, refit_every=REFIT_EVERY):
+    """전체 재학습할 때인지 - 마지막 학습 후 refit_every일이 지났고, 최근 실패 뒤의 대기 기간도 지났으면 True"""
+    last_close = pd.Timestamp(last_close)
+    if (last_close - pd.Timestamp(slim.get("trained_origin", slim["origin"]))).days < refit_every:
+        return False
+    failures = slim.get("refit_failures", 0)
+    if not failures:
+        return True
+    wait = min(REFIT_RETRY_DAYS * 2 ** (failures - 1), refit_every)
+    return (last_close - pd.Timestamp(slim["last_refit_attempt"])).days >= wait
+
+
+def update_model(ticker="GC=F", path=None, refit_every=REFIT_EVERY, force_refit=False):
+    """가격 저장소의 새 종가를 모델에 반영 - 평소에는 상태만 갱신하고, refit_every일마다 전체 재학습
+
+    재학습이 실패하면 실패 횟수/시각/사유를 모델 파일에 기록하고 상태 갱신으로 대신하며, 다음 시도는 refit_due의
+    대기 기간이 지난 뒤에 한다 (성공하면 기록을 지움).
+    """
+    path = path or arima_path(ticker)
+    source_path = path if os.path.exists(path) else registry.path(arima_name(ticker))
+    if source_path is None:
+        raise FileNotFoundError(path)
+
+    slim = load_slim(source_path)
+    closes = refresh(ticker)['Close']  # 다른 갱신과 겹치지 않도록 스냅샷 갱신 잠금 안에서 동기화
+    origin = pd.Timestamp(slim["origin"])
+    new_closes = closes[closes.index > origin]
+
+    needs_refit = force_refit or refit_due(slim, closes.index[-1], refit_every)
+
+    started = time.perf_counter()
+    failed = False
+    if needs_refit:
+        row, refit = fit_order(closes.to_numpy(), tuple(slim["order"]))
+        if refit is None or not row["converged"]:
+            failed, needs_refit = True, False
+            slim = {**slim,
+                    "refit_failures": slim.get("refit_failures", 0) + 1,
+                    "last_refit_attempt": str(closes.index[-1]),
+                    "last_refit_error": row["status"] if refit is None else "수렴하지 않음"}
+            print(f"⚠ 재학습 실패 {slim['refit_failures']}회째 ({slim['last_refit_error']}), 상태 갱신으로 대신합니다.")
+        else:
+            refit["origin"] = refit["trained_origin"] = str(closes.index[-1])
+            slim = refit
+
+    if not needs_refit:
+        if new_closes.empty and not failed:
+            print(f"✅ 새 관측값이 없습니다. (기준일 {origin.date()})")
+            return slim
+        if not new_closes.empty:
+            slim = append_observations(slim, new_closes.to_numpy(), str(new_closes.index[-1]))
+
+    dump_atomic(slim, path)  # 실패 기록도 함께 저장
+    action = "전체 재학습" if needs_refit else f"상태 갱신 (+{len(new_closes)}일)"
+    print(f"✅ {action}: 기준일 {pd.Timestamp(slim['origin']).date()}, {time.perf_counter() - started:.2f}s")
+    return slim
+
+
+def main():
+    parser = argparse.ArgumentParser(description="새 일봉을 ARIMA 모델 상태에 반영 (야간 작업용)")
+    parser.add_argument("--tickers", nargs="+", default=None, help="갱신할 티커 (기본: 설정된 귀금속 전체)")
+    parser.add_argument("--path", default=None, help="경량 모델 경로 (티커를 하나만 지정할 때, 기본: 티커별 model/*_arima.slim.pkl)")
+    parser.add_argument("--refit-every", type=int, default=REFIT_EVERY, help="전체 재학습 주기 (일)")
+    parser.add_argument("--refit", action="store_true", help="주기와 관계없이 지금 전체 재학습")
+    parser.add_argument("--skip-forecasts", action="store_true", help="갱신 후 예측 스냅샷을 발행하지 않음")
+    args = parser.parse_args()
+    tickers = args.tickers or symbols("oz")
+    if args.path and len(tickers) != 1:
+        parser.error("--path는 --tickers로 티커를 하나만 지정할 때 사용할 수 있습니다.")
+
+    refresh_many(tickers)  # 모든 티커를 일괄 요청 한 번으로 동기화하고 가격 스냅샷도 다시 발행
+    for ticker in tickers:
+        if args.path or registry.path(arima_name(ticker)):
+            update_model(ticker, args.path, args.refit_every, args.refit)
+        else:
+            print(f"ℹ {ticker}: 학습된 ARIMA 모델이 없어 가격만 동기화했습니다. (선형 추세 예측만 갱신)")
+    if not args.skip_forecasts:
+        from ui.forecast_snapshot import run_batch
+
+        # ARIMA 유무와 관계없이 모든 귀금속의 1~365일 예측을 다시 계산 (모델이나 종가가 바뀐 티커만 발행)
+        run_batch(symbols("oz"))
+
+
+if __name__ == "__main__":
+    main()
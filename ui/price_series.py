@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+COLUMNS = ('Open', 'High', 'Low', 'Close')
+MAX_SCALE = 10_000  # 가격 정수화 배율 상한 (소수점 4자리)
+INT32_MAX = np.iinfo(np.int32).max
+UNIT_NS = {'D': 86_400 * 10**9, 'm': 60 * 10**9}  # 시각 단위 -> 나노초
+
+
+def choose_scale(values):
+    """int32를 넘지 않는 가장 큰 10의 거듭제곱 배율 (MAX_SCALE 이하)"""
+    peak = float(np.nanmax(np.abs(values))) if len(values) else 0.0
+    scale = MAX_SCALE
+    while scale > 1 and peak * scale >= INT32_MAX:
+        scale //= 10
+    return scale
+
+
+class PriceSeries:
+    """가격 이력을 int32 시각 + 배율을 곱한 int32 가격 배열로 보관하는 읽기 전용 시계열
+
+    행당 20바이트로 float64 4개 + datetime 인덱스(40바이트)의 절반이고, 배열이 읽기 전용이라 캐시에서 꺼낸 객체를
+    세션끼리 복사 없이 공유할 수 있다. 구간 조회는 뷰를 돌려주며, pandas로는 화면에 그릴 때만 변환한다.
+    - unit 'D': 1970-01-01 이후 일수 (일봉), 'm': 1970-01-01 이후 분 (분봉, 6053년까지 표현 가능)
+    - 가격은 1/scale 단위로 반올림되므로 원래 값과의 차이는 0.5/scale 이하 (scale은 choose_scale 참고)
+    - 정수 배열에는 NaN을 담을 수 없어, 가격이 하나라도 빈 행은 만들 때 빠진다. 따라서 행 수가 원래
+      DataFrame(load_shared)보다 적을 수 있으므로, 두 결과를 위치로 맞추지 말고 날짜(dates)로 맞춰야 한다.
+    """
+
+    __slots__ = ("ticks", "unit", "scale", "_columns")
+
+    def __init__(self, ticks, columns, scale, unit='D'):
+        self.ticks = ticks
+        self.unit = unit
+        self.scale = scale
+        self._columns = columns
+        for array in (ticks, *columns.values()):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_frame(cls, df, columns=COLUMNS):
+        """Date 인덱스 DataFrame을 변환 (자정만 있으면 일 단위, 아니면 분 단위 시각)
+
+        columns 중 하나라도 NaN인 행은 제외한다 (빠진 행 수는 len(df) - len(결과)).
+        """
+        columns = [c for c in columns if c in df.columns]
+        df = df.dropna(subset=columns)  # 정수 배열에는 NaN을 담을 수 없음
+        ns = df.index.values.astype("datetime64[ns]").astype(np.int64)
+        unit = 'D' if (ns % UNIT_NS['D'] == 0).all() else 'm'
+        ticks = (ns // UNIT_NS[unit]).astype(np.int32)
+        raw = {c: df[c].to_numpy(dtype="float64") for c in columns}
+        scale = choose_scale(np.concatenate(list(raw.values()))) if raw else MAX_SCALE
+        return cls(ticks, {c: np.round(v * scale).astype(np.int32) for c, v in raw.items()}, scale, unit)
+
+    @classmethod
+    def from_arrow(cls, table):
+        """to_arrow()로 만든 테이블을 복사 없이 감쌈 (메모리 맵 파일이면 버퍼를 그대로 사용)"""
+        meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+        table = table.combine_chunks()
+        arrays = {name: table.column(name).chunk(0).to_numpy(zero_copy_only=True) if table.num_rows else
+                  np.empty(0, dtype=np.int32) for name in table.column_names}
+        ticks = arrays.pop("ticks")
+        return cls(ticks, arrays, int(meta["scale"]), meta["unit"])
+
+    def to_arrow(self):
+        table = pa.table({"ticks": self.ticks, **self._columns})
+        return table.replace_schema_metadata({"scale": str(self.scale), "unit": self.unit})
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    @property
+    def nbytes(self):
+        return self.ticks.nbytes + sum(v.nbytes for v in self._columns.values())
+
+    @property
+    def dates(self):
+        return (self.ticks.astype(np.int64) * UNIT_NS[self.unit]).astype("datetime64[ns]")
+
+    def raw(self, column):
+        """배율이 곱해진 int32 원본 배열 (읽기 전용 뷰)"""
+        return self._columns[column]
+
+    def values(self, column, dtype="float64"):
+        """실제 가격 배열 (이 열만 새로 할당)"""
+        return self._columns[column].astype(dtype) / self.scale
+
+    def last(self, column='Close'):
+        return float(self._columns[column][-1]) / self.scale
+
+    def _tick(self, when):
+        return pd.Timestamp(when).value // UNIT_NS[self.unit]
+
+    def _slice(self, start, stop):
+        return PriceSeries(self.ticks[start:stop], {c: v[start:stop] for c, v in self._columns.items()}, self.scale, self.unit)
+
+    def between(self, start=None, end=None):
+        """[start, end] 구간 (이진 탐색, 복사 없는 뷰)"""
+        lo = 0 if start is None else int(np.searchsorted(self.ticks, self._tick(start), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.ticks, self._tick(end), side="right"))
+        return self._slice(lo, hi)
+
+    def tail(self, n):
+        return self._slice(max(len(self) - n, 0), len(self))
+
+    def to_frame(self, columns=None):
+        """화면 표시용 float64 DataFrame으로 변환"""
+        columns = columns or self.columns
+        return pd.DataFrame({c: self.values(c) for c in columns}, index=pd.DatetimeIndex(self.dates, name="Date"))
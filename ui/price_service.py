@@ -0,0 +1,253 @@
+import os
+import sys
+import time
+import threading
+import argparse
+from contextlib import contextmanager
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import fcntl  # 프로세스 간 파일 잠금 (POSIX)
+except ImportError:  # Windows - 프로세스 안 잠금만 사용
+    fcntl = None
+
+from ui.price_store import get_price_store, sync_many
+from ui.assets import symbols, safe_name
+from ui.price_series import PriceSeries
+from ui.metrics import metrics
+from ui.atomic import atomic_write
+
+SNAPSHOT_DIR = "data/snapshot"  # 갱신 프로세스가 쓰고 페이지들이 읽기 전용으로 붙는 스냅샷 경로
+TICKERS = symbols()  # 설정된 모든 자산 (ui/assets.py)
+MAX_AGE = 3600  # 스냅샷이 이보다 오래되면 페이지가 직접 한 번 갱신 (갱신 프로세스가 없을 때 대비)
+
+_attached = {}  # {티커: (mtime_ns, DataFrame)} - 프로세스당 한 벌만 유지
+_series = {}  # {티커: (mtime_ns, PriceSeries)}
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()  # 갱신 프로세스가 없을 때 페이지가 직접 하는 갱신을 한 번에 하나만 실행
+
+
+def snapshot_path(ticker):
+    return os.path.join(SNAPSHOT_DIR, f"{safe_name(ticker)}.arrow")
+
+
+def series_path(ticker):
+    return snapshot_path(ticker)[:-len(".arrow")] + ".series.arrow"
+
+
+def _write_arrow(table, path):
+    """Arrow IPC 파일로 기록 (임시 파일에 쓴 뒤 교체하여 읽는 쪽과 충돌하지 않음)"""
+    def write(tmp_path):
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    atomic_write(path, write)
+
+
+def publish_snapshot(ticker, df):
+    """DataFrame 스냅샷과 압축 시계열(PriceSeries) 스냅샷을 함께 발행"""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    _write_arrow(PriceSeries.from_frame(df).to_arrow(), series_path(ticker))
+    _write_arrow(pa.Table.from_pandas(df, preserve_index=True), snapshot_path(ticker))
+
+
+def attach_snapshot(ticker):
+    """스냅샷 파일을 메모리 맵으로 읽기 전용 연결
+
+    같은 파일이면 이미 연결한 DataFrame을 그대로 돌려주고, 갱신 프로세스가 파일을 교체하면 새로 연결한다.
+    데이터 버퍼는 OS 페이지 캐시를 공유하므로 워커가 늘어나도 메모리 사용량이 늘지 않는다.
+    """
+    path = snapshot_path(ticker)
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _attached.get(ticker)
+        if cached and cached[0] == mtime:
+            metrics.count("snapshot.attach.hit")
+            return cached[1]
+        metrics.count("snapshot.attach.miss")
+
+        source = pa.memory_map(path, "r")
+        table = pa.ipc.open_file(source).read_all()
+        df = table.to_pandas(split_blocks=True)  # 숫자 컬럼은 복사 없이 매핑된 버퍼를 그대로 사용
+        _attached[ticker] = (mtime, df)
+        return df
+
+
+def attach_series(ticker):
+    """압축 시계열 스냅샷을 메모리 맵으로 연결 - 모든 세션이 같은 읽기 전용 객체를 받음"""
+    path = series_path(ticker)
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _series.get(ticker)
+        if cached and cached[0] == mtime:
+            metrics.count("series.attach.hit")
+            return cached[1]
+        metrics.count("series.attach.miss")
+
+        series = PriceSeries.from_arrow(pa.ipc.open_file(pa.memory_map(path, "r")).read_all())
+        _series[ticker] = (mtime, series)
+        return series
+
+
+def _refresh(ticker):
+    with metrics.timer(f"snapshot.refresh.{ticker}"):
+        df = get_price_store(ticker).sync()
+    if not df.empty:
+        publish_snapshot(ticker, df)
+    return df
+
+
+def _refresh_many(tickers):
+    with metrics.timer("snapshot.refresh_many"):
+        frames = sync_many(tickers)
+    for ticker, df in frames.items():
+        if not df.empty:
+            publish_snapshot(ticker, df)
+    return frames
+
+
+def refresh(ticker):
+    """로컬 저장소를 증분 동기화하고 스냅샷을 다시 발행 (다른 갱신이 끝날 때까지 기다림)"""
+    with _refresh_guard():
+        return _refresh(ticker)
+
+
+def refresh_many(tickers=TICKERS):
+    """모든 티커를 한 번의 일괄 요청으로 동기화하고 각 스냅샷을 발행 - {티커: DataFrame}
+
+    갱신 프로세스, 모델 업데이트, 페이지의 대비책 갱신이 같은 저장소/스냅샷을 동시에 쓰지 않도록 잠금 안에서 실행한다.
+    """
+    with _refresh_guard():
+        return _refresh_many(tickers)
+
+
+def snapshot_age(ticker):
+    path = snapshot_path(ticker)
+    if not os.path.exists(path):
+        return None
+    return time.time() - os.stat(path).st_mtime
+
+
+def _stale(tickers, max_age):
+    stale = []
+    for ticker in tickers:
+        age = snapshot_age(ticker)
+        if age is None or age > max_age or not os.path.exists(series_path(ticker)):
+            stale.append(ticker)
+    return stale
+
+
+@contextmanager
+def _refresh_guard(blocking=True):
+    """프로세스 안(스레드 잠금)과 프로세스 사이(파일 잠금)에서 가격 저장소/스냅샷을 쓰는 쪽을 하나로 제한
+
+    재진입할 수 없으므로 잠금 안에서는 _refresh/_refresh_many를 호출한다. blocking=False면 다른 쪽이 이미 갱신 중일 때 기다리지 않고 False를 넘긴다.
+    """
+    if not _refresh_lock.acquire(blocking=blocking):
+        yield False
+        return
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        with open(os.path.join(SNAPSHOT_DIR, ".refresh.lock"), "w") as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    yield False
+                    return
+            try:
+                yield True
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    finally:
+        _refresh_lock.release()
+
+
+def ensure_fresh(tickers, max_age=MAX_AGE):
+    """갱신 프로세스가 없을 때의 대비책: 오래된 티커의 스냅샷을 한 워커/세션만 갱신
+
+    스냅샷이 이미 있으면 다른 쪽이 갱신하는 동안 기다리지 않고 기존 스냅샷을 쓰고(stale-while-revalidate),
+    스냅샷이 없으면 잠금을 기다린 뒤 그사이 다른 쪽이 만들었는지 다시 확인한다.
+    """
+    stale = _stale(tickers, max_age)
+    if not stale:
+        return
+    has_snapshot = all(os.path.exists(series_path(t)) and os.path.exists(snapshot_path(t)) for t in stale)
+    with _refresh_guard(blocking=not has_snapshot) as acquired:
+        if not acquired:
+            metrics.count("snapshot.refresh_skipped")
+            return
+        stale = _stale(stale, max_age)  # 기다리는 동안 다른 워커가 갱신했으면 건너뜀
+        if len(stale) == 1:
+            _refresh(stale[0])
+        elif stale:
+            _refresh_many(stale)
+
+
+def load_shared(ticker, max_age=MAX_AGE):
+    """페이지에서 사용하는 진입점: 공유 스냅샷을 읽고, 없거나 오래됐을 때만 직접 갱신"""
+    ensure_fresh([ticker], max_age)
+    df = attach_snapshot(ticker)
+    if df is None:
+        return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close'], index=pd.DatetimeIndex([], name="Date"))
+    return df
+
+
+def load_series(ticker, max_age=MAX_AGE):
+    """load_shared와 같지만 압축 시계열(PriceSeries)을 반환 - pandas가 필요 없는 페이지에서 사용"""
+    ensure_fresh([ticker], max_age)
+    return attach_series(ticker) or _empty_series()
+
+
+def _empty_series():
+    return PriceSeries.from_frame(pd.DataFrame(columns=['Open', 'High', 'Low', 'Close'], index=pd.DatetimeIndex([], name="Date"), dtype="float64"))
+
+
+def load_series_many(tickers, max_age=MAX_AGE):
+    """여러 티커의 압축 시계열 {티커: PriceSeries} - 오래된 티커들만 모아 일괄 요청 한 번으로 갱신"""
+    ensure_fresh(tickers, max_age)
+    return {ticker: attach_series(ticker) or _empty_series() for ticker in tickers}
+
+
+def run_refresher(tickers=TICKERS, interval=MAX_AGE // 2, once=False, forecasts=True):
+    """모든 티커의 스냅샷을 주기적으로 갱신하는 단일 갱신 프로세스 (티커 수와 관계없이 주기마다 일괄 요청 한 번)
+
+    forecasts면 갱신 뒤 종가가 바뀐 귀금속의 예측 스냅샷(ui/forecast_snapshot.py)도 다시 발행한다.
+    """
+    while True:
+        try:
+            frames = refresh_many(tickers)
+            for ticker, df in frames.items():
+                print(f"✅ {ticker}: {len(df):,}행 스냅샷 발행 ({df.index.max() if not df.empty else '-'})")
+            if forecasts:
+                from ui.forecast_snapshot import run_batch
+
+                run_batch([t for t in symbols("oz") if t in tickers])
+        except Exception as e:
+            print(f"⚠ 스냅샷 갱신 실패: {e}", file=sys.stderr)
+        if once:
+            return
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="금 가격 공유 스냅샷 갱신 프로세스")
+    parser.add_argument("--tickers", nargs="+", default=TICKERS, help="갱신할 티커 목록")
+    parser.add_argument("--interval", type=int, default=MAX_AGE // 2, help="갱신 주기 (초)")
+    parser.add_argument("--once", action="store_true", help="한 번만 갱신하고 종료")
+    parser.add_argument("--skip-forecasts", action="store_true", help="갱신 후 예측 스냅샷을 발행하지 않음")
+    args = parser.parse_args()
+    run_refresher(args.tickers, args.interval, args.once, not args.skip_forecasts)
+
+
+if __name__ == "__main__":
+    main()
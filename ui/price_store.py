@@ -0,0 +1,169 @@
+import os
+from datetime import datetime, timedelta
+import pandas as pd
+
+from ui.assets import safe_name
+from ui.metrics import metrics
+from ui.atomic import atomic_write
+
+STORE_DIR = "data/store"  # 로컬 컬럼형(Parquet) 가격 저장소 경로
+SEED_CSV = "data/gold_price_data.csv"  # GC=F 초기 데이터 (저장소가 비어 있을 때 사용)
+COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+
+def _normalize(df):
+    """소스마다 다른 형식을 Date 인덱스 + OHLC 컬럼 DataFrame으로 통일"""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMNS, index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+
+    df = df[COLUMNS].copy()
+    df.columns = COLUMNS  # yfinance의 MultiIndex 컬럼 제거
+    df.index = pd.to_datetime(df.index)
+    df.index.name = "Date"
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df.astype("float64")
+
+
+class YahooSource:
+    """Yahoo Finance(yfinance)에서 가격 데이터를 가져오는 소스"""
+
+    def fetch(self, ticker, start, end):
+        import yfinance as yf  # 네트워크가 필요할 때만 import
+
+        df = yf.download(ticker, start=start, end=end, progress=False)
+        return _normalize(df)
+
+    def fetch_many(self, tickers, start, end):
+        """여러 티커를 한 번의 요청으로 받아 {티커: DataFrame}으로 나눔"""
+        import yfinance as yf
+
+        df = yf.download(list(tickers), start=start, end=end, group_by="ticker", progress=False, threads=True)
+        frames = {}
+        for ticker in tickers:
+            if df is None or df.empty or ticker not in df.columns.get_level_values(0):
+                frames[ticker] = _normalize(None)
+                continue
+            frames[ticker] = _normalize(df[ticker].dropna(subset=['Close']))  # 다른 티커의 거래일로 생긴 빈 행 제거
+        return frames
+
+
+class CsvSource:
+    """로컬 CSV 파일을 가격 피드로 사용하는 소스 (네트워크 없이 테스트할 때 사용)"""
+
+    def __init__(self, path, sep=";"):
+        self.path = path
+        self.sep = sep
+
+    def fetch(self, ticker, start, end):
+        df = pd.read_csv(self.path, sep=self.sep, parse_dates=['Date'], index_col='Date')
+        df = df.loc[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))]
+        return _normalize(df)
+
+    def fetch_many(self, tickers, start, end):
+        return {ticker: self.fetch(ticker, start, end) for ticker in tickers}
+
+
+class PriceStore:
+    """티커별 가격을 Parquet 파일로 보관하고, 마지막 저장일 이후 데이터만 받아서 추가하는 저장소"""
+
+    def __init__(self, ticker, source=None, store_dir=STORE_DIR, seed_csv=None):
+        self.ticker = ticker
+        self.source = source or YahooSource()
+        self.store_dir = store_dir
+        self.seed_csv = seed_csv
+
+    @property
+    def path(self):
+        return os.path.join(self.store_dir, f"{safe_name(self.ticker)}.parquet")
+
+    def read(self):
+        """저장된 데이터를 읽음 (없으면 시드 CSV, 그것도 없으면 빈 DataFrame)"""
+        if os.path.exists(self.path):
+            return _normalize(pd.read_parquet(self.path, columns=COLUMNS))
+        if self.seed_csv and os.path.exists(self.seed_csv):
+            df = CsvSource(self.seed_csv).fetch(self.ticker, "1900-01-01", "2100-01-01")
+            self.write(df)
+            return df
+        return _normalize(None)
+
+    def write(self, df):
+        """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함"""
+        atomic_write(self.path, df.to_parquet)
+
+    def next_start(self, df):
+        """증분 동기화를 시작할 날짜 (마지막 저장일 다음 날)"""
+        return df.index.max() + timedelta(days=1) if not df.empty else pd.Timestamp("2004-01-01")
+
+    def append(self, df, new_rows):
+        """마지막 저장일 이후 행만 붙여서 저장하고 전체 DataFrame 반환"""
+        if not df.empty:
+            new_rows = new_rows[new_rows.index > df.index.max()]
+        if new_rows.empty:
+            return df
+
+        df = pd.concat([df, new_rows]) if not df.empty else new_rows
+        self.write(df)
+        metrics.count("price_store.rows_appended", len(new_rows))
+        return df
+
+    def sync(self, end=None):
+        """마지막 저장일 다음 날부터 end 전날까지의 데이터만 가져와 저장소에 추가"""
+        df = self.read()
+        end = pd.Timestamp(end or datetime.now().strftime('%Y-%m-%d'))
+        start = self.next_start(df)
+
+        if start >= end:
+            return df
+
+        try:
+            with metrics.timer("price_store.fetch"):
+                new_rows = self.source.fetch(self.ticker, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+        except Exception as e:
+            metrics.count("price_store.fetch_error")
+            print(f"⚠ {self.ticker} 신규 데이터를 가져오지 못했습니다: {e}")
+            return df
+        return self.append(df, new_rows)
+
+
+def sync_many(tickers, source=None, end=None):
+    """여러 티커를 시작일이 같은 티커끼리 일괄 요청으로 증분 동기화하고 {티커: DataFrame} 반환
+
+    보통은 모든 티커의 마지막 저장일이 같아 요청 한 번이면 된다. 저장된 행이 없는 티커(2004년부터 받아야 함)는
+    따로 요청하므로 다른 티커까지 전체 이력을 다시 받지 않는다. 받은 행 중 이미 있는 날짜는 버리고 붙인다.
+    """
+    stores = {ticker: get_price_store(ticker) for ticker in tickers}
+    frames = {ticker: store.read() for ticker, store in stores.items()}
+    end = pd.Timestamp(end or datetime.now().strftime('%Y-%m-%d'))
+    pending = [ticker for ticker in tickers if stores[ticker].next_start(frames[ticker]) < end]
+    if not pending:
+        return frames
+
+    source = source or stores[pending[0]].source
+    groups = {}
+    for ticker in pending:
+        groups.setdefault(stores[ticker].next_start(frames[ticker]), []).append(ticker)
+
+    for start, group in sorted(groups.items()):
+        try:
+            with metrics.timer("price_store.fetch_many"):
+                fetched = source.fetch_many(group, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+        except Exception as e:
+            metrics.count("price_store.fetch_error")
+            print(f"⚠ {', '.join(group)} 신규 데이터를 가져오지 못했습니다: {e}")
+            continue
+        for ticker in group:
+            frames[ticker] = stores[ticker].append(frames[ticker], fetched.get(ticker, _normalize(None)))
+    return frames
+
+
+_stores = {}
+
+
+def get_price_store(ticker, source=None):
+    """프로세스당 티커별 저장소 인스턴스를 하나만 만들어 재사용"""
+    if ticker not in _stores:
+        seed_csv = SEED_CSV if ticker == 'GC=F' else None
+        _stores[ticker] = PriceStore(ticker, source=source, seed_csv=seed_csv)
+    elif source is not None:
+        _stores[ticker].source = source
+    return _stores[ticker]
@@ -0,0 +1,122 @@
+import threading
+import numpy as np
+import pandas as pd
+
+BLOCK = 64  # 최솟값/최댓값 블록 크기 (블록 단위는 희소 테이블, 경계 블록은 직접 계산)
+
+
+def _sparse_table(block_values, func):
+    """블록 단위 값에 대한 희소 테이블: table[k][i] = func(block_values[i : i + 2**k])"""
+    table = [block_values]
+    k = 1
+    while (1 << k) <= len(block_values):
+        prev = table[-1]
+        half = 1 << (k - 1)
+        table.append(func(prev[:-half], prev[half:]))
+        k += 1
+    return table
+
+
+class PriceRangeIndex:
+    """정렬된 int64 날짜 배열 위에서 날짜 구간 조회와 구간 통계를 빠르게 계산하는 인덱스
+
+    - 구간 위치: 이진 탐색 (O(log n))
+    - 평균/표준편차: 누적합과 제곱 누적합 (O(1))
+    - 최솟값/최댓값: 블록 희소 테이블 + 경계 블록 (O(BLOCK))
+    - 조회 결과는 복사 없이 원본 DataFrame의 뷰(iloc 슬라이스)로 반환
+    """
+
+    def __init__(self, df, columns=('Open', 'High', 'Low', 'Close')):
+        self.df = df
+        self.columns = [c for c in columns if c in df.columns]
+        self.days = df.index.values.astype('datetime64[D]').astype(np.int64)
+        self._values = {}
+        self._sum = {}
+        self._sumsq = {}
+        self._center = {}
+        self._min_table = {}
+        self._max_table = {}
+
+        for column in self.columns:
+            values = df[column].to_numpy(dtype="float64")
+            center = float(values.mean()) if len(values) else 0.0  # 제곱합의 수치 오차를 줄이기 위해 평균을 빼서 누적
+            shifted = values - center
+            self._values[column] = values
+            self._center[column] = center
+            self._sum[column] = np.concatenate([[0.0], np.cumsum(shifted)])
+            self._sumsq[column] = np.concatenate([[0.0], np.cumsum(shifted * shifted)])
+
+            n_blocks = len(values) // BLOCK
+            blocks = values[:n_blocks * BLOCK].reshape(n_blocks, BLOCK) if n_blocks else np.empty((0, BLOCK))
+            self._min_table[column] = _sparse_table(blocks.min(axis=1), np.minimum)
+            self._max_table[column] = _sparse_table(blocks.max(axis=1), np.maximum)
+
+        self._describe = df[self.columns].describe() if len(df) else None
+
+    def positions(self, start, end):
+        """[start, end] 날짜 구간(양 끝 포함)에 해당하는 행 위치 (i, j) - df.iloc[i:j]"""
+        start_day = np.datetime64(pd.Timestamp(start).date(), 'D').astype(np.int64)
+        end_day = np.datetime64(pd.Timestamp(end).date(), 'D').astype(np.int64)
+        i = int(np.searchsorted(self.days, start_day, side='left'))
+        j = int(np.searchsorted(self.days, end_day, side='right'))
+        return i, max(i, j)
+
+    def view(self, start, end):
+        i, j = self.positions(start, end)
+        return self.df.iloc[i:j]
+
+    def _block_extreme(self, column, i, j, table, func, reduce):
+        values = self._values[column]
+        first_block = -(-i // BLOCK)  # 올림
+        last_block = j // BLOCK
+        if first_block >= last_block:
+            return reduce(values[i:j])
+
+        k = (last_block - first_block).bit_length() - 1
+        level = table[column][k]
+        result = func(level[first_block], level[last_block - (1 << k)])
+        if i < first_block * BLOCK:
+            result = func(result, reduce(values[i:first_block * BLOCK]))
+        if last_block * BLOCK < j:
+            result = func(result, reduce(values[last_block * BLOCK:j]))
+        return result
+
+    def stats(self, start, end):
+        """구간의 count/mean/std/min/max를 DataFrame(describe()와 같은 모양)으로 반환"""
+        i, j = self.positions(start, end)
+        count = j - i
+        rows = {}
+        for column in self.columns:
+            if count == 0:
+                rows[column] = [0, np.nan, np.nan, np.nan, np.nan]
+                continue
+            total = self._sum[column][j] - self._sum[column][i]
+            total_sq = self._sumsq[column][j] - self._sumsq[column][i]
+            mean = total / count
+            var = (total_sq - count * mean * mean) / (count - 1) if count > 1 else np.nan
+            rows[column] = [
+                count,
+                mean + self._center[column],
+                np.sqrt(max(var, 0.0)) if count > 1 else np.nan,
+                self._block_extreme(column, i, j, self._min_table, min, np.min),
+                self._block_extreme(column, i, j, self._max_table, max, np.max),
+            ]
+        return pd.DataFrame(rows, index=['count', 'mean', 'std', 'min', 'max'])
+
+    def describe(self):
+        """전체 기간 describe() 결과 (인덱스를 만들 때 한 번만 계산)"""
+        return self._describe
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_range_index(ticker, df):
+    """데이터가 바뀔 때(공유 스냅샷 교체)만 인덱스를 다시 만듦"""
+    with _lock:
+        index = _indexes.get(ticker)
+        if index is None or index.df is not df:
+            index = PriceRangeIndex(df)
+            _indexes[ticker] = index
+        return index
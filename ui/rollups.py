@@ -0,0 +1,76 @@
+import threading
+import pandas as pd
+
+# 기간 이름 -> pandas Period 빈도
+PERIODS = {
+    '주별': 'W',
+    '월별': 'M',
+    '분기별': 'Q',
+    '년별': 'Y',
+}
+OHLC_AGG = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
+
+
+def _rollup(daily, freq):
+    """일별 데이터를 기간별 OHLC 봉으로 집계 (인덱스는 PeriodIndex)"""
+    keys = daily.index.to_period(freq)
+    return daily.groupby(keys).agg(OHLC_AGG)
+
+
+def _to_timestamp(bars):
+    """차트용으로 기간의 마지막 날짜를 인덱스로 사용 (resample('M').last()와 같은 라벨)"""
+    bars = bars.copy()
+    bars.index = bars.index.to_timestamp(how='end').normalize()
+    bars.index.name = "Date"
+    return bars
+
+
+class Rollups:
+    """주/월/분기/년 OHLC 봉을 데이터 갱신 시 한 번만 만들고, 새 일봉이 추가되면 마지막 구간만 다시 계산"""
+
+    def __init__(self, daily):
+        self.daily = daily
+        self._bars = {freq: _rollup(daily, freq) for freq in PERIODS.values()}
+        self._views = {freq: _to_timestamp(bars) for freq, bars in self._bars.items()}
+
+    def get(self, period):
+        """기간 이름('일별', '주별', '월별', '분기별', '년별')에 해당하는 봉을 조회"""
+        if period == '일별':
+            return self.daily
+        return self._views[PERIODS[period]]
+
+    def append(self, new_rows):
+        """새 일봉을 추가하고 영향을 받는 구간(마지막 기간부터)만 다시 집계"""
+        new_rows = new_rows[new_rows.index > self.daily.index.max()] if not self.daily.empty else new_rows
+        if new_rows.empty:
+            return
+        self.daily = pd.concat([self.daily, new_rows])
+
+        for freq, bars in self._bars.items():
+            first_period = new_rows.index[0].to_period(freq)
+            tail = self.daily.loc[first_period.start_time:]
+            self._bars[freq] = pd.concat([bars[bars.index < first_period], _rollup(tail, freq)])
+            self._views[freq] = _to_timestamp(self._bars[freq])
+
+
+_rollups = {}
+_lock = threading.Lock()
+
+
+def get_rollups(ticker, daily):
+    """티커별 롤업을 재사용하고, 일별 데이터가 뒤로 늘어난 경우에는 증분 갱신만 수행"""
+    with _lock:
+        rollups = _rollups.get(ticker)
+        if rollups is not None:
+            current = rollups.daily
+            if len(current) == len(daily) and (current.empty or current.index[-1] == daily.index[-1]):
+                return rollups
+            if (not current.empty and len(daily) > len(current)
+                    and daily.index[0] == current.index[0] and daily.index[len(current) - 1] == current.index[-1]):
+                rollups.append(daily.iloc[len(current):])
+                rollups.daily = daily  # 공유 스냅샷 객체를 그대로 참조
+                return rollups
+
+        rollups = Rollups(daily)
+        _rollups[ticker] = rollups
+        return rollups
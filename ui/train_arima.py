@@ -0,0 +1,171 @@
+import os
+import time
+import signal
+import argparse
+import itertools
+import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+import pandas as pd
+
+from ui.model_registry import MODEL_DIR, slim_arima, dump_atomic, arima_path
+from ui.assets import safe_name
+
+
+def leaderboard_path(ticker="GC=F"):
+    """티커별 리더보드 CSV 경로 (다른 티커의 탐색 결과를 덮어쓰지 않도록)"""
+    return os.path.join(MODEL_DIR, f"{safe_name(ticker)}_arima_leaderboard.csv")
+
+
+class FitTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise FitTimeout()
+
+
+def fit_order(endog, order, timeout=None, maxiter=50):
+    """(p, d, q) 하나를 학습하고 결과 행과 경량 모델을 반환 (워커 프로세스에서 실행)
+
+    SIGALRM을 지원하는 OS에서는 timeout초가 지나면 학습을 중단한다.
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+
+    row = {"order": order, "p": order[0], "d": order[1], "q": order[2],
+           "aic": np.nan, "bic": np.nan, "converged": False, "seconds": np.nan, "status": "ok"}
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    started = time.perf_counter()
+    slim = None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = ARIMA(endog, order=order).fit(method_kwargs={"maxiter": maxiter})
+        row.update(aic=results.aic, bic=results.bic, converged=bool(results.mle_retvals.get("converged", False)))
+        slim = slim_arima(results)
+    except FitTimeout:
+        row["status"] = "timeout"
+    except Exception as e:  # statsmodels의 어떤 오류든 이 차수만 실패로 기록하고 탐색은 계속
+        row["status"] = f"error: {type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        row["seconds"] = time.perf_counter() - started
+    return row, slim
+
+
+def _pruned(order, done, best_aic, prune_delta):
+    """같은 d에서 더 단순한 이웃 (p-1, q-1)이 모두 최고 AIC보다 prune_delta 이상 나쁘면 건너뜀"""
+    p, d, q = order
+    neighbors = [n for n in ((p - 1, d, q), (p, d, q - 1)) if min(n) >= 0]
+    if not neighbors or any(n not in done for n in neighbors):
+        return False
+    return all(not (done[n] <= best_aic + prune_delta) for n in neighbors)  # 실패(NaN)도 나쁜 것으로 취급
+
+
+def search_orders(endog, p_values=range(0, 6), d_values=range(0, 3), q_values=range(0, 6),
+                  workers=None, timeout=120, maxiter=50, prune_delta=50.0, patience=None):
+    """(p, d, q) 격자를 프로세스 풀에서 병렬로 탐색하고 (리더보드, 최적 경량 모델)을 반환
+
+    단순한 차수부터 순서대로 제출하며, AIC 기반 가지치기와 patience 기반 조기 종료를 적용한다.
+    patience는 최고 AIC가 갱신되지 않은 채 끝난 학습 수가 이 값에 도달하면 남은 후보를 취소한다.
+    최적화가 수렴하지 않은 학습(maxiter 도달)은 AIC를 믿을 수 없으므로 최적 모델 후보에서 제외한다.
+    """
+    endog = np.asarray(endog, dtype="float64")
+    candidates = sorted(itertools.product(p_values, d_values, q_values), key=lambda o: (o[0] + o[2], o[1], o))
+    workers = workers or os.cpu_count() or 1
+
+    rows, done = [], {}
+    best_aic, best_slim = np.inf, None
+    since_best = 0
+    pending = {}
+    queue = list(candidates)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while queue or pending:
+            while queue and len(pending) < workers:
+                order = queue.pop(0)
+                if _pruned(order, done, best_aic, prune_delta):
+                    done[order] = np.nan
+                    rows.append({"order": order, "p": order[0], "d": order[1], "q": order[2], "status": "pruned"})
+                    continue
+                pending[executor.submit(fit_order, endog, order, timeout, maxiter)] = order
+
+            if not pending:
+                continue
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                order = pending.pop(future)
+                try:
+                    row, slim = future.result()
+                except Exception as e:  # 워커 프로세스 비정상 종료 등
+                    row, slim = {"order": order, "p": order[0], "d": order[1], "q": order[2], "aic": np.nan,
+                                 "converged": False, "status": f"error: {type(e).__name__}: {e}"}, None
+                rows.append(row)
+                done[order] = row["aic"]
+                if row["converged"] and row["aic"] < best_aic:
+                    best_aic, best_slim, since_best = row["aic"], slim, 0
+                    print(f"  ✨ {order}: AIC {row['aic']:,.1f} ({row['seconds']:.1f}s)")
+                else:
+                    since_best += 1
+
+            if patience and since_best >= patience and queue:
+                print(f"  ⏹ {patience}회 연속 개선이 없어 남은 {len(queue)}개 후보를 건너뜁니다.")
+                rows.extend({"order": o, "p": o[0], "d": o[1], "q": o[2], "status": "skipped"} for o in queue)
+                queue.clear()
+
+    leaderboard = pd.DataFrame(rows)
+    leaderboard["converged"] = leaderboard["converged"].astype("boolean").fillna(False).astype(bool)
+    leaderboard = leaderboard.sort_values(["converged", "aic"], ascending=[False, True], na_position="last").reset_index(drop=True)
+    return leaderboard, best_slim
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARIMA (p, d, q) 병렬 탐색 후 최적 모델 저장")
+    parser.add_argument("--ticker", default="GC=F", help="학습할 티커 (로컬 가격 저장소의 종가 사용)")
+    parser.add_argument("--p-max", type=int, default=5)
+    parser.add_argument("--d-max", type=int, default=2)
+    parser.add_argument("--q-max", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--timeout", type=float, default=120, help="한 차수의 최대 학습 시간 (초)")
+    parser.add_argument("--maxiter", type=int, default=50, help="최적화 최대 반복 횟수")
+    parser.add_argument("--prune-delta", type=float, default=50.0, help="AIC 가지치기 기준")
+    parser.add_argument("--patience", type=int, default=None, help="개선 없이 끝난 학습이 이 횟수에 도달하면 조기 종료")
+    parser.add_argument("--output", default=None, help="최적 경량 모델 저장 경로 (기본: 티커별 model/*_arima.slim.pkl)")
+    parser.add_argument("--leaderboard", default=None, help="리더보드 CSV 저장 경로 (기본: 티커별 model/*_arima_leaderboard.csv)")
+    args = parser.parse_args()
+
+    args.output = args.output or arima_path(args.ticker)
+    args.leaderboard = args.leaderboard or leaderboard_path(args.ticker)
+    from ui.price_service import refresh  # 학습 워커 프로세스는 가격 저장소를 쓰지 않으므로 여기서만 import
+
+    endog = refresh(args.ticker)['Close']  # 다른 갱신과 겹치지 않도록 스냅샷 갱신 잠금 안에서 동기화
+    print(f"📊 {args.ticker} 종가 {len(endog):,}개 ({endog.index.min().date()} ~ {endog.index.max().date()})로 학습합니다.")
+
+    started = time.perf_counter()
+    leaderboard, best_slim = search_orders(
+        endog.to_numpy(),
+        p_values=range(args.p_max + 1), d_values=range(args.d_max + 1), q_values=range(args.q_max + 1),
+        workers=args.workers, timeout=args.timeout, maxiter=args.maxiter,
+        prune_delta=args.prune_delta, patience=args.patience,
+    )
+    if best_slim is None:
+        print("❌ 수렴한 차수가 없습니다. --maxiter를 늘리거나 탐색 범위를 바꿔 보세요.")
+        return 1
+
+    best_slim["origin"] = str(endog.index[-1])  # 배열로 학습했으므로 날짜 기준점을 직접 기록
+    dump_atomic(best_slim, args.output)
+    leaderboard.to_csv(args.leaderboard, index=False)
+
+    print(f"✅ 최적 차수 {best_slim['order']} (AIC {leaderboard['aic'].iloc[0]:,.1f}), 총 {time.perf_counter() - started:.1f}s")
+    print(f"   모델: {args.output}\n   리더보드: {args.leaderboard}")
+    print(leaderboard.head(10).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
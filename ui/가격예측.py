@@ -1,26 +1,25 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import joblib  # ARIMA 모델 로드용
 from datetime import datetime, timedelta
-import requests
 import io  # 파일 저장을 위한 라이브러리
-import os  # 경로 확인용
 
+from ui.forecast_snapshot import current_snapshot, lookup, build_frame, registered_models
+from ui.forecast_engine import trading_steps, step_dates
+from ui.model_registry import registry, arima_name
+from ui.assets import symbols, asset_name, safe_name
+from ui.fx import fx_provider
+from ui.metrics import timed
 
-# ARIMA 모델 로드 함수 (예외 처리 추가)
-def load_arima_model():
-    model_path = "model/gold_price_arima.pkl"  # 모델 파일 경로
-
-    if not os.path.exists(model_path):  # 파일 존재 여부 확인
-        st.error(f"❌ 모델 파일을 찾을 수 없습니다: `{model_path}`")
-        st.stop()  # 앱 실행 중단
 
+# ARIMA 모델 로드 함수 (예외 처리 추가)
+@timed("load_arima_model")
+def load_arima_model(ticker="GC=F"):
+    # 레지스트리가 프로세스당 한 번만 불러오므로 재실행(rerun)마다 pkl을 다시 읽지 않음
     try:
-        model = joblib.load(model_path, mmap_mode=None)
-        return model
-    except FileNotFoundError:
-        st.error("❌ 모델 파일을 찾을 수 없습니다.")
+        return registry.get(arima_name(ticker))
+    except FileNotFoundError as e:
+        st.error(f"❌ 모델 파일을 찾을 수 없습니다: `{e}`")
     except EOFError:
         st.error("❌ 모델 파일이 손상되었습니다. 다시 저장해 주세요.")
     except ModuleNotFoundError as e:
@@ -31,27 +30,40 @@ def load_arima_model():
     st.stop()  # 오류 발생 시 실행 중단
 
 
-# 환율 정보 가져오는 함수 (예외 처리 추가)
-def get_exchange_rate():
-    url = "https://v6.exchangerate-api.com/v6/553ac17cfdac2697c92cd6a8/latest/USD"
+def origin_to_date(origin):
+    """모델 기준점을 날짜로 변환 (날짜 정보가 없는 모델이면 오늘 날짜 사용)"""
+    if origin and not str(origin).isdigit():  # 숫자만 있으면 날짜가 아닌 관측 위치
+        try:
+            return pd.Timestamp(origin).date()
+        except ValueError:
+            pass
+    return datetime.today().date()
 
-    try:
-        response = requests.get(url, timeout=5)  # 5초 timeout 설정
-        response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
-        data = response.json()
-        return data["conversion_rates"]["KRW"]
-    except requests.exceptions.RequestException:
-        st.warning("⚠️ 환율 정보를 가져오는 데 실패했습니다. 기본값 1300원 적용.")
-        return 1300  # 기본 환율 값 설정
+
+# 환율 정보 가져오는 함수 (예외 처리 추가)
+@timed("get_exchange_rate")
+def get_exchange_rate(currency="KRW"):
+    # 캐시된 환율을 바로 사용하고, 만료된 경우 백그라운드에서 갱신 (요청이 HTTP 응답을 기다리지 않음)
+    rate, is_default = fx_provider.rate(currency)
+    if is_default:
+        st.warning(f"⚠️ 환율 정보를 가져오는 데 실패했습니다. 기본값 {rate:,.0f} 적용.")
+    return rate
 
 
 # 예측 실행 함수
 def run_ml():
-    st.markdown("<p class='big-font'>🏅 금 가격 예측기 (ARIMA 모델 적용)</p>", unsafe_allow_html=True)
-    st.markdown("고급 ARIMA 모델을 사용하여 미래의 금 가격을 예측해보세요! 📈")
-
-    # 모델 로드
-    model = load_arima_model()
+    # 예측 대상은 트로이온스 단위 자산 (ui/assets.py) - 학습된 ARIMA가 없는 자산은 선형 추세 모델만 사용
+    tickers = symbols("oz")
+    ticker = st.selectbox("예측할 자산", tickers, format_func=asset_name) if len(tickers) > 1 else tickers[0]
+    name = asset_name(ticker)
+    unit = "XAU" if ticker == "GC=F" else "USD"
+    usd_column, krw_column = f"예측 {name} 가격 ({unit}/온스)", f"예측 {name} 가격 (KRW/그램)"
+
+    # 제목/소개는 이 자산에 실제로 쓰이는 모델로 표시 (학습된 ARIMA가 없으면 선형 추세만)
+    has_arima = registry.path(arima_name(ticker)) is not None
+    model_label = "ARIMA + 선형 추세 모델" if has_arima else "선형 추세 모델"
+    st.markdown(f"<p class='big-font'>🏅 {name} 가격 예측기 ({model_label} 적용)</p>", unsafe_allow_html=True)
+    st.markdown(f"{model_label}을 사용하여 미래의 {name} 가격을 예측해보세요! 📈")
 
     # 날짜 선택 방식
     date_option = st.radio("날짜 선택 방식", ["하나의 날짜 선택", "시작과 끝 날짜 선택"])
@@ -65,40 +77,61 @@ def run_ml():
         prediction_date = None
 
     # 예측 버튼
-    predict_button = st.button("🔮 금 가격 예측하기")
+    predict_button = st.button(f"🔮 {name} 가격 예측하기")
 
     if predict_button:
-        # 예측 실행
+        # 배치 작업(ui/forecast_snapshot.py)이 현재 모델로 발행한 스냅샷이 있으면 표에서 바로 조회하고,
+        # 없거나 365일을 넘는 기간이면 요청 안에서 모델을 실행 (같은 모델/기준일의 예측은 캐시에서 재사용)
+        snapshot = current_snapshot(ticker)
+        models = None
+        if snapshot:
+            origin = snapshot[0]["origin"]
+        else:
+            if has_arima:
+                load_arima_model(ticker)  # 모델 파일 오류를 화면에 표시
+            models = registered_models(ticker)
+            if not models:
+                st.error(f"❌ {name} 가격 데이터가 없어 예측할 수 없습니다.")
+                return
+            origin = next(iter(models.values())).origin
+        # 예측 단계는 모델이 마지막으로 관측한 날짜부터 계산 (야간 업데이트로 최신 종가가 반영됨)
+        origin_date = origin_to_date(origin)
+
         if date_option == "하나의 날짜 선택":
-            days_to_predict = (prediction_date - datetime.today().date()).days
-            forecast_values = model.forecast(steps=days_to_predict).tolist()
-            forecast_dates = [prediction_date]
-            predicted_prices = [forecast_values[-1]]
+            forecast_dates = pd.DatetimeIndex([prediction_date])
         else:
-            days_to_predict = (end_date - datetime.today().date()).days
-            forecast_values = model.forecast(steps=days_to_predict).tolist()
             forecast_dates = pd.date_range(start=start_date, end=end_date)
-            predicted_prices = forecast_values[-len(forecast_dates):]
-
-        # 환율 정보 가져오기
-        exchange_rate = get_exchange_rate()
+        # 모델의 한 단계는 거래일 하나이므로 달력일이 아닌 거래일 수로 변환 (주말은 직전 거래일의 예측)
+        horizons = trading_steps(origin_date, forecast_dates)
+
+        if snapshot and horizons.max() <= snapshot[0]["horizons"][1]:
+            manifest, table = snapshot
+            df_models = pd.concat([lookup(table, model_name, horizons) for model_name in table["모델"].unique()], ignore_index=True)
+            exchange_rate = manifest["rates"].get("KRW") or get_exchange_rate()
+            fx_time = datetime.fromtimestamp(manifest["fx_fetched_at"]).strftime("%Y-%m-%d %H:%M") if manifest["fx_fetched_at"] else "기본 환율"
+            st.caption(f"⚡ 예측 스냅샷 {manifest['version']}에서 조회 (환율 {exchange_rate:,.2f}원/USD, {fx_time} 기준)")
+        else:
+            exchange_rate = get_exchange_rate()
+            df_models = build_frame(models or registered_models(ticker), {"KRW": exchange_rate}, horizons)
 
+        primary_rows = df_models[df_models["모델"] == df_models["모델"].iloc[0]]  # ARIMA (없으면 선형 추세)
+        predicted_prices = primary_rows["예측 (USD/온스)"].to_numpy()
 
-        # 예측 결과 데이터프레임 생성
+        # 예측 결과 데이터프레임 생성 (그램당 가격은 예측표에 계산된 값을 그대로 사용)
         df_result = pd.DataFrame({
             "날짜": forecast_dates,
-            "예측 금 가격 (XAU/온스)": predicted_prices,
-            "예측 금 가격 (KRW/그램)": [(price / 31.1035) * exchange_rate for price in predicted_prices]
+            usd_column: predicted_prices,
+            krw_column: primary_rows["예측 (KRW/그램)"].to_numpy()
         })
 
         # 날짜 형식 변환 후 문자열로 변환 (YYYY-MM-DD)
         df_result["날짜"] = pd.to_datetime(df_result["날짜"]).dt.strftime("%Y-%m-%d")
 
-        # XAU/온스 값 소수점 2자리까지 반올림
-        df_result["예측 금 가격 (XAU/온스)"] = df_result["예측 금 가격 (XAU/온스)"].round(2)
+        # 온스당 가격 소수점 2자리까지 반올림
+        df_result[usd_column] = df_result[usd_column].round(2)
 
         # 한화(KRW) 가격을 3자리마다 콤마 추가한 문자열로 변환
-        df_result["예측 금 가격 (KRW/그램)"] = df_result["예측 금 가격 (KRW/그램)"].apply(lambda x: f"{x:,.0f}")
+        df_result[krw_column] = df_result[krw_column].apply(lambda x: f"{x:,.0f}")
 
 
         st.info("📸 Plotly 그래프의 카메라 버튼을 클릭하면 그래프를 다운로드할 수 있습니다.")
@@ -112,25 +145,38 @@ def run_ml():
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=df_result["날짜"],
-            y=df_result["예측 금 가격 (XAU/온스)"],
+            y=df_result[usd_column],
             mode='lines+markers',
-            name='예측 금 가격',
+            name=f'예측 {name} 가격',
             marker=dict(size=8, color='gold')
         ))
 
         fig.update_layout(
-            title="📉 금 가격 예측 (XAU/온스)",
+            title=f"📉 {name} 가격 예측 ({unit}/온스)",
             xaxis_title="날짜",
-            yaxis_title="예측 금 가격 (XAU/온스)",
+            yaxis_title=usd_column,
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)'
         )
 
         st.plotly_chart(fig, use_container_width=True)
 
+        # 모델 비교: 여러 모델과 앙상블 (예측표에 이미 함께 계산되어 있음)
+        with st.expander(f"🧮 모델별 예측 비교 ({' / '.join(df_models['모델'].unique())})"):
+            df_compare = df_models[["모델", "기간(일)", "예측 (USD/온스)", "하한 (USD/온스)", "상한 (USD/온스)", "예측 (KRW/그램)"]].copy()
+            df_compare = df_compare.drop_duplicates(["모델", "기간(일)"])  # 주말은 직전 거래일과 같은 단계
+            df_compare.insert(1, "날짜", step_dates(origin_date, df_compare["기간(일)"]).strftime("%Y-%m-%d"))
+
+            fig_compare = go.Figure()
+            for model_name, group in df_compare.groupby("모델", sort=False):
+                fig_compare.add_trace(go.Scatter(x=group["날짜"], y=group["예측 (USD/온스)"], mode='lines+markers', name=model_name))
+            fig_compare.update_layout(title=f"📊 모델별 예측 비교 ({unit}/온스)", xaxis_title="날짜", yaxis_title=usd_column)
+            st.plotly_chart(fig_compare, use_container_width=True)
+            st.dataframe(df_compare.round(2), hide_index=True)
+
         st.warning(
         "⚠️ **주의사항**\n"
-        "- 금 가격은 다양한 경제적, 정치적 요인에 영향을 받기 때문에 정확한 장기 예측은 어려울 수 있습니다.\n"
+        f"- {name} 가격은 다양한 경제적, 정치적 요인에 영향을 받기 때문에 정확한 장기 예측은 어려울 수 있습니다.\n"
         "- AI 모델은 과거 데이터를 기반으로 예측하므로, 예상치 못한 사건이나 급격한 시장 변화를 반영하지 못할 수 있습니다."
         )
 
@@ -141,7 +187,7 @@ def run_ml():
         st.download_button(
             label="📥 예측 결과 다운로드 (CSV)",
             data=csv_file,
-            file_name=f"gold_price_prediction_{datetime.today().date()}.csv",
+            file_name=f"{'gold' if ticker == 'GC=F' else safe_name(ticker).lower()}_price_prediction_{datetime.today().date()}.csv",
             mime="text/csv"
         )
         st.text("엑셀 등에서 열었을 때 데이터가 깨지지 않도록 utf-8-sig 인코딩 적용")
@@ -0,0 +1,94 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from ui.assets import load_assets
+from ui.price_service import load_series_many
+from ui.cross_asset import get_asset_matrix
+from ui.downsample import MAX_POINTS
+from ui.metrics import timed
+
+PERIODS = {"전체": None, "최근 1년": 1, "최근 3년": 3, "최근 5년": 5}
+
+
+def _thin(df, max_points=MAX_POINTS):
+    """여러 열을 같은 간격으로 솎아 브라우저로 보내는 점 개수 제한 (열마다 다른 날짜가 남지 않도록 행 단위로)"""
+    step = max(len(df) // max_points, 1)
+    return df.iloc[::step] if step > 1 else df
+
+
+@timed("load_asset_matrix")
+def load_asset_matrix():
+    """설정된 모든 자산을 일괄 갱신/로드해 자산 이름 기준으로 정렬한 행렬 반환 (스냅샷이 그대로면 캐시된 행렬)"""
+    assets, derived = load_assets()
+    names = {a['symbol']: a['name'] for a in assets}
+    series = load_series_many(list(names))
+    derived = {name: (names.get(price, price), names.get(fx, fx)) for name, (price, fx) in derived.items()}
+    return get_asset_matrix({names[t]: s for t, s in series.items()}, derived)
+
+
+def run_compare():
+    st.markdown("<p style='font-size:32px; font-weight:bold; color:#4B0082; text-align:center;'>🔗 자산 비교</p>", unsafe_allow_html=True)
+
+    matrix = load_asset_matrix()
+    if not len(matrix.days):
+        st.error("❌ 가격 데이터를 불러오는 데 실패했습니다.")
+        return
+    available = matrix.names
+    defaults = [name for name in ("금", "은", "백금") if name in available] or available[:2]
+    selected = st.multiselect("📌 비교할 자산", available, default=defaults)
+    if not selected:
+        st.info("비교할 자산을 한 개 이상 선택하세요.")
+        return
+
+    period = st.selectbox('📅 기간 선택', list(PERIODS))
+    years = PERIODS[period]
+    start = None if years is None else matrix.dates[-1] - pd.DateOffset(years=years)
+    view = matrix.select(selected, start)
+
+    # 상대 성과 (기간 첫날 = 100)
+    st.markdown("### 📈 상대 성과 (기간 첫날 = 100)")
+    fig = px.line(_thin(view.rebased()), title=f"📈 {period} 상대 성과")
+    fig.update_layout(xaxis_title="날짜", yaxis_title="지수", template="plotly_dark", legend_title_text="")
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 수익률 상관관계 (행렬 곱 한 번으로 모든 자산 쌍 계산)
+    if len(selected) > 1:
+        st.markdown("### 🔥 일간 수익률 상관관계")
+        corr = view.correlation()
+        fig_corr = px.imshow(corr, text_auto=".2f", zmin=-1, zmax=1, color_continuous_scale="RdBu_r",
+                             title=f"📊 {period} 수익률 상관계수")
+        st.plotly_chart(fig_corr, use_container_width=True)
+
+    # 가격 비율과 이동 상관계수
+    st.markdown("### ⚖️ 가격 비율")
+    col1, col2 = st.columns(2)
+    with col1:
+        a = st.selectbox("분자", available, index=available.index("금") if "금" in available else 0)
+    with col2:
+        b = st.selectbox("분모", available, index=available.index("은") if "은" in available else min(1, len(available) - 1))
+    if a == b:
+        st.caption("서로 다른 두 자산을 선택하세요.")
+        return
+
+    pair = matrix.select([a, b], start)
+    ratio = pair.ratio(a, b)
+    if ratio.empty:
+        st.warning("⚠ 두 자산이 함께 거래된 날이 없습니다.")
+        return
+    col1, col2, col3 = st.columns(3)
+    col1.metric("현재 비율", f"{ratio.iloc[-1]:,.2f}")
+    col2.metric("기간 평균", f"{ratio.mean():,.2f}")
+    col3.metric("기간 범위", f"{ratio.min():,.2f} ~ {ratio.max():,.2f}")
+    fig_ratio = px.line(_thin(ratio.to_frame()), title=f"📈 {a} / {b} 가격 비율", color_discrete_sequence=["#DAA520"])
+    fig_ratio.update_layout(xaxis_title="날짜", yaxis_title="비율", template="plotly_dark", showlegend=False)
+    st.plotly_chart(fig_ratio, use_container_width=True)
+
+    window = st.slider("이동 상관계수 기간 (거래일)", 20, 250, 60, step=10)
+    rolling = pair.rolling_correlation(a, b, window)
+    if rolling.empty:
+        st.caption("이동 상관계수를 계산하기에 기간이 짧습니다.")
+    else:
+        fig_rolling = px.line(_thin(rolling.to_frame()), title=f"📉 {a} / {b} {window}일 이동 상관계수")
+        fig_rolling.update_layout(xaxis_title="날짜", yaxis_title="상관계수", yaxis_range=[-1, 1], template="plotly_dark", showlegend=False)
+        st.plotly_chart(fig_rolling, use_container_width=True)
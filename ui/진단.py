@@ -0,0 +1,52 @@
+import json
+import streamlit as st
+import pandas as pd
+
+from ui.metrics import metrics
+
+
+def run_diagnostics():
+    """숨겨진 진단 페이지 (?page=diagnostics 로 접근) - 프로세스의 핫패스 계측값 표시"""
+    st.markdown("<p class='big-font'>🩺 진단</p>", unsafe_allow_html=True)
+    snapshot = metrics.snapshot()
+    st.caption(f"프로세스 가동 시간: {snapshot['uptime_s'] / 60:,.1f}분 · 값은 이 서버 프로세스 기준입니다.")
+
+    # 호출 지연 시간
+    st.markdown("### ⏱ 호출 지연 시간")
+    timers = snapshot["timers"]
+    if timers:
+        df_timers = pd.DataFrame({name: {k: v for k, v in summary.items() if k != "buckets"} for name, summary in timers.items()}).T
+        st.dataframe(df_timers.sort_values("mean_ms", ascending=False).round(2), use_container_width=True)
+
+        name = st.selectbox("히스토그램", list(timers))
+        buckets = pd.Series(timers[name]["buckets"], name="호출 수")
+        st.bar_chart(buckets)
+    else:
+        st.info("아직 기록된 호출이 없습니다. 다른 페이지를 먼저 열어 보세요.")
+
+    # 캐시 적중/실패 등 카운터
+    st.markdown("### 🔢 카운터")
+    if snapshot["counters"]:
+        st.dataframe(pd.Series(snapshot["counters"], name="값").sort_index(), use_container_width=True)
+
+    # 모델 로드 정보
+    from ui.model_registry import registry
+
+    model_stats = registry.stats()
+    if model_stats:
+        st.markdown("### 🧠 모델 로드")
+        st.dataframe(pd.DataFrame(model_stats).T, use_container_width=True)
+
+    st.download_button(
+        label="📥 계측값 다운로드 (JSON)",
+        data=json.dumps(snapshot, ensure_ascii=False, indent=2, default=float),
+        file_name="metrics.json",
+        mime="application/json"
+    )
+    if st.button("🧹 계측값 초기화"):
+        metrics.reset()
+        st.rerun()
+
+
+if __name__ == "__main__":
+    run_diagnostics()
@@ -1,8 +1,7 @@
 from datetime import datetime, timedelta
 import streamlit as st
 import pandas as pd
-import yfinance as yf
-import plotly.express as px
+from ui.price_service import load_series
 
 def run_home():
     # CSS 스타일링
@@ -58,12 +57,11 @@ def run_home():
     st.markdown('<p class="intro-text">이 앱은 과거 금 가격 데이터를 분석하고, 머신러닝 모델을 통해 미래 금 가격을 예측합니다. 금 가격 예측을 통해 투자 결정을 돕고, 데이터 기반의 시각화를 통해 금 시장의 변동성을 이해할 수 있습니다.</p>', unsafe_allow_html=True)
 
     # 최근 금 가격 데이터 표시
-    @st.cache_data(ttl=3600)  # 1시간마다 데이터 갱신
     def load_recent_data():
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=14)  # 최근 7일간의 데이터
-        
-        gold_data = yf.download('GLD', start=start_date, end=end_date)
+        # 공유 스냅샷에서 최근 데이터를 읽음 (세션마다 yfinance를 따로 호출하지 않음)
+        start_date = datetime.now() - timedelta(days=14)  # 최근 7일간의 데이터
+        # 압축 시계열에서 최근 구간만 뷰로 잘라 화면에 보낼 행만 pandas로 변환
+        gold_data = load_series('GLD').between(start_date).to_frame(['Close'])
         
         recent_data = gold_data[['Close']].reset_index()
         recent_data.columns = ['Date', 'Price']